@@ -12,6 +12,7 @@ from ravendb.documents.commands.batches import (
     DeleteCompareExchangeCommandData,
 )
 from ravendb.documents.commands.crud import DeleteDocumentCommand, PutDocumentCommand
+from ravendb.documents.commands.stream import StreamResultResponse, StreamResult
 from ravendb.documents.indexes.analysis.definitions import AnalyzerDefinition
 from ravendb.documents.indexes.definitions import (
     IndexDeploymentMode,
@@ -158,6 +159,7 @@ from ravendb.documents.queries.more_like_this import (
     MoreLikeThisOptions,
 )
 from ravendb.documents.queries.query import QueryOperator, ProjectionBehavior, QueryData, QueryResult, QueryTimings
+from ravendb.documents.queries.query_shape_cache import QueryShapeCache
 from ravendb.documents.queries.sorting import SorterDefinition
 from ravendb.documents.queries.spatial import (
     SpatialCriteriaFactory,
@@ -176,8 +178,10 @@ from ravendb.documents.queries.suggestions import (
     SuggestionResult,
     SuggestionSortMode,
 )
+from ravendb.documents.session.async_document_session import AsyncDocumentQuery, AsyncDocumentSession
 from ravendb.documents.session.cluster_transaction_operation import ClusterTransactionOperations
 from ravendb.documents.session.document_info import DocumentInfo
+from ravendb.documents.session.change_tracking import ChangeTrackedEntity
 from ravendb.documents.session.document_session import DocumentSession
 from ravendb.documents.session.entity_to_json import EntityToJson
 from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
@@ -210,14 +214,18 @@ from ravendb.documents.session.operations.lazy import (
     LazySuggestionQueryOperation,
     LazyConditionalLoadOperation,
 )
+from ravendb.documents.session.operations.load_batcher import AsyncLoadBatcher, LoadBatcher
 from ravendb.documents.session.operations.load_operation import LoadOperation
 from ravendb.documents.session.operations.operations import LoadStartingWithOperation, MultiGetOperation
 from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.operations.stream import StreamOperation
 from ravendb.documents.session.query import (
     AbstractDocumentQuery,
     DocumentQuery,
     RawDocumentQuery,
+    PreparedQuery,
     QueryStatistics,
+    StreamQueryStatistics,
     WhereParams,
 )
 from ravendb.documents.session.query_group_by import GroupByDocumentQuery, GroupByField
@@ -227,7 +235,16 @@ from ravendb.documents.store.definition import DocumentStore, DocumentStoreBase
 from ravendb.documents.store.lazy import Lazy
 from ravendb.documents.session.conditional_load import ConditionalLoadResult
 from ravendb.documents.store.misc import IdTypeAndName
-from ravendb.http.misc import AggressiveCacheOptions, Broadcast, LoadBalanceBehavior, ReadBalanceBehavior
+from ravendb.http.misc import (
+    AggressiveCacheOptions,
+    Broadcast,
+    LoadBalanceBehavior,
+    ReadBalanceBehavior,
+    HttpCompressionAlgorithm,
+)
+from ravendb.http.async_request_executor import AsyncRequestExecutor
+from ravendb.http.connection_pool import HttpPoolStatistics
+from ravendb.http.metrics import LatencyHistogram, OpenTelemetryRequestMetrics, RequestMetrics
 from ravendb.http.raven_command import RavenCommand
 from ravendb.http.request_executor import ClusterRequestExecutor, RequestExecutor
 from ravendb.http.server_node import ServerNode
@@ -240,6 +257,7 @@ from ravendb.http.topology import (
     Topology,
     UpdateTopologyParameters,
 )
+from ravendb.http.topology_local_cache import DatabaseTopologyLocalCache
 
 # StatusCode
 # UriUtility
@@ -356,8 +374,6 @@ from ravendb.documents.identity.hilo import (
 # GetConflictsCommand
 # PutAttachmentCommandHelper
 # SetupDocumentBase
-# StreamResultResponse
-# StreamResult
 # GetRevisionOperation
 # GetRevisionsCountOperation
 # IEagerSessionOperations
@@ -366,7 +382,6 @@ from ravendb.documents.identity.hilo import (
 # LazyGetCompareExchangeValuesOperation
 # LazyRevisionOperation
 # LazyRevisionOperations
-# StreamOperation
 # ConfigureRevisionsOperation
 # GetRevisionsOperation
 # RevisionsResult
@@ -475,7 +490,6 @@ from ravendb.documents.identity.hilo import (
 # IQueryBase
 # QueryEvents
 # QueryOptions
-# StreamQueryStatistics
 # SessionEvents
 # ILazyClusterTransactionOperations
 # ISessionDocumentAppendTimeSeriesBase
@@ -520,9 +534,6 @@ from ravendb.documents.identity.hilo import (
 # TypedTimeSeriesRollupEntry
 # TimeSeriesOperations
 
-# todo: Batch
-# StreamResult
-
 # todo: Counters
 # CounterBatch
 # GetCountersOperation
@@ -50,6 +50,7 @@ class DatabaseChanges:
         self._on_close = on_close
         self.on_error = on_error
         self._observables_by_group: Dict[str, Dict[str, Observable[DatabaseChange]]] = {}
+        self._observables_lock = Lock()
 
         self._executor = executor if executor else ThreadPoolExecutor(max_workers=10)
         self._worker = self._executor.submit(self.do_work)
@@ -73,9 +74,8 @@ class DatabaseChanges:
         else:
             self.client_websocket.connect(url)
 
-        for observables_by_name in self._observables_by_group.values():
-            for observer in observables_by_name.values():
-                observer.set(self._executor.submit(observer.on_connect))
+        for observer in self.__observables():
+            observer.set(self._executor.submit(observer.on_connect))
         self._immediate_connection = 1
 
     def _get_server_certificate(self) -> Optional[str]:
@@ -151,10 +151,16 @@ class DatabaseChanges:
                     with self._confirmations_lock:
                         future = self._confirmations.pop(command_id)
                         future.set_result("done complete future")
+                elif response_type == "TopologyChange":
+                    # the server pushes these to every connection, refresh right away instead of on the next timer
+                    topology_change = TopologyChange.from_json(response.get("Value", None))
+                    self._request_executor.on_topology_change_notification(
+                        topology_change.url, topology_change.database
+                    )
                 else:
                     change_json_dict: Optional[Dict[str, Any]] = response.get("Value", None)
                     self._notify_subscribers(
-                        response_type, change_json_dict, copy.copy(self._observables_by_group[response_type])
+                        response_type, change_json_dict, copy.copy(self._observables_by_group.get(response_type, {}))
                     )
             except Exception as e:
                 self.notify_about_error(e)
@@ -184,9 +190,8 @@ class DatabaseChanges:
         self._closed = True
         self.client_websocket.close()
 
-        for observable in self._observables_by_group.values():
-            for observer in observable.values():
-                observer.close()
+        for observer in self.__observables():
+            observer.close()
 
         with self._confirmations_lock:
             for confirmation in self._confirmations.values():
@@ -202,9 +207,13 @@ class DatabaseChanges:
         if self.on_error:
             self.on_error(e)
 
-        for _, observables in self._observables_by_group.items():
-            for observer in observables.values():
-                observer.error(e)
+        for observer in self.__observables():
+            observer.error(e)
+
+    def __observables(self) -> List[Observable]:
+        # observables are removed by the executor threads once their last subscriber leaves
+        with self._observables_lock:
+            return [observable for group in self._observables_by_group.values() for observable in group.values()]
 
     def for_all_documents(self) -> Observable[DocumentChange]:
         observable = self.get_or_add_observable("DocumentChange", "all-docs", "watch-docs", "unwatch-docs")(
@@ -214,7 +223,7 @@ class DatabaseChanges:
 
     def for_all_operations(self) -> Observable[OperationStatusChange]:
         observable = self.get_or_add_observable(
-            "OperationsStatusChange",
+            "OperationStatusChange",
             "all-operations",
             "watch-operations",
             "unwatch-operations",
@@ -239,12 +248,12 @@ class DatabaseChanges:
 
     def for_operation_id(self, operation_id: int) -> Observable[OperationStatusChange]:
         observable = self.get_or_add_observable(
-            "OperationsStatusChange",
+            "OperationStatusChange",
             "operations/" + str(operation_id),
             "watch-operation",
             "unwatch-operation",
             str(operation_id),
-        )(lambda x: x.operation_id == str(operation_id))
+        )(lambda x: str(x.operation_id) == str(operation_id))
         return observable
 
     def for_document(self, doc_id: str) -> Observable[DocumentChange]:
@@ -382,6 +391,20 @@ class DatabaseChanges:
         unwatch_command: str,
         resource_name: Optional[str] = None,
         resources_names: Optional[List[str]] = None,
+    ):
+        with self._observables_lock:
+            return self.__get_or_add_observable(
+                group, name, watch_command, unwatch_command, resource_name, resources_names
+            )
+
+    def __get_or_add_observable(
+        self,
+        group: str,
+        name: str,
+        watch_command: str,
+        unwatch_command: str,
+        resource_name: Optional[str],
+        resources_names: Optional[List[str]],
     ):
         if group not in self._observables_by_group:
             self._observables_by_group[group] = {}
@@ -389,6 +412,11 @@ class DatabaseChanges:
         if name not in self._observables_by_group[group]:
 
             def on_disconnect():
+                # the last subscriber left - forget the observable, or it would be watched again on every reconnect
+                with self._observables_lock:
+                    observables = self._observables_by_group.get(group, {})
+                    if observables.get(name, None) is observable:
+                        del observables[name]
                 try:
                     if self.client_websocket.connected:
                         self.send(unwatch_command, resource_name, resources_names)
@@ -32,7 +32,7 @@ class Observable(Generic[_T_Change]):
     def on_document_change_notification(self, value: _T_Change):
         try:
             if self._filter(value):
-                for subscriber in self._subscribers:
+                for subscriber in list(self._subscribers):
                     subscriber.on_next(value)
         except Exception as e:
             self.error(e)
@@ -88,7 +88,7 @@ class Observable(Generic[_T_Change]):
                     if f.cancelled():
                         self._future_set.cancel()
                     elif f.exception():
-                        self._future_set.set_exception(f.exception)
+                        self._future_set.set_exception(f.exception())
                     else:
                         self._future_set.set_result(None)
                 except Exception:
@@ -102,7 +102,7 @@ class Observable(Generic[_T_Change]):
         self.set(future)
         future.set_exception(exception)
         self.last_exception = exception
-        for subscriber in self._subscribers:
+        for subscriber in list(self._subscribers):
             subscriber.on_error(exception)
 
     def close(self):
@@ -113,13 +113,19 @@ class Observable(Generic[_T_Change]):
         for subscriber in self._subscribers:
             subscriber.on_completed()
 
+    @property
+    def subscribed(self) -> bool:
+        # the watch command was sent over a connected websocket
+        return self._future_set.done() and not self._future_set.cancelled() and self._future_set.exception() is None
+
     def ensure_subscribe_now(self):
         self._future.result() if self._future else self._future_set.result()
 
     def send(self, msg: _T_Change):
         try:
             if self._filter(msg):
-                for subscriber in self._subscribers:
+                # subscribers may unsubscribe while being notified
+                for subscriber in list(self._subscribers):
                     subscriber.on_next(msg)
         except Exception as e:
             self.error(e)
@@ -3,14 +3,13 @@ from __future__ import annotations
 from datetime import datetime
 from abc import ABC
 
-import _queue
 import concurrent
 import json
-from concurrent.futures import Future
-from copy import deepcopy
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Queue
-from threading import Lock, Semaphore
-from typing import Optional, TYPE_CHECKING, List, TypeVar, Type, Generic, Callable
+from threading import Lock
+from typing import Optional, TYPE_CHECKING, List, TypeVar, Type, Generic, Callable, Any
 
 import requests
 
@@ -22,6 +21,7 @@ from ravendb.documents.session.time_series import (
 from ravendb.documents.time_series import TimeSeriesOperations
 from ravendb.primitives import constants
 from ravendb.exceptions.raven_exceptions import RavenException
+from ravendb.http.misc import HttpCompressionAlgorithm
 from ravendb.http.server_node import ServerNode
 from ravendb.http.raven_command import RavenCommand
 from ravendb.documents.operations.misc import GetOperationStateOperation
@@ -40,37 +40,85 @@ if TYPE_CHECKING:
 
 _T_TS_Bindable = TypeVar("_T_TS_Bindable", bound=ITimeSeriesValuesBindable)
 
+_JSON_SEPARATORS = (",", ":")
+
+
+def _create_compressor(algorithm: HttpCompressionAlgorithm) -> Any:
+    if algorithm == HttpCompressionAlgorithm.GZIP:
+        return zlib.compressobj(zlib.Z_BEST_SPEED, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    if algorithm == HttpCompressionAlgorithm.ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("Zstd compression requires the 'zstandard' package to be installed")
+        return zstandard.ZstdCompressor().compressobj()
+    raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+
 
 class BulkInsertOperation:
+    _BUFFERS_COUNT = 4
+
     class _BufferExposer:
-        def __init__(self):
+        def __init__(self, buffers_count: int, buffer_size: int):
             self._ongoing_operation = Future()  # todo: is there any reason to use Futures? (look at error handling)
-            self._yield_buffer_semaphore = Semaphore(1)
             self._buffers_to_flush_queue = Queue()
+            self._free_buffers_queue = Queue()
+            for _ in range(buffers_count):
+                self._free_buffers_queue.put(bytearray(buffer_size))
+            self._waiting_for_data = False
             self.output_stream_mock = Future()
 
-        def enqueue_buffer_for_flush(self, buffer: bytearray):
-            self._buffers_to_flush_queue.put(bytes(buffer))
+        def take_free_buffer(self) -> bytearray:
+            buffer = self._free_buffers_queue.get()
+            if buffer is None:
+                self._free_buffers_queue.put(None)  # wake up other writers as well
+                raise RuntimeError("Bulk insert stream is closed")
+            return buffer
+
+        def enqueue_buffer_for_flush(self, buffer: bytearray, size: int) -> None:
+            self._waiting_for_data = False
+            self._buffers_to_flush_queue.put((buffer, size))
+
+        def is_waiting_for_data(self) -> bool:
+            return self._waiting_for_data and self._buffers_to_flush_queue.empty()
 
-        # todo: blocking semaphore acquired and released on enter and exit from bulk insert operation context manager
-        def send_data(self):
+        def send_data(self, compressor: Optional[Any] = None):
             while True:
+                self._waiting_for_data = True
+                item = self._buffers_to_flush_queue.get()
+                if item is None:
+                    break
+
+                buffer, size = item
+                view = memoryview(buffer)[:size]
                 try:
-                    buffer_to_flush = self._buffers_to_flush_queue.get(timeout=0.05)  # todo: adjust this pooling time
-                    yield buffer_to_flush
-                except Exception as e:
-                    if not isinstance(e, _queue.Empty) or self.is_operation_finished():
-                        break
-                    continue  # expected Empty exception coming from queue, operation isn't finished yet
+                    # urllib3 < 2 accepts only bytes chunks, either way the buffer can be reused right away
+                    data = bytes(view) if compressor is None else compressor.compress(view)
+                finally:
+                    self._release_buffer(buffer, view)
+                if data:
+                    yield data
+
+            if compressor is not None:
+                yield compressor.flush()
+
+        def _release_buffer(self, buffer: bytearray, view: memoryview) -> None:
+            view.release()
+            self._free_buffers_queue.put(buffer)
+
+        def close(self) -> None:
+            self._free_buffers_queue.put(None)
 
         def is_operation_finished(self) -> bool:
             return self._ongoing_operation.done()
 
         def finish_operation(self):
             self._ongoing_operation.set_result(None)
+            self._buffers_to_flush_queue.put(None)
 
         def error_on_processing_request(self, exception: Exception):
             self._ongoing_operation.set_exception(exception)
+            self._buffers_to_flush_queue.put(None)
 
         def error_on_request_start(self, exception: Exception):
             self.output_stream_mock.set_exception(exception)
@@ -88,14 +136,22 @@ class BulkInsertOperation:
             self._key = key
             self._selected_node_tag = node_tag
             self.use_compression = False
+            self.compression_algorithm = HttpCompressionAlgorithm.GZIP
             self._skip_overwrite_if_unchanged = skip_overwrite_if_unchanged
 
         def create_request(self, node: ServerNode) -> requests.Request:
+            headers = {}
+            compressor = None
+            if self.use_compression:
+                headers[constants.Headers.CONTENT_ENCODING] = str(self.compression_algorithm)
+                compressor = _create_compressor(self.compression_algorithm)
+
             return requests.Request(
                 "POST",
                 f"{node.url}/databases/{node.database}/bulk_insert?id={self._key}"
                 f"&skipOverwriteIfUnchanged={'true' if self._skip_overwrite_if_unchanged else 'false'}",
-                data=self._buffer_exposer.send_data(),
+                headers=headers,
+                data=self._buffer_exposer.send_data(compressor),
             )
 
         def set_response(self, response: Optional[str], from_cache: bool) -> None:
@@ -110,14 +166,18 @@ class BulkInsertOperation:
             except Exception as e:
                 self._buffer_exposer.error_on_request_start(e)
 
-    def __init__(self, database: str = None, store: "DocumentStore" = None, options: BulkInsertOptions = None):
-        self.use_compression = False
-
+    def __init__(
+        self,
+        database: str = None,
+        store: "DocumentStore" = None,
+        options: BulkInsertOptions = None,
+        node_tag: Optional[str] = None,
+    ):
         self._ongoing_bulk_insert_execute_task: Optional[Future] = None
         self._first = True
         self._in_progress_command: Optional[CommandType] = None
         self._operation_id = -1
-        self._node_tag = None
+        self._node_tag = node_tag
         self._concurrent_check_flag = 0
         self._concurrent_check_lock = Lock()
 
@@ -126,19 +186,21 @@ class BulkInsertOperation:
         if not database or database.isspace():
             self._throw_no_database()
 
-        self._use_compression = options.use_compression if options else False
         self._options = options or BulkInsertOptions()
+        self.use_compression = bool(self._options.use_compression)
+        if self.use_compression:
+            _create_compressor(self._conventions.http_compression_algorithm)  # fail fast if it isn't available
         self._request_executor = store.get_request_executor(database)
 
-        self._enqueue_current_buffer_async = Future()
-        self._enqueue_current_buffer_async.set_result(None)
-
         self._max_size_in_buffer = 1024 * 1024
-
-        self._current_data_buffer = bytearray()
+        # compressors hold small chunks back anyway, compressed streams are flushed in bigger pieces
+        self._min_size_to_flush_when_idle = 64 * 1024 if self.use_compression else 1
 
         self._time_series_batch_size = self._conventions.time_series_batch_size
-        self._buffer_exposer = BulkInsertOperation._BufferExposer()
+        self._buffer_exposer = BulkInsertOperation._BufferExposer(self._BUFFERS_COUNT, self._max_size_in_buffer)
+
+        self._current_data_buffer = self._buffer_exposer.take_free_buffer()
+        self._current_data_size = 0
 
         self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
             self._request_executor.conventions,
@@ -160,12 +222,10 @@ class BulkInsertOperation:
             return
 
         # process the leftovers and finish the stream
-        if self._current_data_buffer:
+        if self._ongoing_bulk_insert_execute_task is not None:
             try:
                 self._write_string_no_escape("]")
-                self._enqueue_current_buffer_async.result()  # wait for enqueue
-                buffer = self._current_data_buffer
-                self._buffer_exposer.enqueue_buffer_for_flush(buffer)
+                self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer, self._current_data_size)
             except Exception as e:
                 flush_ex = e
 
@@ -204,7 +264,7 @@ class BulkInsertOperation:
         if self._operation_id != -1:
             return
 
-        bulk_insert_get_id_request = GetNextOperationIdCommand()
+        bulk_insert_get_id_request = GetNextOperationIdCommand(self._node_tag)
         self._request_executor.execute_command(bulk_insert_get_id_request)
         self._operation_id = bulk_insert_get_id_request.result
         self._node_tag = bulk_insert_get_id_request.node_tag
@@ -244,21 +304,10 @@ class BulkInsertOperation:
             self._end_previous_command_if_needed()  # counters & time series commands shall end before pushing docs
 
             try:
-                if not self._first:
-                    self._write_comma()
-
-                self._first = False
                 self._in_progress_command = CommandType.NONE
 
-                self._write_string_no_escape('{"Id":"')
-                self._write_string(key)
-                self._write_string_no_escape('","Type":"PUT","Document":')
-
+                self._write_document(key, entity, metadata)
                 self._flush_if_needed()
-
-                self._write_document(entity, metadata)
-                self._write_string_no_escape("}")
-                # todo: self._flush_if_needed() - causes error - https://issues.hibernatingrhinos.com/issue/RDBC-701
             except Exception as e:
                 self._handle_errors(key, e)
         finally:
@@ -286,18 +335,17 @@ class BulkInsertOperation:
         return __return_func
 
     def _flush_if_needed(self) -> None:
-        if len(self._current_data_buffer) > self._max_size_in_buffer or self._enqueue_current_buffer_async.done():
-            self._enqueue_current_buffer_async.result()  # wait
-
-            buffer = deepcopy(self._current_data_buffer)
-            self._current_data_buffer.clear()
-
-            # todo: check if it's better to create a new bytearray of max size instead of clearing it (possible dealloc)
-
-            def __enqueue_buffer_for_flush(flushed_buffer: bytearray):
-                self._buffer_exposer.enqueue_buffer_for_flush(flushed_buffer)
+        # flush full buffers, or whatever we have when the request thread is starving for data
+        if self._current_data_size > self._max_size_in_buffer or (
+            self._current_data_size >= self._min_size_to_flush_when_idle and self._buffer_exposer.is_waiting_for_data()
+        ):
+            self._flush()
 
-            self._enqueue_current_buffer_async = self._thread_pool_executor.submit(__enqueue_buffer_for_flush, buffer)
+    def _flush(self) -> None:
+        # hand the buffer over to the request thread as it is and continue writing to a free one from the pool
+        self._buffer_exposer.enqueue_buffer_for_flush(self._current_data_buffer, self._current_data_size)
+        self._current_data_buffer = self._buffer_exposer.take_free_buffer()
+        self._current_data_size = 0
 
     def _end_previous_command_if_needed(self) -> None:
         if self._in_progress_command == CommandType.COUNTERS:
@@ -305,25 +353,27 @@ class BulkInsertOperation:
         elif self._in_progress_command == CommandType.TIME_SERIES:
             self.TimeSeriesBulkInsert._throw_already_running_time_series()
 
-    def _write_string(self, input_string: str) -> None:
-        for i in range(len(input_string)):
-            c = input_string[i]
-            if '"' == c:
-                if i == 0 or input_string[i - 1] != "\\":
-                    self._current_data_buffer += bytearray("\\", encoding="utf-8")
-
-            self._current_data_buffer += bytearray(c, encoding="utf-8")
+    def _write_bytes(self, data: bytes) -> None:
+        # the pooled buffer is preallocated, assigning past its end grows it
+        end = self._current_data_size + len(data)
+        self._current_data_buffer[self._current_data_size : end] = data
+        self._current_data_size = end
 
     def _write_comma(self) -> None:
-        self._current_data_buffer += bytearray(",", encoding="utf-8")
+        self._write_bytes(b",")
 
     def _write_string_no_escape(self, data: str) -> None:
-        self._current_data_buffer += bytearray(data, encoding="utf-8")
+        self._write_bytes(data.encode("utf-8"))
+
+    def _write_command(self, command: dict) -> None:
+        data = json.dumps(command, separators=_JSON_SEPARATORS)
+        self._write_string_no_escape(data if self._first else "," + data)
+        self._first = False
 
-    def _write_document(self, entity: object, metadata: MetadataAsDictionary):
+    def _write_document(self, key: str, entity: object, metadata: MetadataAsDictionary):
         document_info = DocumentInfo(metadata_instance=metadata)
         json_dict = EntityToJsonStatic.convert_entity_to_json(entity, self._conventions, document_info, True)
-        self._current_data_buffer += bytearray(json.dumps(json_dict), encoding="utf-8")
+        self._write_command({"Id": key, "Type": "PUT", "Document": json_dict})
 
     def _ensure_ongoing_operation(self) -> None:
         if self._ongoing_bulk_insert_execute_task is None:
@@ -366,6 +416,7 @@ class BulkInsertOperation:
                 self._operation_id, self._buffer_exposer, self._node_tag, self._options.skip_overwrite_if_unchanged
             )
             bulk_command.use_compression = self.use_compression
+            bulk_command.compression_algorithm = self._conventions.http_compression_algorithm
 
             def __execute_bulk_insert_raven_command():
                 self._request_executor.execute_command(bulk_command)
@@ -373,6 +424,8 @@ class BulkInsertOperation:
             self._ongoing_bulk_insert_execute_task = self._thread_pool_executor.submit(
                 __execute_bulk_insert_raven_command
             )
+            # writers waiting for a free buffer mustn't hang once the request is over
+            self._ongoing_bulk_insert_execute_task.add_done_callback(lambda _: self._buffer_exposer.close())
 
             try:
                 self._buffer_exposer.output_stream_mock.result(timeout=0.01)
@@ -380,7 +433,7 @@ class BulkInsertOperation:
                 if not isinstance(e, concurrent.futures._base.TimeoutError):
                     raise e
 
-            self._current_data_buffer += bytearray("[", encoding="utf-8")
+            self._write_bytes(b"[")
 
         except Exception as e:
             raise RavenException("Unable to open bulk insert stream", e)
@@ -434,6 +487,7 @@ class BulkInsertOperation:
                     if self._first:
                         if not self._operation._first:
                             self._operation._write_comma()
+                        self._operation._first = False
                         self._write_prefix_for_new_command()
                     elif self._time_series_in_batch >= self._operation._time_series_batch_size:
                         self._operation._write_string_no_escape("]}},")
@@ -441,34 +495,14 @@ class BulkInsertOperation:
 
                     self._time_series_in_batch += 1
 
-                    if not self._first:
-                        self._operation._write_comma()
-
-                    self._first = False
-
-                    self._operation._write_string_no_escape("[")
-
-                    self._operation._write_string_no_escape(str(Utils.get_unix_time_in_ms(timestamp)))
-                    self._operation._write_comma()
-
-                    self._operation._write_string_no_escape(str(len(values)))
-                    self._operation._write_comma()
-
-                    first_value = True
-
-                    for value in values:
-                        if not first_value:
-                            self._operation._write_comma()
-
-                        first_value = False
-                        self._operation._write_string_no_escape(str(value) if value is not None else "null")
-
+                    append = [Utils.get_unix_time_in_ms(timestamp), len(values), *values]
                     if tag is not None:
-                        self._operation._write_string_no_escape(',"')
-                        self._operation._write_string(tag)
-                        self._operation._write_string_no_escape('"')
+                        append.append(tag)
 
-                    self._operation._write_string_no_escape("]")
+                    data = json.dumps(append, separators=_JSON_SEPARATORS)
+                    self._operation._write_string_no_escape(data if self._first else "," + data)
+
+                    self._first = False
 
                     self._operation._flush_if_needed()
                 except Exception as e:
@@ -480,11 +514,10 @@ class BulkInsertOperation:
             self._first = True
             self._time_series_in_batch = 0
 
-            self._operation._write_string_no_escape('{"Id":"')
-            self._operation._write_string(self._id)
-            self._operation._write_string_no_escape('","Type":"TimeSeriesBulkInsert","TimeSeries":{"Name":"')
-            self._operation._write_string(self._name)
-            self._operation._write_string_no_escape('","TimeFormat":"UnixTimeInMs","Appends":[')
+            self._operation._write_string_no_escape(
+                f'{{"Id":{json.dumps(self._id)},"Type":"TimeSeriesBulkInsert",'
+                f'"TimeSeries":{{"Name":{json.dumps(self._name)},"TimeFormat":"UnixTimeInMs","Appends":['
+            )
 
         @staticmethod
         def _throw_already_running_time_series():
@@ -549,17 +582,13 @@ class BulkInsertOperation:
 
                     self._counters_in_batch += 1
 
-                    if not self._first:
-                        self._operation._write_comma()
+                    data = json.dumps(
+                        {"Type": "Increment", "CounterName": name, "Delta": delta}, separators=_JSON_SEPARATORS
+                    )
+                    self._operation._write_string_no_escape(data if self._first else "," + data)
 
                     self._first = False
 
-                    self._operation._write_string_no_escape('{"Type":"Increment","CounterName":"')
-                    self._operation._write_string(name)
-                    self._operation._write_string_no_escape('","Delta":')
-                    self._operation._write_string_no_escape(str(delta))
-                    self._operation._write_string_no_escape("}")
-
                     self._operation._flush_if_needed()
 
                 except Exception as e:
@@ -581,11 +610,10 @@ class BulkInsertOperation:
             self._first = True
             self._counters_in_batch = 0
 
-            self._operation._write_string_no_escape('{"Id":"')
-            self._operation._write_string(str(self._id))
-            self._operation._write_string_no_escape('","Type":"Counters","Counters":{"DocumentId":"')
-            self._operation._write_string(str(self._id))
-            self._operation._write_string_no_escape('","Operations":[')
+            key = json.dumps(str(self._id))
+            self._operation._write_string_no_escape(
+                f'{{"Id":{key},"Type":"Counters","Counters":{{"DocumentId":{key},"Operations":['
+            )
 
     class TimeSeriesBulkInsert(TimeSeriesBulkInsertBase):
         def __init__(self, operation: BulkInsertOperation, id_: str, name: str):
@@ -631,25 +659,16 @@ class BulkInsertOperation:
                 raise e
 
             try:
-                if not self.operation._first:
-                    self.operation._write_comma()
-
-                self.operation._write_string_no_escape('{"Id":"')
-                self.operation._write_string(key)
-                self.operation._write_string_no_escape('","Type":"AttachmentPUT","Name":"')
-                self.operation._write_string(name)
-
+                command = {"Id": key, "Type": "AttachmentPUT", "Name": name}
                 if content_type:
-                    self.operation._write_string_no_escape('","ContentType:"')
-                    self.operation._write_string(content_type)
+                    command["ContentType"] = content_type
+                command["ContentLength"] = len(attachment_bytes)
 
-                self.operation._write_string_no_escape('","ContentLength":')
-                self.operation._write_string_no_escape(str(len(attachment_bytes)))
-                self.operation._write_string_no_escape("}")
+                self.operation._write_command(command)
 
                 self.operation._flush_if_needed()
 
-                self.operation._current_data_buffer += bytearray(attachment_bytes)
+                self.operation._write_bytes(attachment_bytes)
 
                 self.operation._flush_if_needed()
 
@@ -696,6 +715,153 @@ class BulkInsertOperation:
         return self.TimeSeriesBulkInsert(self, id_, name)
 
 
+class ParallelBulkInsert:
+    """
+    Spreads documents over several bulk insert streams, each one written by its own thread.
+
+    Documents are assigned to streams by a hash of their id. Streams may target different nodes of the topology.
+    A failure of any stream aborts the others and is raised from subsequent store calls and on exit.
+    """
+
+    _QUEUE_SIZE_PER_STREAM = 1024
+
+    def __init__(
+        self,
+        database: str = None,
+        store: "DocumentStore" = None,
+        options: BulkInsertOptions = None,
+        streams_count: int = 3,
+        node_tags: Optional[List[str]] = None,
+    ):
+        if streams_count < 1:
+            raise ValueError("Streams count must be positive")
+
+        if node_tags is not None and not node_tags:
+            raise ValueError("Node tags cannot be empty")
+
+        self._error: Optional[Exception] = None
+        self._error_lock = Lock()
+
+        self._operations = [
+            BulkInsertOperation(database, store, options, node_tags[i % len(node_tags)] if node_tags else None)
+            for i in range(streams_count)
+        ]
+        self._queues = [Queue(self._QUEUE_SIZE_PER_STREAM) for _ in range(streams_count)]
+
+        request_executor = store.get_request_executor(database)
+        self._generate_entity_id_on_the_client = GenerateEntityIdOnTheClient(
+            request_executor.conventions,
+            lambda entity: request_executor.conventions.generate_document_id(database, entity),
+        )
+
+        self._thread_pool_executor = ThreadPoolExecutor(streams_count)
+        self._workers = [self._thread_pool_executor.submit(self._run_stream, i) for i in range(streams_count)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for queue in self._queues:
+            queue.put(None)
+
+        concurrent.futures.wait(self._workers)
+        self._thread_pool_executor.shutdown()
+
+        if self._error is not None:
+            self._throw_aborted()
+
+    @property
+    def streams_count(self) -> int:
+        return len(self._operations)
+
+    def store(self, entity: object, metadata: Optional[MetadataAsDictionary] = None) -> str:
+        key = (
+            self._get_id(entity)
+            if metadata is None or constants.Documents.Metadata.ID not in metadata
+            else metadata[constants.Documents.Metadata.ID]
+        )
+
+        self.store_as(entity, key, metadata or MetadataAsDictionary())
+        return key
+
+    def store_as(self, entity: object, key: str, metadata: Optional[MetadataAsDictionary] = None) -> None:
+        if self._error is not None:
+            self._throw_aborted()
+
+        BulkInsertOperation._verify_valid_key(key)
+
+        shard = zlib.crc32(key.lower().encode("utf-8")) % len(self._queues)
+        self._queues[shard].put((entity, key, metadata or MetadataAsDictionary()))
+
+    def abort(self) -> None:
+        self._set_error(BulkInsertAbortedException("Parallel bulk insert was aborted"))
+
+        errors = []
+        for operation in self._operations:
+            try:
+                operation.abort()
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+    def _run_stream(self, index: int) -> None:
+        operation = self._operations[index]
+        queue = self._queues[index]
+
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+
+            if self._error is not None:
+                continue  # keep draining, so the producer never blocks on a full queue
+
+            try:
+                operation.store_as(*item)
+            except Exception as e:
+                self._on_stream_failed(e)
+
+        try:
+            operation.__exit__(None, None, None)
+        except Exception as e:
+            self._set_error(e)
+
+    def _on_stream_failed(self, error: Exception) -> None:
+        if not self._set_error(error):
+            return
+
+        # a single failed stream fails the whole bulk insert
+        for operation in self._operations:
+            try:
+                operation.abort()
+            except Exception:
+                pass  # the failure is reported already
+
+    def _set_error(self, error: Exception) -> bool:
+        with self._error_lock:
+            if self._error is not None:
+                return False
+            self._error = error
+            return True
+
+    def _throw_aborted(self) -> None:
+        if isinstance(self._error, BulkInsertAbortedException):
+            raise self._error
+        raise BulkInsertAbortedException("Failed to execute parallel bulk insert", self._error)
+
+    def _get_id(self, entity: object) -> str:
+        success, key = self._generate_entity_id_on_the_client.try_get_id_from_instance(entity)
+        if success:
+            return key
+
+        key = self._generate_entity_id_on_the_client.generate_document_key_for_storage(entity)
+
+        self._generate_entity_id_on_the_client.try_set_identity(entity, key)
+        return key
+
+
 class BulkInsertOptions:
     def __init__(self, use_compression: bool = None, skip_overwrite_if_unchanged: bool = None):
         self.use_compression = use_compression
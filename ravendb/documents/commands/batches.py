@@ -130,7 +130,6 @@ class SingleNodeBatchCommand(RavenCommand):
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
-    @property
     def is_read_request(self):
         return False
 
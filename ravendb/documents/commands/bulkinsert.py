@@ -8,9 +8,10 @@ from ravendb.http.raven_command import RavenCommand, VoidRavenCommand
 
 
 class GetNextOperationIdCommand(RavenCommand[int]):
-    def __init__(self):
+    def __init__(self, node_tag: Optional[str] = None):
         super(GetNextOperationIdCommand, self).__init__(int)
         self._node_tag = 0
+        self._selected_node_tag = node_tag
 
     @property
     def node_tag(self):
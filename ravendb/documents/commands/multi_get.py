@@ -64,7 +64,7 @@ class GetResponse:
 class Cached:
     def __init__(self, size: int):
         self.__size = size
-        self.values: Union[None, List[Tuple[ReleaseCacheItem, str]]] = None
+        self.values: Union[None, List[Optional[Tuple[ReleaseCacheItem, str]]]] = [None] * size
 
     def __enter__(self):
         return self
@@ -114,6 +114,11 @@ class MultiGetCommand(RavenCommand):
 
     def create_request(self, node: ServerNode) -> Optional[requests.Request]:
         self.__base_url = f"{node.url}/databases/{node.database}"
+
+        if self.__maybe_read_all_from_cache(self.__request_executor.aggressive_caching):
+            self.aggressively_cached = True
+            return None  # aggressively cached
+
         url = self.__base_url + "/multi_get"
         request = requests.Request("POST", url)
 
@@ -137,9 +142,9 @@ class MultiGetCommand(RavenCommand):
 
         read_all_from_cache = options is not None
         track_changes = read_all_from_cache and options.mode == AggressiveCacheMode.TRACK_CHANGES
-        for command in self.__commands:
+        for index, command in enumerate(self.__commands):
             cache_key = self.__get_cache_key(command)[0]
-            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key, "", "")
+            cached_item, change_vector, cached_ref = self.__http_cache.get(cache_key)
             cached_item: ReleaseCacheItem
             if cached_item.item is None:
                 try:
@@ -160,7 +165,7 @@ class MultiGetCommand(RavenCommand):
             if self.__cached is None:
                 self.__cached = Cached(len(self.__commands))
 
-            self.__cached.values[self.__commands.index(command)] = (cached_item, cached_ref)
+            self.__cached.values[index] = (cached_item, cached_ref)
 
         if read_all_from_cache:
             with self.__cached as context:
@@ -248,7 +253,6 @@ class MultiGetCommand(RavenCommand):
 
         return get_response
 
-    @property
     def is_read_request(self) -> bool:
         return False
 
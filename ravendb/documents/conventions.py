@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import threading
+from concurrent.futures import Executor
 from abc import abstractmethod, ABC
 from datetime import timedelta, datetime
 from enum import Enum
@@ -18,6 +19,8 @@ from ravendb.documents.operations.configuration.definitions import (
     ReadBalanceBehavior,
 )
 from ravendb.documents.indexes.definitions import SortOptions
+from ravendb.documents.queries.query_shape_cache import QueryShapeCache
+from ravendb.http.misc import AggressiveCacheMode, HttpCompressionAlgorithm
 from ravendb.tools.utils import Utils
 
 inflect.def_classical["names"] = False
@@ -88,6 +91,55 @@ class DocumentConventions(object):
         self.wait_for_replication_after_save_changes_timeout = timedelta(seconds=15)
         self.wait_for_non_stale_results_timeout = timedelta(seconds=15)
 
+        # Caching
+        self.aggressive_cache_duration = timedelta(days=1)
+        self.aggressive_cache_mode = AggressiveCacheMode.TRACK_CHANGES
+        # concurrent identical read requests share a single request to the server and its response
+        self.coalesce_read_requests = False
+        # RQL text of queries is reused for queries with the same tokens and different parameter values,
+        # for up to this many distinct queries, 0 renders every query
+        self.query_shape_cache_size = 0
+        self._query_shape_cache = QueryShapeCache()
+
+        # Batching
+        # loads by id issued within the window are sent as a single request, None sends each load on its own
+        self.load_batching_window: Optional[timedelta] = None
+        self.max_load_batch_size = 256
+
+        # Materialization
+        # results with more documents than materialization_chunk_size are converted to entities by this executor,
+        # one chunk per task - a ProcessPoolExecutor for classes expensive to build or a ThreadPoolExecutor
+        # on a free-threaded interpreter, None converts them on the calling thread
+        self.materialization_executor: Optional[Executor] = None
+        self.materialization_chunk_size = 1000
+
+        # Compression
+        self.http_compression_algorithm = HttpCompressionAlgorithm.GZIP
+
+        # Connection pooling
+        # connections kept open to each node, with http_pool_block more of them are never opened
+        self.http_pool_size_per_node = 32
+        self.http_pool_block = False
+        # connections idle for longer are closed instead of reused, None keeps them until the server closes them
+        self.http_pool_idle_timeout: Optional[timedelta] = None
+        # connections opened to every topology node right after the first topology update
+        self.http_pool_pre_warm_connections = 0
+
+        # Hedging
+        # read requests not answered within this latency percentile of their command type are also sent
+        # to another node and the first response is used, None disables hedging
+        self.hedged_reads_percentile: Optional[float] = None
+        # never hedge sooner, also protects the cluster from doubling the load when all requests are fast
+        self.hedged_reads_min_delay = timedelta(milliseconds=10)
+
+        # Topology
+        # the topology is refreshed in the background this often (with some jitter), on top of the refreshes
+        # requested by the server, None refreshes it only when requested
+        self.topology_refresh_interval: Optional[timedelta] = timedelta(minutes=5)
+        # directory where the last known topology and client configuration are kept, a starting executor
+        # uses them instead of waiting for the server, None disables the cache
+        self.topology_cache_location: Optional[str] = None
+
         # Balancing
         self._load_balancer_context_seed: Optional[int] = None
         self._load_balance_behavior: Optional[LoadBalanceBehavior] = LoadBalanceBehavior.NONE
@@ -159,6 +211,10 @@ class DocumentConventions(object):
     def max_http_cache_size(self, value: int):
         self._max_http_cache_size = value
 
+    @property
+    def query_shape_cache(self) -> QueryShapeCache:
+        return self._query_shape_cache
+
     @property
     def save_enums_as_integers(self) -> bool:
         return self._save_enums_as_integers
@@ -232,6 +288,7 @@ class DocumentConventions(object):
     @find_identity_property_name.setter
     def find_identity_property_name(self, find_identity_property_name_function: Callable[[Type[Any]], str]):
         self._find_identity_property_name = find_identity_property_name_function
+        self._id_property_name_cache.clear()
 
     @staticmethod
     def json_default(o):
@@ -397,7 +454,25 @@ class DocumentConventions(object):
 
         cloned._read_balance_behavior = self._read_balance_behavior
         cloned._load_balance_behavior = self._load_balance_behavior
-        self._max_http_cache_size = self._max_http_cache_size
+        cloned._max_http_cache_size = self._max_http_cache_size
+        cloned.aggressive_cache_duration = self.aggressive_cache_duration
+        cloned.aggressive_cache_mode = self.aggressive_cache_mode
+        cloned.coalesce_read_requests = self.coalesce_read_requests
+        cloned.query_shape_cache_size = self.query_shape_cache_size
+        cloned._query_shape_cache = self._query_shape_cache
+        cloned.load_batching_window = self.load_batching_window
+        cloned.max_load_batch_size = self.max_load_batch_size
+        cloned.materialization_executor = self.materialization_executor
+        cloned.materialization_chunk_size = self.materialization_chunk_size
+        cloned.hedged_reads_percentile = self.hedged_reads_percentile
+        cloned.hedged_reads_min_delay = self.hedged_reads_min_delay
+        cloned.topology_refresh_interval = self.topology_refresh_interval
+        cloned.topology_cache_location = self.topology_cache_location
+        cloned.http_compression_algorithm = self.http_compression_algorithm
+        cloned.http_pool_size_per_node = self.http_pool_size_per_node
+        cloned.http_pool_block = self.http_pool_block
+        cloned.http_pool_idle_timeout = self.http_pool_idle_timeout
+        cloned.http_pool_pre_warm_connections = self.http_pool_pre_warm_connections
         return cloned
 
     def get_identity_property_name(self, object_type: Type[Any]) -> Optional[str]:
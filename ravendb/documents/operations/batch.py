@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Union, List, Dict, TYPE_CHECKING, Optional
 
 from ravendb.primitives import constants
@@ -143,10 +142,11 @@ class BatchOperation:
             self._apply_metadata_modifications(key, document_info)
 
     def _apply_metadata_modifications(self, key: str, document_info: DocumentInfo):
+        # copy on write - only top level values are replaced, the nested ones are shared with the previous snapshot
         document_info.metadata_instance = None
-        document_info.metadata = deepcopy(document_info.metadata)
+        document_info.metadata = dict(document_info.metadata)
         document_info.metadata[constants.Documents.Metadata.CHANGE_VECTOR] = document_info.change_vector
-        document_copy = deepcopy(document_info.document)
+        document_copy = dict(document_info.document)
         document_copy[constants.Documents.Metadata.KEY] = document_info.metadata
 
         document_info.document = document_copy
@@ -45,10 +45,10 @@ class ClientConfiguration:
             "Disabled": self.disabled,
             "MaxNumberOfRequestsPerSession": self.max_number_of_requests_per_session,
             "ReadBalanceBehavior": (
-                self.read_balance_behavior.value if self.read_balance_behavior else ReadBalanceBehavior.NONE
+                self.read_balance_behavior.value if self.read_balance_behavior else ReadBalanceBehavior.NONE.value
             ),
             "LoadBalanceBehavior": (
-                self.load_balance_behavior.value if self.load_balance_behavior else LoadBalanceBehavior.NONE
+                self.load_balance_behavior.value if self.load_balance_behavior else LoadBalanceBehavior.NONE.value
             ),
             "LoadBalancerContextSeed": self.load_balancer_context_seed,
         }
@@ -52,7 +52,7 @@ class OperationExecutor:
         node = command.selected_node_tag if command.selected_node_tag else command.result.operation_node_tag
         return Operation(
             self._request_executor,
-            lambda: None,
+            lambda: self._store.changes(self._database_name),
             self._request_executor.conventions,
             command.result.operation_id,
             node,
@@ -151,9 +151,7 @@ class MaintenanceOperationExecutor:
         node = command.selected_node_tag if command.selected_node_tag else command.result.operation_node_tag
         return Operation(
             self.request_executor,
-            #  todo : changes
-            #  lambda: self.__store.changes(self.__database_name, node),
-            lambda: None,
+            lambda: self._store.changes(self._database_name),
             self.request_executor.conventions,
             command.result.operation_id,
             node,
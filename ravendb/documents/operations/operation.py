@@ -1,7 +1,9 @@
-# todo: DatabaseChanges class
-import time
+import datetime
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Callable, TYPE_CHECKING, Optional
 
+from ravendb.changes.observers import ActionObserver
 from ravendb.documents.operations.definitions import OperationExceptionResult
 from ravendb.exceptions.exception_dispatcher import ExceptionDispatcher
 from ravendb.http.raven_command import RavenCommand
@@ -10,12 +12,19 @@ from ravendb.tools.utils import Utils
 from ravendb.documents.operations.misc import GetOperationStateOperation
 
 if TYPE_CHECKING:
+    from ravendb.changes.types import OperationStatusChange
     from ravendb.documents.conventions import DocumentConventions
     from ravendb.http.request_executor import RequestExecutor
     from ravendb.changes.database_changes import DatabaseChanges
 
 
 class Operation:
+    # the status is polled with exponential backoff between these intervals,
+    # with the changes subscription active polling is only a safety net and backs off further
+    _MIN_POLL_INTERVAL = datetime.timedelta(milliseconds=50)
+    _MAX_POLL_INTERVAL = datetime.timedelta(seconds=2)
+    _MAX_POLL_INTERVAL_WITH_CHANGES = datetime.timedelta(seconds=15)
+
     def __init__(
         self,
         request_executor: "RequestExecutor",
@@ -25,10 +34,15 @@ class Operation:
         node_tag: str = None,
     ):
         self.__request_executor = request_executor
+        self.__changes = changes
         self.__conventions = conventions
         self.__key = key
         self.node_tag = node_tag
 
+    @property
+    def key(self) -> int:
+        return self.__key
+
     def fetch_operations_status(self) -> dict:
         command = self._get_operation_state_command(self.__conventions, self.__key, self.node_tag)
         self.__request_executor.execute_command(command)
@@ -40,23 +54,127 @@ class Operation:
     ) -> RavenCommand[dict]:
         return GetOperationStateOperation.GetOperationStateCommand(self.__key, node_tag)
 
-    def wait_for_completion(self) -> None:
-        while True:
-            status = self.fetch_operations_status()
-            operation_status = status.get("Status")
+    def wait_for_completion(self, timeout: Optional[datetime.timedelta] = None) -> None:
+        future = self.wait_for_completion_async()
+        try:
+            future.result(timeout.total_seconds() if timeout is not None else None)
+        except FutureTimeoutError:
+            if not future.done():
+                future.cancel()
+                raise TimeoutError(f"The operation {self.__key} did not complete within {timeout}")
+            raise
+
+    def wait_for_completion_async(self) -> Future:
+        """
+        Returns a Future completed when the operation completes, failed when it faults or gets canceled.
+        Doesn't block - the completion is pushed through the changes API and the status is polled
+        in the background with exponential backoff. Cancelling the Future stops waiting.
+        """
+        return _OperationCompletion(self).start()
+
+    def _subscribe_to_changes(self, on_change: Callable[["OperationStatusChange"], None], on_error):
+        if self.__changes is None:
+            return None, None
+
+        changes = self.__changes()
+        if changes is None:
+            return None, None
+
+        observable = changes.for_operation_id(self.__key)
+        return observable, observable.subscribe_with_observer(ActionObserver(on_change, on_error))
+
+    def _complete_from_status(self, status: dict, future: Future) -> bool:
+        operation_status = status.get("Status")
+
+        if operation_status == "Completed":
+            future.set_result(None)
+        elif operation_status == "Canceled":
+            future.set_exception(OperationCancelledException())
+        elif operation_status == "Faulted":
+            result = status.get("Result")
+            exception_result: OperationExceptionResult = Utils.initialize_object(result, OperationExceptionResult, True)
+            schema = ExceptionDispatcher.ExceptionSchema(
+                self.__request_executor.url, exception_result.type, exception_result.message, exception_result.error
+            )
+            future.set_exception(ExceptionDispatcher.get(schema, exception_result.status_code))
+        else:
+            return False
+        return True
+
+
+class _OperationCompletion:
+    def __init__(self, operation: Operation):
+        self._operation = operation
+        self._future = Future()
+        # reentrant - completing the future runs _dispose in the same thread
+        self._lock = threading.RLock()
+        self._poll_interval = Operation._MIN_POLL_INTERVAL.total_seconds()
+        self._timer: Optional[threading.Timer] = None
+        self._observable = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._changes_failed = False
+
+    def start(self) -> Future:
+        try:
+            self._observable, self._unsubscribe = self._operation._subscribe_to_changes(
+                self._on_change, self._on_changes_error
+            )
+        except Exception:
+            self._changes_failed = True  # websockets unavailable, polling only
 
-            if operation_status == "Completed":
+        self._future.add_done_callback(self._dispose)
+        # the operation started before subscribing, it may have completed already - poll right away
+        self._schedule(0)
+        return self._future
+
+    def _on_change(self, change: "OperationStatusChange") -> None:
+        self._complete(change.state)
+
+    def _on_changes_error(self, exception: Exception) -> None:
+        self._changes_failed = True
+
+    def _complete(self, status: dict) -> bool:
+        with self._lock:
+            if self._future.done():
+                return True
+            return self._operation._complete_from_status(status, self._future)
+
+    def _poll(self) -> None:
+        if self._future.done():
+            return
+
+        try:
+            completed = self._complete(self._operation.fetch_operations_status())
+        except Exception as e:
+            with self._lock:
+                if not self._future.done():
+                    self._future.set_exception(e)
+            return
+
+        if not completed:
+            self._schedule(self._poll_interval)
+            self._poll_interval = min(self._poll_interval * 2, self._max_poll_interval())
+
+    def _max_poll_interval(self) -> float:
+        subscribed = self._observable is not None and not self._changes_failed and self._observable.subscribed
+        max_interval = Operation._MAX_POLL_INTERVAL_WITH_CHANGES if subscribed else Operation._MAX_POLL_INTERVAL
+        return max_interval.total_seconds()
+
+    def _schedule(self, delay: float) -> None:
+        with self._lock:
+            if self._future.done():
                 return
-            elif operation_status == "Canceled":
-                raise OperationCancelledException()
-            elif operation_status == "Faulted":
-                result = status.get("Result")
-                exception_result: OperationExceptionResult = Utils.initialize_object(
-                    result, OperationExceptionResult, True
-                )
-                schema = ExceptionDispatcher.ExceptionSchema(
-                    self.__request_executor.url, exception_result.type, exception_result.message, exception_result.error
-                )
-                raise ExceptionDispatcher.get(schema, exception_result.status_code)
-
-            time.sleep(0.5)
+            self._timer = threading.Timer(delay, self._poll)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _dispose(self, future: Future) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+
+        if self._unsubscribe is not None:
+            try:
+                self._unsubscribe()
+            except Exception:
+                pass  # unwatching is best effort, the server drops the watch with the connection anyway
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable
+
+
+class QueryShapeCache:
+    """
+    RQL text of the queries built by the document queries, by the shape of their tokens. Queries differing
+    only in parameter values have the same shape, they skip rendering and send the very same text object,
+    whose hash is calculated just once when computing the query hash.
+
+    The oldest shapes are evicted once the cache holds DocumentConventions.query_shape_cache_size of them.
+    """
+
+    def __init__(self):
+        self._texts: Dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._texts)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_or_render(self, shape: Hashable, render: Callable[[], str], max_size: int) -> str:
+        try:
+            text = self._texts.get(shape, None)
+        except TypeError:
+            # a token holds an unhashable value, such queries are rendered every time
+            self.misses += 1
+            return render()
+
+        if text is not None:
+            self.hits += 1
+            return text
+
+        self.misses += 1
+        text = render()
+        with self._lock:
+            while self._texts and len(self._texts) >= max_size:
+                self._texts.pop(next(iter(self._texts)))
+            self._texts[shape] = text
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._texts.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from typing import (
+    Optional,
+    Union,
+    List,
+    Dict,
+    Type,
+    TypeVar,
+    Generic,
+    Callable,
+    AsyncIterator,
+    Any,
+    TYPE_CHECKING,
+)
+
+from ravendb.documents.commands.stream import StreamResult, StreamResultResponse
+from ravendb.documents.operations.batch import BatchOperation
+from ravendb.documents.queries.misc import Query
+from ravendb.documents.session.loaders.include import IncludeBuilder
+from ravendb.documents.session.operations.load_operation import LoadOperation
+from ravendb.documents.session.operations.stream import StreamOperation
+from ravendb.documents.session.query import AbstractDocumentQuery, StreamQueryStatistics
+from ravendb.primitives.constants import int_max
+
+if TYPE_CHECKING:
+    from ravendb.documents.session.document_session import DocumentSession
+    from ravendb.http.async_request_executor import AsyncRequestExecutor
+
+_T = TypeVar("_T")
+
+
+class AsyncDocumentQuery(Generic[_T]):
+    """
+    Awaitable counterpart of DocumentQuery.
+
+    Query building methods are forwarded to the wrapped DocumentQuery, the ones executing the query are awaitable.
+    """
+
+    def __init__(self, session: AsyncDocumentSession, query: AbstractDocumentQuery[_T]):
+        self._session = session
+        self._query = query
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._query, name)
+        if not callable(attribute):
+            return attribute
+
+        def __forward(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            return self if result is self._query else result
+
+        return __forward
+
+    @property
+    def query(self) -> AbstractDocumentQuery[_T]:
+        return self._query
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return self.__iterate()
+
+    async def __iterate(self) -> AsyncIterator[_T]:
+        for item in await self.to_list():
+            yield item
+
+    async def _execute(self, take: Optional[int] = None) -> None:
+        query = self._query
+        if take is not None and (query._page_size is None or query._page_size > take):
+            query._take(take)
+
+        if query.query_operation is not None:
+            return
+
+        query._query_operation = query.initialize_query_operation()
+        query._query_operation.enter_query_context()
+        command = query._query_operation.create_request()
+        await self._session.request_executor.execute_command(command, self._session.session_info)
+        query._query_operation.set_result(command.result)
+        query.invoke_after_query_executed(query._query_operation.current_query_results)
+
+    async def to_list(self) -> List[_T]:
+        await self._execute()
+        return self._query.query_operation.complete(self._query.query_class)
+
+    async def first(self) -> _T:
+        await self._execute(1)
+        return self._query.query_operation.complete(self._query.query_class)[0]
+
+    async def single(self) -> _T:
+        await self._execute(2)
+        result = self._query.query_operation.complete(self._query.query_class)
+        if len(result) != 1:
+            raise ValueError(f"Expected single result, got: {len(result)} ")
+        return result[0]
+
+    async def count(self) -> int:
+        self._query._take(0)
+        await self._execute()
+        return self._query.query_operation.current_query_results.total_results
+
+    async def get_query_result(self):
+        await self._execute()
+        return self._query.query_operation.current_query_results.create_snapshot()
+
+    async def stream(self, stream_query_stats: Optional[StreamQueryStatistics] = None) -> AsyncIterator[_T]:
+        results = self._session.stream(self._query, stream_query_stats)
+        try:
+            async for result in results:
+                yield result.document
+        finally:
+            await results.aclose()
+
+
+class AsyncDocumentSession:
+    """
+    Session whose operations contacting the server are awaitable.
+
+    Change tracking, identity map, events and conventions are those of the wrapped DocumentSession,
+    requests are executed by the AsyncRequestExecutor sharing the topology and cache of the store.
+    """
+
+    def __init__(self, session: DocumentSession, request_executor: AsyncRequestExecutor):
+        self._session = session
+        self._request_executor = request_executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
+    @property
+    def document_session(self) -> DocumentSession:
+        return self._session
+
+    @property
+    def request_executor(self) -> AsyncRequestExecutor:
+        return self._request_executor
+
+    @property
+    def session_info(self):
+        return self._session.session_info
+
+    @property
+    def advanced(self) -> DocumentSession._Advanced:
+        return self._session.advanced
+
+    def store(self, entity: object, key: Optional[str] = None, change_vector: Optional[str] = None) -> None:
+        self._session.store(entity, key, change_vector)
+
+    def delete(self, key_or_entity: Union[str, object], expected_change_vector: Optional[str] = None) -> None:
+        self._session.delete(key_or_entity, expected_change_vector)
+
+    async def load(
+        self,
+        key_or_keys: Union[List[str], str],
+        object_type: Optional[Type[_T]] = None,
+        includes: Callable[[IncludeBuilder], None] = None,
+    ) -> Union[Dict[str, _T], _T]:
+        if key_or_keys is None:
+            return None
+
+        load_operation = LoadOperation(self._session)
+        load_operation.by_keys([key_or_keys] if isinstance(key_or_keys, str) else key_or_keys)
+
+        if includes is not None:
+            include_builder = IncludeBuilder(self._session.conventions)
+            includes(include_builder)
+
+            load_operation.with_includes(include_builder.documents_to_include or None)
+            if include_builder.is_all_counters:
+                load_operation.with_all_counters()
+            else:
+                load_operation.with_counters(include_builder.counters_to_include or None)
+            load_operation.with_time_series(include_builder.time_series_to_include)
+            load_operation.with_compare_exchange(include_builder.compare_exchange_values_to_include)
+
+        command = load_operation.create_request()
+        if command is not None:
+            if self._session._can_batch_loads():
+                load_batcher = self._session._document_store.get_async_load_batcher(self._session.database_name)
+                await load_batcher.execute(command, self.session_info)
+            else:
+                await self._request_executor.execute_command(command, self.session_info)
+            load_operation.set_result(command.result)
+
+        result = load_operation.get_documents(object_type)
+        if includes is not None:
+            return result.popitem()[1] if len(result) == 1 else result
+        return result.popitem()[1] if len(result) == 1 else result if result else None
+
+    async def save_changes(self) -> None:
+        save_changes_operation = BatchOperation(self._session)
+        command = save_changes_operation.create_request()
+        if command is None:
+            return
+
+        with command:
+            if self._session.no_tracking:
+                raise RuntimeError("Cannot execute save_changes when entity tracking is disabled.")
+
+            await self._request_executor.execute_command(command, self.session_info)
+            self._session.update_session_after_save_changes(command.result)
+            save_changes_operation.set_result(command.result)
+
+    def query(self, source: Optional[Query] = None, object_type: Optional[Type[_T]] = None) -> AsyncDocumentQuery[_T]:
+        return AsyncDocumentQuery(self, self._session.query(source, object_type))
+
+    def query_collection(self, collection_name: str, object_type: Optional[Type[_T]] = None) -> AsyncDocumentQuery[_T]:
+        return AsyncDocumentQuery(self, self._session.query_collection(collection_name, object_type))
+
+    def query_index(self, index_name: str, object_type: Optional[Type[_T]] = None) -> AsyncDocumentQuery[_T]:
+        return AsyncDocumentQuery(self, self._session.query_index(index_name, object_type))
+
+    def query_index_type(self, index_type: Type, object_type: Optional[Type[_T]] = None) -> AsyncDocumentQuery[_T]:
+        return AsyncDocumentQuery(self, self._session.query_index_type(index_type, object_type))
+
+    async def stream(
+        self,
+        query: Union[AsyncDocumentQuery[_T], AbstractDocumentQuery[_T]],
+        stream_query_stats: Optional[StreamQueryStatistics] = None,
+    ) -> AsyncIterator[StreamResult[_T]]:
+        if isinstance(query, AsyncDocumentQuery):
+            query = query.query
+
+        stream_operation = StreamOperation(self._session, stream_query_stats)
+        command = stream_operation.create_query_request(query.index_query)
+        results = await self._execute_stream(stream_operation, command)
+
+        try:
+            async for json_dict in results:
+                query.invoke_after_stream_executed(json_dict)
+                yield self._session.advanced._create_stream_result(
+                    json_dict, query.query_class, query._fields_to_fetch_token, query.is_project_into
+                )
+        finally:
+            # releases the response when the caller stops early
+            await results.aclose()
+
+    async def stream_starting_with(
+        self,
+        object_type: Type[_T],
+        starts_with: str,
+        matches: str = None,
+        start: int = 0,
+        page_size: int = int_max,
+        starting_after: str = None,
+    ) -> AsyncIterator[StreamResult[_T]]:
+        stream_operation = StreamOperation(self._session)
+        command = stream_operation.create_request(starts_with, matches, start, page_size, None, starting_after)
+        results = await self._execute_stream(stream_operation, command)
+
+        try:
+            async for json_dict in results:
+                yield self._session.advanced._create_stream_result(json_dict, object_type, None, False)
+        finally:
+            await results.aclose()
+
+    async def _execute_stream(self, stream_operation: StreamOperation, command) -> AsyncIterator[Dict[str, Any]]:
+        response = await self._request_executor.execute_command(command, self.session_info, stream=True)
+        return await stream_operation.set_result_async(
+            StreamResultResponse(response, response.content) if response is not None else None
+        )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict
+
+# id(entity) -> weak reference of entities which weren't modified since the session last saw their document
+_unmodified_entities: Dict[int, weakref.ref] = {}
+
+
+class ChangeTrackedEntity:
+    """
+    Opt-in base class for entities that report their own modifications to the session.
+
+    By default the session finds modified entities by converting every tracked entity to JSON and comparing it
+    with the document it was loaded from. Unmodified ChangeTrackedEntity instances are skipped in has_changes,
+    what_changed and save_changes without being converted at all.
+
+    Assigning or deleting an attribute marks the entity as modified. In-place changes of nested values
+    (e.g. appending to a list or setting an attribute of a nested object) can't be detected,
+    call mark_as_modified() after making them.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _unmodified_entities.pop(id(self), None)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        _unmodified_entities.pop(id(self), None)
+        super().__delattr__(name)
+
+    def mark_as_modified(self) -> None:
+        _unmodified_entities.pop(id(self), None)
+
+
+def _is_unmodified(entity: Any) -> bool:
+    if not isinstance(entity, ChangeTrackedEntity):
+        return False
+    reference = _unmodified_entities.get(id(entity), None)
+    return reference is not None and reference() is entity
+
+
+def _mark_as_unmodified(entity: Any) -> None:
+    if not isinstance(entity, ChangeTrackedEntity):
+        return
+
+    key = id(entity)
+
+    def __on_collected(collected_reference: weakref.ref) -> None:
+        # the id may have been reused by another entity in the meantime
+        if _unmodified_entities.get(key, None) is collected_reference:
+            _unmodified_entities.pop(key, None)
+
+    try:
+        _unmodified_entities[key] = weakref.ref(entity, __on_collected)
+    except TypeError:
+        pass  # not weak referenceable, such entity is always compared with its document
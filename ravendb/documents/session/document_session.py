@@ -6,9 +6,25 @@ from datetime import datetime
 import http
 import json
 import os
+import shutil
 import time
 import uuid
-from typing import Union, Callable, TYPE_CHECKING, Optional, Dict, List, Type, TypeVar, Tuple, Generic, Set
+from typing import (
+    Union,
+    Callable,
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    List,
+    Type,
+    TypeVar,
+    Tuple,
+    Generic,
+    Set,
+    Iterator,
+    BinaryIO,
+    Any,
+)
 
 from ravendb.documents.session.document_session_revisions import DocumentSessionRevisions
 from ravendb.primitives import constants
@@ -34,6 +50,7 @@ from ravendb.documents.session.time_series import (
 from ravendb.documents.time_series import TimeSeriesOperations
 from ravendb.exceptions import exceptions
 from ravendb.exceptions.exceptions import InvalidOperationException
+from ravendb.exceptions.documents.indexes import IndexDoesNotExistException
 from ravendb.data.operation import AttachmentType
 from ravendb.documents.indexes.definitions import AbstractCommonApiForIndexes
 from ravendb.documents.operations.attachments import (
@@ -67,7 +84,10 @@ from ravendb.documents.session.misc import (
     SessionInfo,
     TransactionMode,
 )
-from ravendb.documents.session.query import DocumentQuery, RawDocumentQuery
+from ravendb.documents.session.query import DocumentQuery, RawDocumentQuery, StreamQueryStatistics
+from ravendb.documents.session.operations.query import QueryOperation
+from ravendb.documents.session.operations.stream import StreamOperation
+from ravendb.documents.session.tokens.query_tokens.definitions import FieldsToFetchToken
 from ravendb.json.metadata_as_dictionary import MetadataAsDictionary
 from ravendb.documents.session.operations.load_operation import LoadOperation
 from ravendb.tools.time_series import TSRangeHelper
@@ -93,6 +113,7 @@ from ravendb.documents.commands.crud import (
     ConditionalGetDocumentsCommand,
 )
 from ravendb.documents.commands.multi_get import GetRequest
+from ravendb.documents.commands.stream import StreamResult
 
 from ravendb.documents.store.lazy import Lazy
 from ravendb.documents.store.misc import IdTypeAndName
@@ -347,13 +368,23 @@ class DocumentSession(InMemoryDocumentSessionOperations):
 
         return load_operation.get_documents(object_type)
 
+    def _can_batch_loads(self) -> bool:
+        # the load batcher is bound to the store's request executor, sessions opened with their own executor skip it
+        return (
+            self._request_executor.conventions.load_batching_window is not None
+            and self._request_executor is self._document_store.get_request_executor(self.database_name)
+        )
+
     def _load_internal_stream(self, keys: List[str], operation: LoadOperation, stream: Optional[bytes] = None) -> None:
         operation.by_keys(keys)
 
         command = operation.create_request()
 
         if command:
-            self._request_executor.execute_command(command, self.session_info)
+            if self._can_batch_loads():
+                self._document_store.get_load_batcher(self.database_name).execute(command, self.session_info)
+            else:
+                self._request_executor.execute_command(command, self.session_info)
 
             if stream:
                 try:
@@ -1032,24 +1063,86 @@ class DocumentSession(InMemoryDocumentSessionOperations):
 
         def stream(
             self,
-            query_or_raw_query,  # : Union[RawDocumentQuery, DocumentQuery],
-            stream_query_stats,  # : Optional[StreamQueryStatistics] = None,
-        ) -> iter:
-            pass
+            query_or_raw_query: Union[RawDocumentQuery[_T], DocumentQuery[_T]],
+            stream_query_stats: Optional[StreamQueryStatistics] = None,
+        ) -> Iterator[StreamResult[_T]]:
+            stream_operation = StreamOperation(self._session, stream_query_stats)
+            command = stream_operation.create_query_request(query_or_raw_query.index_query)
+
+            self._session._request_executor.execute_command(command, self._session.session_info)
+            results = stream_operation.set_result(command.result)
+
+            return self._yield_results(
+                results,
+                query_or_raw_query.query_class,
+                query_or_raw_query._fields_to_fetch_token,
+                query_or_raw_query.is_project_into,
+                query_or_raw_query.invoke_after_stream_executed,
+            )
 
         def stream_starting_with(
             self,
-            object_type: type,
+            object_type: Type[_T],
             starts_with: str,
             matches: str = None,
             start: int = 0,
-            page_size: int = 25,
+            page_size: int = int_max,
             starting_after: str = None,
-        ) -> iter:
-            pass
+        ) -> Iterator[StreamResult[_T]]:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_request(starts_with, matches, start, page_size, None, starting_after)
+
+            self._session._request_executor.execute_command(command, self._session.session_info)
+            results = stream_operation.set_result(command.result)
+
+            return self._yield_results(results, object_type, None, False, None)
+
+        def stream_into(self, query_or_raw_query: Union[RawDocumentQuery, DocumentQuery], output: BinaryIO) -> None:
+            stream_operation = StreamOperation(self._session)
+            command = stream_operation.create_query_request(query_or_raw_query.index_query)
+
+            self._session._request_executor.execute_command(command, self._session.session_info)
+            if command.result is None:
+                raise IndexDoesNotExistException("The index does not exists, failed to stream results")
+
+            try:
+                shutil.copyfileobj(command.result.stream, output)
+            finally:
+                command.result.close()
+
+        def _yield_results(
+            self,
+            results: Iterator[Dict[str, Any]],
+            object_type: Type[_T],
+            fields_to_fetch: Optional[FieldsToFetchToken],
+            is_project_into: bool,
+            on_next_item: Optional[Callable[[Dict[str, Any]], None]],
+        ) -> Iterator[StreamResult[_T]]:
+            try:
+                for json_dict in results:
+                    if on_next_item is not None:
+                        on_next_item(json_dict)
+                    yield self._create_stream_result(json_dict, object_type, fields_to_fetch, is_project_into)
+            finally:
+                results.close()
+
+        def _create_stream_result(
+            self,
+            json_dict: Dict[str, Any],
+            object_type: Type[_T],
+            fields_to_fetch: Optional[FieldsToFetchToken],
+            is_project_into: bool,
+        ) -> StreamResult[_T]:
+            metadata = json_dict.get(constants.Documents.Metadata.KEY)
+            change_vector = metadata.get(constants.Documents.Metadata.CHANGE_VECTOR)
+            # MapReduce indexes return reduce results that don't have @id property
+            key = metadata.get(constants.Documents.Metadata.ID, None)
+
+            entity = QueryOperation.deserialize(
+                object_type, key, json_dict, metadata, fields_to_fetch, True, self._session, is_project_into
+            )
 
-        def stream_into(self):  # query: Union[DocumentQuery, RawDocumentQuery], output: iter):
-            pass
+            return StreamResult(key, change_vector, MetadataAsDictionary(metadata), entity)
 
         def conditional_load(
             self, key: str, change_vector: str, object_type: Type[_T] = None
@@ -1087,7 +1180,7 @@ class DocumentSession(InMemoryDocumentSessionOperations):
             r = self._session.track_entity_document_info(object_type, document_info)
             return ConditionalLoadResult.create(r, cmd.result.change_vector)
 
-            # todo: stream, query and fors like time_series_rollup_for, conditional load
+            # todo: query and fors like time_series_rollup_for, conditional load
 
         class _Attachment:
             def __init__(self, session: DocumentSession):
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import datetime
 import itertools
-import json
 from abc import abstractmethod
 
 from ravendb.documents.operations.executor import OperationExecutor
@@ -42,6 +41,7 @@ from ravendb.documents.commands.batches import (
     IndexBatchOptions,
     ReplicationBatchOptions,
 )
+from ravendb.documents.session.change_tracking import _is_unmodified, _mark_as_unmodified
 from ravendb.documents.session.cluster_transaction_operation import ClusterTransactionOperationsBase
 from ravendb.documents.session.concurrency_check_mode import ConcurrencyCheckMode
 from ravendb.documents.session.document_info import DocumentInfo
@@ -1086,6 +1086,9 @@ class InMemoryDocumentSessionOperations:
 
             dirty_metadata = _update_metadata_modifications(entity.value.metadata_instance, entity.value.metadata)
 
+            if not dirty_metadata and self.__is_unmodified(entity.value):
+                continue
+
             document = self.entity_to_json.convert_entity_to_json(entity.key, entity.value)
 
             if not self._entity_changed(document, entity.value, None) and not dirty_metadata:
@@ -1163,9 +1166,20 @@ class InMemoryDocumentSessionOperations:
     ) -> bool:
         return JsonOperation.entity_changed(new_obj, document_info, changes)
 
+    @staticmethod
+    def __is_unmodified(document_info: DocumentInfo) -> bool:
+        # ChangeTrackedEntity tells us it wasn't modified, so there's no need to convert it and compare
+        return (
+            document_info.document is not None
+            and _is_unmodified(document_info.entity)
+            and (document_info.metadata_instance is None or not document_info.metadata_instance.is_dirty)
+        )
+
     def has_changes(self) -> bool:
         for entity in self._documents_by_entity:
             entity: DocumentsByEntityHolder.DocumentsByEntityEnumeratorResult
+            if self.__is_unmodified(entity.value):
+                continue
             document = self.entity_to_json.convert_entity_to_json(entity.key, entity.value)
             if self._entity_changed(document, entity.value, None):
                 return True
@@ -1182,7 +1196,9 @@ class InMemoryDocumentSessionOperations:
 
     def __get_all_entities_changes(self, changes: Dict[str, List[DocumentsChanges]]) -> None:
         for key, value in self._documents_by_id.items():
-            _update_metadata_modifications(value.metadata_instance, value.metadata)
+            dirty_metadata = _update_metadata_modifications(value.metadata_instance, value.metadata)
+            if not dirty_metadata and self.__is_unmodified(value):
+                continue
             new_obj = self.entity_to_json.convert_entity_to_json(value.entity, value)
             self._entity_changed(new_obj, value, changes)
 
@@ -1243,11 +1259,11 @@ class InMemoryDocumentSessionOperations:
         if not includes:
             return
 
+        # parsed for this session alone, tracked as they are like the results
         for key, value in includes.items():
             if value is None:
                 continue
-            object_node = json.loads(json.dumps(value))
-            new_document_info = DocumentInfo.get_new_document_info(object_node)
+            new_document_info = DocumentInfo.get_new_document_info(value)
             if JsonExtensions.try_get_conflict(new_document_info.metadata):
                 continue
             self._included_documents_by_id[new_document_info.key] = new_document_info
@@ -1932,6 +1948,7 @@ class InMemoryDocumentSessionOperations:
                     document: dict = document_info_dict_tuple[1]
                     info.new_document = False
                     info.document = document
+                    _mark_as_unmodified(info.entity)
 
                 if self.__clear_deleted_entities:
                     self.__session._deleted_entities.clear()
@@ -1,8 +1,10 @@
 import inspect
+from concurrent.futures import Executor
 from copy import deepcopy
-from typing import Optional, TYPE_CHECKING, Union, Type, TypeVar, Dict, Any, Tuple
+from typing import Optional, TYPE_CHECKING, Union, Type, TypeVar, Dict, Any, Tuple, List
 
 from ravendb.primitives import constants
+from ravendb.documents.session.change_tracking import _mark_as_unmodified
 from ravendb.documents.session.document_info import DocumentInfo
 from ravendb.documents.session.event_args import (
     BeforeConversionToDocumentEventArgs,
@@ -27,6 +29,7 @@ class EntityToJson:
     def __init__(self, session: "InMemoryDocumentSessionOperations"):
         self._session = session
         self._missing_dictionary = dict()
+        self._converted_in_advance: Dict[int, Tuple[Type, object]] = {}
 
     @property
     def missing_dictionary(self):
@@ -65,9 +68,51 @@ class EntityToJson:
     # Converting JSON Dicts to objects
     # ================================
     def convert_to_entity(self, entity_type: Type[_T], key: str, document: dict, track_entity: bool) -> _T:
+        if self._converted_in_advance:
+            converted = self._converted_in_advance.pop(id(document), None)
+            if converted is not None and converted[0] is entity_type:
+                return converted[1]
+
         conventions = self._session.conventions
         return EntityToJsonStatic.convert_to_entity(document, entity_type, conventions, self._session, key)
 
+    def convert_to_entities_in_advance(
+        self, entity_type: Type[_T], documents: List[Tuple[Optional[str], dict]]
+    ) -> bool:
+        """
+        Converts the documents with the materialization executor of the conventions, if there are enough of them.
+        convert_to_entity then returns these entities until clear_converted_in_advance() is called.
+        Documents whose entity is in the session already are skipped, tracking them doesn't convert them again.
+        """
+        conventions = self._session.conventions
+        if conventions.materialization_executor is None or len(documents) <= conventions.materialization_chunk_size:
+            return False
+
+        documents = [(key, document) for key, document in documents if not key or not self.__has_entity(key)]
+        if len(documents) <= conventions.materialization_chunk_size:
+            return False
+
+        entities = EntityToJsonStatic.convert_to_entities(
+            documents,
+            entity_type,
+            conventions,
+            conventions.materialization_executor,
+            conventions.materialization_chunk_size,
+            self._session,
+        )
+        for (key, document), entity in zip(documents, entities):
+            self._converted_in_advance[id(document)] = (entity_type, entity)
+        return True
+
+    def clear_converted_in_advance(self) -> None:
+        self._converted_in_advance.clear()
+
+    def __has_entity(self, key: str) -> bool:
+        document_info = self._session._documents_by_id.get(key)
+        if document_info is None:
+            document_info = self._session._included_documents_by_id.get(key)
+        return document_info is not None and document_info.entity is not None
+
     # Miscellaneous
     # =============
     def populate_entity(self, entity: object, key: str, document: Dict[str, Any]) -> None:
@@ -142,21 +187,55 @@ class EntityToJsonStatic:
         session: Optional["InMemoryDocumentSessionOperations"] = None,
         key: str = None,
     ) -> _T:
+        object_type, is_projection, document_deepcopy = EntityToJsonStatic._prepare_conversion(
+            document, object_type, conventions, session, key
+        )
+        entity = EntityToJsonStatic._build_entity(object_type, is_projection, document_deepcopy)
+        return EntityToJsonStatic._complete_conversion(
+            entity, document, object_type, document_deepcopy, conventions, session, key
+        )
+
+    @staticmethod
+    def convert_to_entities(
+        documents: List[Tuple[Optional[str], Dict[str, Any]]],
+        object_type: Type[_T],
+        conventions: "DocumentConventions",
+        executor: Executor,
+        chunk_size: int,
+        session: Optional["InMemoryDocumentSessionOperations"] = None,
+    ) -> List[_T]:
+        # the entities are built by the executor in chunks, the events are invoked on the calling thread, in order
+        conversions = [
+            EntityToJsonStatic._prepare_conversion(document, object_type, conventions, session, key)
+            for key, document in documents
+        ]
+        chunks = [conversions[i : i + chunk_size] for i in range(0, len(conversions), chunk_size)]
+        entities = [entity for chunk in executor.map(_build_entities, chunks) for entity in chunk]
+
+        return [
+            EntityToJsonStatic._complete_conversion(
+                entity, document, conversion[0], conversion[2], conventions, session, key
+            )
+            for (key, document), conversion, entity in zip(documents, conversions, entities)
+        ]
+
+    @staticmethod
+    def _prepare_conversion(
+        document: Dict[str, Any],
+        object_type: Type[_T],
+        conventions: "DocumentConventions",
+        session: Optional["InMemoryDocumentSessionOperations"],
+        key: Optional[str],
+    ) -> Tuple[Type[_T], bool, Dict[str, Any]]:
         metadata = document.get("@metadata")
-        document_deepcopy = deepcopy(document)
+        document_deepcopy = Utils.copy_json(document)
 
         object_type, is_projection, should_update_metadata_python_type = EntityToJsonUtils.determine_object_type(
             document, conventions, object_type, metadata
         )
 
-        if object_type is dict:
-            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
-            return document_deepcopy
-
-        if object_type is DynamicStructure:
-            dyn = DynamicStructure(**document_deepcopy)
-            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
-            return dyn
+        if object_type is dict or object_type is DynamicStructure:
+            return object_type, is_projection, document_deepcopy
 
         if should_update_metadata_python_type:
             EntityToJsonUtils.set_python_type_in_metadata(metadata, object_type)
@@ -167,31 +246,62 @@ class EntityToJsonStatic:
                 BeforeConversionToEntityEventArgs(session, key, object_type, document_deepcopy)
             )
 
-        # Conversion to entity
+        return object_type, is_projection, document_deepcopy
+
+    @staticmethod
+    def _build_entity(object_type: Type[_T], is_projection: bool, document_deepcopy: Dict[str, Any]) -> _T:
+        # neither the session nor the conventions are used here, entities can be built on other threads or processes
+        if object_type is dict:
+            return document_deepcopy
+
+        if object_type is DynamicStructure:
+            return DynamicStructure(**document_deepcopy)
 
         if "from_json" in object_type.__dict__ and inspect.ismethod(object_type.from_json):
             # By custom defined 'from_json' serializer class method
-            entity = object_type.from_json(document_deepcopy)
-        elif is_projection:
+            return object_type.from_json(document_deepcopy)
+
+        if is_projection:
             entity = DynamicStructure(**document_deepcopy)
             entity.__class__ = object_type
             try:
-                entity = Utils.initialize_object(document_deepcopy, object_type)
+                return Utils.initialize_object(document_deepcopy, object_type)
             except TypeError as e:
                 raise InvalidOperationException("Probably projection error", e)
-        else:
-            entity = Utils.convert_json_dict_to_object(document_deepcopy, object_type)
+
+        return Utils.convert_json_dict_to_object(document_deepcopy, object_type)
+
+    @staticmethod
+    def _complete_conversion(
+        entity: _T,
+        document: Dict[str, Any],
+        object_type: Type[_T],
+        document_deepcopy: Dict[str, Any],
+        conventions: "DocumentConventions",
+        session: Optional["InMemoryDocumentSessionOperations"],
+        key: Optional[str],
+    ) -> _T:
+        if object_type is dict or object_type is DynamicStructure:
+            EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
+            return entity
+
+        # freshly built from the document, changes made by the event handlers still count
+        _mark_as_unmodified(entity)
 
         EntityToJsonUtils.invoke_after_conversion_to_entity_event(session, key, object_type, document_deepcopy)
 
         # Try to set identity property
         identity_property_name = conventions.get_identity_property_name(object_type)
         if identity_property_name in entity.__dict__:
-            entity.__dict__[identity_property_name] = metadata.get("@id", None)
+            entity.__dict__[identity_property_name] = document.get("@metadata").get("@id", None)
 
         return entity
 
 
+def _build_entities(conversions: List[Tuple[Type[_T], bool, Dict[str, Any]]]) -> List[_T]:
+    return [EntityToJsonStatic._build_entity(*conversion) for conversion in conversions]
+
+
 class EntityToJsonUtils:
     @staticmethod
     def invoke_after_conversion_to_entity_event(
@@ -126,6 +126,8 @@ class SessionInfo:
             result = request_executor.get_node_by_session_id(self.session_id)
         elif read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
             result = request_executor.get_fastest_node()
+        elif read_balance_behavior == ReadBalanceBehavior.LEAST_LATENCY:
+            result = request_executor.get_least_latency_node()
         else:
             raise ValueError(f"Unsupported read balance behavior '{str(read_balance_behavior)}'")
 
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from ravendb.documents.commands.crud import GetDocumentsCommand, GetDocumentsResult
+from ravendb.tools.utils import CaseInsensitiveDict, Utils
+
+if TYPE_CHECKING:
+    from ravendb.documents.session import SessionInfo
+    from ravendb.http.async_request_executor import AsyncRequestExecutor
+    from ravendb.http.request_executor import RequestExecutor
+
+
+def _can_batch(command: GetDocumentsCommand, session_info: Optional[SessionInfo]) -> bool:
+    # only loads by ids without includes can be answered from a response shared with other loads
+    if (
+        not command._keys
+        or command._includes
+        or command._counters
+        or command._include_all_counters
+        or command._time_series_includes
+        or command._compare_exchange_value_includes
+        or command._metadata_only
+    ):
+        return False
+
+    # loads which must bypass the cache or wait for a cluster transaction keep their own request
+    return session_info is None or (not session_info.no_caching and not session_info.last_cluster_transaction_index)
+
+
+class _LoadBatch:
+    def __init__(self):
+        self.commands: List[GetDocumentsCommand] = []
+        self.keys: Dict[str, str] = CaseInsensitiveDict()
+
+    def add(self, command: GetDocumentsCommand) -> None:
+        self.commands.append(command)
+        for key in command._keys:
+            self.keys[key] = key
+
+    def create_command(self) -> GetDocumentsCommand:
+        return GetDocumentsCommand.from_multiple_ids(list(self.keys.values()))
+
+    def distribute(self, batch_command: GetDocumentsCommand) -> None:
+        results = batch_command.result.results if batch_command.result else []
+        documents_by_id = CaseInsensitiveDict()
+        for document in results:
+            if document is not None:
+                documents_by_id[document["@metadata"]["@id"]] = document
+
+        handed_out = set()
+        for command in self.commands:
+            command_results = []
+            for key in command._keys:
+                document = documents_by_id.get(key, None)
+                if document is not None:
+                    # sessions own (and may modify) the documents they track, never share one between them
+                    document = Utils.copy_json(document) if id(document) in handed_out else document
+                    handed_out.add(id(document))
+                command_results.append(document)
+
+            command.status_code = batch_command.status_code
+            command.result = GetDocumentsResult(includes={}, results=command_results)
+
+
+class LoadBatcher:
+    """
+    Merges loads by id issued from many threads within DocumentConventions.load_batching_window
+    into a single GetDocumentsCommand, each load gets the documents it asked for.
+
+    The first load of a window waits for the window to pass (or the batch to fill up) and sends the request,
+    the other ones wait for its response. Loads with includes, or bypassing the cache, are sent on their own.
+    """
+
+    def __init__(self, request_executor: RequestExecutor):
+        self._request_executor = request_executor
+        self._lock = threading.Lock()
+        self._batch: Optional[_LoadBatch] = None
+        self._full = threading.Event()
+        self._done: Optional[Future] = None
+
+    def execute(self, command: GetDocumentsCommand, session_info: Optional[SessionInfo] = None) -> None:
+        conventions = self._request_executor.conventions
+        window: Optional[datetime.timedelta] = conventions.load_batching_window
+        if window is None or not _can_batch(command, session_info):
+            self._request_executor.execute_command(command, session_info)
+            return
+
+        with self._lock:
+            leader = self._batch is None
+            if leader:
+                self._batch = _LoadBatch()
+                self._full = threading.Event()
+                self._done = Future()
+            batch, full, done = self._batch, self._full, self._done
+            batch.add(command)
+            if len(batch.keys) >= conventions.max_load_batch_size:
+                self._batch = None
+                full.set()
+
+        if leader:
+            full.wait(window.total_seconds())
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._send(batch, session_info, done)
+
+        done.result()
+
+    def _send(self, batch: _LoadBatch, session_info: Optional[SessionInfo], done: Future) -> None:
+        try:
+            if len(batch.commands) == 1:
+                self._request_executor.execute_command(batch.commands[0], session_info)
+            else:
+                batch_command = batch.create_command()
+                self._request_executor.execute_command(batch_command)
+                batch.distribute(batch_command)
+        except Exception as e:
+            done.set_exception(e)
+        else:
+            done.set_result(None)
+
+
+class AsyncLoadBatcher:
+    """
+    LoadBatcher for coroutines - loads by id awaited on the event loop within DocumentConventions.load_batching_window
+    are sent as a single request. With a zero window the loads started before the loop gets to run the batch are merged.
+    """
+
+    def __init__(self, request_executor: AsyncRequestExecutor):
+        self._request_executor = request_executor
+        self._batch: Optional[_LoadBatch] = None
+        self._full: Optional[asyncio.Event] = None
+        self._done: Optional[asyncio.Future] = None
+
+    async def execute(self, command: GetDocumentsCommand, session_info: Optional[SessionInfo] = None) -> None:
+        conventions = self._request_executor.conventions
+        window: Optional[datetime.timedelta] = conventions.load_batching_window
+        if window is None or not _can_batch(command, session_info):
+            await self._request_executor.execute_command(command, session_info)
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._batch is None or self._done.get_loop() is not loop:
+            self._batch = _LoadBatch()
+            self._full = asyncio.Event()
+            self._done = loop.create_future()
+            # sent by a task of its own, cancelling the load which started the batch doesn't affect the others
+            loop.create_task(self._send(self._batch, self._full, self._done, window, session_info))
+
+        batch, done = self._batch, self._done
+        batch.add(command)
+        if len(batch.keys) >= conventions.max_load_batch_size:
+            self._batch = None
+            self._full.set()
+
+        await asyncio.shield(done)
+
+    async def _send(
+        self,
+        batch: _LoadBatch,
+        full: asyncio.Event,
+        done: asyncio.Future,
+        window: datetime.timedelta,
+        session_info: Optional[SessionInfo],
+    ) -> None:
+        try:
+            await asyncio.wait_for(full.wait(), window.total_seconds())
+        except asyncio.TimeoutError:
+            pass
+
+        if self._batch is batch:
+            self._batch = None
+
+        try:
+            if len(batch.commands) == 1:
+                await self._request_executor.execute_command(batch.commands[0], session_info)
+            else:
+                batch_command = batch.create_command()
+                await self._request_executor.execute_command(batch_command)
+                batch.distribute(batch_command)
+        except Exception as e:
+            done.set_exception(e)
+            # retrieved by the loads waiting for it, don't warn about it if they were all cancelled
+            done.exception()
+        else:
+            done.set_result(None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import logging
+from contextlib import contextmanager
 from typing import Optional, List, TYPE_CHECKING, Type, TypeVar, Set
 
 from ravendb.documents.commands.crud import GetDocumentsCommand, GetDocumentsResult
@@ -153,23 +154,50 @@ class LoadOperation:
             if (not self._results) or not self._results.results:
                 return final_results
 
-            for document in self._results.results:
-                if not document:
-                    continue
-                new_document_info = DocumentInfo.get_new_document_info(document)
-                final_results[new_document_info.key] = self._session.track_entity_document_info(
-                    object_type, new_document_info
-                )
+            documents_info = [
+                DocumentInfo.get_new_document_info(document) for document in self._results.results if document
+            ]
+            with self.__converted_in_advance(object_type, documents_info):
+                for new_document_info in documents_info:
+                    final_results[new_document_info.key] = self._session.track_entity_document_info(
+                        object_type, new_document_info
+                    )
 
             return final_results
 
-        for key in self._keys:
-            if not key:
-                continue
-            final_results[key] = self.__get_document(object_type, key)
+        documents_info = []
+        if self._session.conventions.materialization_executor is not None:
+            for key in self._keys:
+                if key and not self._session.is_deleted(key):
+                    document_info = self._session._documents_by_id.get(key)
+                    if document_info is None:
+                        document_info = self._session._included_documents_by_id.get(key)
+                    if document_info is not None:
+                        documents_info.append(document_info)
+
+        with self.__converted_in_advance(object_type, documents_info):
+            for key in self._keys:
+                if not key:
+                    continue
+                final_results[key] = self.__get_document(object_type, key)
 
         return final_results
 
+    @contextmanager
+    def __converted_in_advance(self, object_type: Type[_T], documents_info: List[DocumentInfo]):
+        # many documents are converted by the materialization executor of the conventions, if there is one
+        entity_to_json = self._session.entity_to_json
+        converted = self._session.conventions.materialization_executor is not None and (
+            entity_to_json.convert_to_entities_in_advance(
+                object_type, [(document_info.key, document_info.document) for document_info in documents_info]
+            )
+        )
+        try:
+            yield
+        finally:
+            if converted:
+                entity_to_json.clear_converted_in_advance()
+
     def set_result(self, result: GetDocumentsResult) -> None:
         self._results_set = True
         if self._session.no_tracking:
@@ -2,7 +2,7 @@ import datetime
 import enum
 import inspect
 import logging
-from typing import Union, Optional, TypeVar, List, Type, Callable, Dict, TYPE_CHECKING
+from typing import Union, Optional, TypeVar, List, Type, Callable, Dict, Tuple, Any, TYPE_CHECKING
 
 from ravendb.primitives import constants
 from ravendb.documents.commands.query import QueryCommand
@@ -107,27 +107,37 @@ class QueryOperation:
         if not self.__no_tracking:
             self.__session.register_includes(query_result.includes)
 
-        for i in range(len(query_result.results)):
-            document = query_result.results[i]
-            metadata = document.get(constants.Documents.Metadata.KEY)
-            id_node = metadata.get(constants.Documents.Metadata.ID)
-            key = None
-            if isinstance(id_node, str):
-                key = id_node
-
-            add_to_result(
-                i,
-                self.deserialize(
-                    object_type,
-                    key,
-                    document,
-                    metadata,
-                    self.__fields_to_fetch,
-                    self.__no_tracking,
-                    self.__session,
-                    self.__is_project_into,
-                ),
+        converted_in_advance = self.__session.conventions.materialization_executor is not None and (
+            self.__session.entity_to_json.convert_to_entities_in_advance(
+                object_type, self.__documents_to_convert(query_result.results)
             )
+        )
+        try:
+            for i in range(len(query_result.results)):
+                document = query_result.results[i]
+                metadata = document.get(constants.Documents.Metadata.KEY)
+                id_node = metadata.get(constants.Documents.Metadata.ID)
+                key = None
+                if isinstance(id_node, str):
+                    key = id_node
+
+                add_to_result(
+                    i,
+                    self.deserialize(
+                        object_type,
+                        key,
+                        document,
+                        metadata,
+                        self.__fields_to_fetch,
+                        self.__no_tracking,
+                        self.__session,
+                        self.__is_project_into,
+                    ),
+                )
+        finally:
+            if converted_in_advance:
+                self.__session.entity_to_json.clear_converted_in_advance()
+
         if not self.__no_tracking:
             self.__session.register_missing_includes(
                 query_result.results, query_result.includes, query_result.included_paths
@@ -144,6 +154,18 @@ class QueryOperation:
                     query_result.compare_exchange_value_includes
                 )
 
+    @staticmethod
+    def __documents_to_convert(results: List[Dict[str, Any]]) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        # projections are converted by deserialize itself
+        documents = []
+        for document in results:
+            metadata = document.get(constants.Documents.Metadata.KEY)
+            if metadata.get("@projection"):
+                continue
+            key = metadata.get(constants.Documents.Metadata.ID)
+            documents.append((key if isinstance(key, str) else None, document))
+        return documents
+
     @staticmethod
     def deserialize(
         object_type: Type[_T],
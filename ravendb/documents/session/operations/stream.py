@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import Optional, Iterator, AsyncIterator, Dict, Any, Tuple, TYPE_CHECKING
+
+import ijson
+from ijson.common import ObjectBuilder
+
+from ravendb.primitives.constants import int_max
+from ravendb.documents.commands.stream import StreamCommand, QueryStreamCommand, StreamResultResponse
+from ravendb.exceptions.documents.indexes import IndexDoesNotExistException
+from ravendb.tools.utils import Utils
+
+if TYPE_CHECKING:
+    from ravendb.documents.queries.index_query import IndexQuery
+    from ravendb.documents.session.query import StreamQueryStatistics
+    from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
+        InMemoryDocumentSessionOperations,
+    )
+
+
+class _StreamResultsParser:
+    # turns ijson events into the streamed results, shared by the synchronous and the asynchronous streams
+    _CONTAINER_EVENTS = {"start_map", "end_map", "start_array", "end_array"}
+
+    _START, _PROPERTIES, _RESULTS_START, _RESULTS = range(4)
+
+    def __init__(self, results_property: str):
+        self._results_property = results_property
+        self._item_prefix = f"{results_property}.item"
+        self._state = self._START
+        self._builder: Optional[ObjectBuilder] = None
+        self.properties: Dict[str, Any] = {}
+        self.trailing_properties: Dict[str, Any] = {}
+
+    @property
+    def in_results(self) -> bool:
+        return self._state == self._RESULTS
+
+    def feed(self, prefix: str, event: str, value: Any) -> Optional[Dict[str, Any]]:
+        if self._state == self._RESULTS:
+            builder = self._builder
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == self._item_prefix and event == "end_map":
+                    self._builder = None
+                    return builder.value
+                return None
+
+            if prefix == self._item_prefix:
+                if event != "start_map":
+                    raise ValueError("Expected start object, got: " + event)
+                self._builder = ObjectBuilder()
+                self._builder.event(event, value)
+            elif prefix != "" and "." not in prefix and event not in self._CONTAINER_EVENTS:
+                self.trailing_properties[prefix] = value
+            return None
+
+        if self._state == self._START:
+            if event != "start_map":
+                raise ValueError("Expected start object, got: " + event)
+            self._state = self._PROPERTIES
+        elif self._state == self._PROPERTIES:
+            if prefix == "" and event == "map_key":
+                if value == self._results_property:
+                    self._state = self._RESULTS_START
+            elif "." not in prefix and event not in self._CONTAINER_EVENTS:
+                self.properties[prefix] = value
+        else:
+            if event != "start_array":
+                raise ValueError("Expected start array, got: " + event)
+            self._state = self._RESULTS
+        return None
+
+
+class StreamOperation:
+    RESULTS_PROPERTY = "Results"
+
+    def __init__(self, session: InMemoryDocumentSessionOperations, statistics: Optional[StreamQueryStatistics] = None):
+        self._session = session
+        self._statistics = statistics
+        self._is_query_stream = False
+
+    def create_query_request(self, query: IndexQuery) -> QueryStreamCommand:
+        self._is_query_stream = True
+
+        if query.wait_for_non_stale_results:
+            raise RuntimeError(
+                "Since stream() does not wait for indexing (by design), "
+                "streaming query with wait_for_non_stale_results is not supported"
+            )
+
+        self._session.increment_requests_count()
+        return QueryStreamCommand(self._session.conventions, query)
+
+    def create_request(
+        self,
+        starts_with: str,
+        matches: Optional[str] = None,
+        start: int = 0,
+        page_size: int = int_max,
+        exclude: Optional[str] = None,
+        start_after: Optional[str] = None,
+    ) -> StreamCommand:
+        path = ["streams/docs?"]
+
+        if starts_with is not None:
+            path.append(f"startsWith={Utils.quote_key(starts_with)}&")
+
+        if matches is not None:
+            path.append(f"matches={Utils.quote_key(matches)}&")
+
+        if exclude is not None:
+            path.append(f"exclude={Utils.quote_key(exclude)}&")
+
+        if start_after is not None:
+            path.append(f"startAfter={Utils.quote_key(start_after)}&")
+
+        if start != 0:
+            path.append(f"start={start}&")
+
+        if page_size != int_max:
+            path.append(f"pageSize={page_size}&")
+
+        self._session.increment_requests_count()
+        return StreamCommand("".join(path))
+
+    def set_result(self, response: Optional[StreamResultResponse]) -> Iterator[Dict[str, Any]]:
+        if response is None or response.stream is None:
+            raise IndexDoesNotExistException("The index does not exists, failed to stream results")
+
+        parser = _StreamResultsParser(self.RESULTS_PROPERTY)
+        try:
+            events = ijson.parse(response.stream, use_float=True)
+            for prefix, event, value in events:
+                parser.feed(prefix, event, value)
+                if parser.in_results:
+                    break
+            else:
+                raise ValueError(f"Expected '{self.RESULTS_PROPERTY}' property in the stream response")
+
+            if self._is_query_stream:
+                self._handle_stream_query_stats(parser.properties)
+        except BaseException:
+            response.close()
+            raise
+
+        return self._yield_results(response, events, parser)
+
+    async def set_result_async(self, response: Optional[StreamResultResponse]) -> AsyncIterator[Dict[str, Any]]:
+        if response is None or response.stream is None:
+            raise IndexDoesNotExistException("The index does not exists, failed to stream results")
+
+        parser = _StreamResultsParser(self.RESULTS_PROPERTY)
+        try:
+            events = ijson.parse_async(response.stream, use_float=True)
+            async for prefix, event, value in events:
+                parser.feed(prefix, event, value)
+                if parser.in_results:
+                    break
+            else:
+                raise ValueError(f"Expected '{self.RESULTS_PROPERTY}' property in the stream response")
+
+            if self._is_query_stream:
+                self._handle_stream_query_stats(parser.properties)
+        except BaseException:
+            response.close()
+            raise
+
+        return self._yield_results_async(response, events, parser)
+
+    def _yield_results(
+        self, response: StreamResultResponse, events: Iterator[Tuple[str, str, Any]], parser: _StreamResultsParser
+    ) -> Iterator[Dict[str, Any]]:
+        try:
+            for prefix, event, value in events:
+                item = parser.feed(prefix, event, value)
+                if item is not None:
+                    yield item
+
+            # some server versions send the query statistics after the results array
+            if self._is_query_stream and parser.trailing_properties:
+                self._handle_stream_query_stats(parser.trailing_properties)
+        finally:
+            response.close()
+
+    async def _yield_results_async(
+        self, response: StreamResultResponse, events: AsyncIterator[Tuple[str, str, Any]], parser: _StreamResultsParser
+    ) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            async for prefix, event, value in events:
+                item = parser.feed(prefix, event, value)
+                if item is not None:
+                    yield item
+
+            if self._is_query_stream and parser.trailing_properties:
+                self._handle_stream_query_stats(parser.trailing_properties)
+        finally:
+            response.close()
+
+    def _handle_stream_query_stats(self, properties: Dict[str, Any]) -> None:
+        statistics = self._statistics
+        if statistics is None:
+            return
+
+        if "ResultEtag" in properties:
+            statistics.result_etag = properties.get("ResultEtag")
+        if "IsStale" in properties:
+            statistics.is_stale = properties.get("IsStale")
+        if "IndexName" in properties:
+            statistics.index_name = properties.get("IndexName")
+        if "TotalResults" in properties:
+            statistics.total_results = properties.get("TotalResults")
+        if "IndexTimestamp" in properties:
+            statistics.index_timestamp = Utils.string_to_datetime(properties.get("IndexTimestamp"))
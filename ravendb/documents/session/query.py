@@ -97,6 +97,7 @@ _TProjection = TypeVar("_TProjection")
 _T_TS_Bindable = TypeVar("_T_TS_Bindable", bound=ITimeSeriesValuesBindable)
 if TYPE_CHECKING:
     from ravendb.documents.store.definition import Lazy
+    from ravendb.documents.commands.stream import StreamResult
     from ravendb.documents.session.document_session import DocumentSession
     from ravendb.documents.session import InMemoryDocumentSessionOperations
 
@@ -892,6 +893,17 @@ class AbstractDocumentQuery(Generic[_T]):
                 f"current clause depth = {self.__current_clause_depth}"
             )
 
+        pagination = None if compatibility_mode else self.__add_pagination_parameters()
+        if self.conventions.query_shape_cache_size > 0:
+            return self.conventions.query_shape_cache.get_or_render(
+                (self.__query_shape(), pagination),
+                lambda: self.__render_query_text(pagination),
+                self.conventions.query_shape_cache_size,
+            )
+
+        return self.__render_query_text(pagination)
+
+    def __render_query_text(self, pagination: Optional[Tuple[str, str]]) -> str:
         query_text = []
         self.__build_declare(query_text)
 
@@ -904,22 +916,54 @@ class AbstractDocumentQuery(Generic[_T]):
         self.__build_select(query_text)
         self.__build_include(query_text)
 
-        if not compatibility_mode:
-            self.__build_pagination(query_text)
+        if pagination is not None:
+            self.__build_pagination(query_text, pagination)
 
         return "".join(query_text)
 
+    def __query_shape(self) -> tuple:
+        # everything __render_query_text writes, the parameter values are not part of the text
+        shape_keys = AbstractDocumentQuery.__shape_keys
+        return (
+            shape_keys(self._declare_tokens),
+            self._from_token.shape_key(),
+            shape_keys(self._group_by_tokens),
+            self._is_intersect,
+            shape_keys(self._where_tokens),
+            shape_keys(self._order_by_tokens),
+            shape_keys(self._load_tokens),
+            shape_keys(self._select_tokens),
+            tuple(self._document_includes) if self._document_includes else (),
+            shape_keys(self._counter_includes_tokens),
+            shape_keys(self._time_series_includes_tokens),
+            shape_keys(self._compare_exchange_includes_tokens),
+            shape_keys(self._highlighting_tokens),
+            self._explanation_token.shape_key() if self._explanation_token is not None else None,
+            self._query_timings is not None,
+        )
+
+    @staticmethod
+    def __shape_keys(tokens: Optional[List[QueryToken]]) -> Optional[tuple]:
+        if not tokens:
+            return None if tokens is None else ()
+        return tuple([token.shape_key() for token in tokens])
+
     def __build_with(self, query_text: List[str]) -> None:
         for with_token in self._with_tokens:
             with_token.write_to(query_text)
             query_text.append(os.linesep)
 
-    def __build_pagination(self, query_text: List[str]) -> None:
+    def __add_pagination_parameters(self) -> Optional[Tuple[str, str]]:
         if (self._start is not None and self._start > 0) or self._page_size is not None:
-            query_text.append(" limit $")
-            query_text.append(self.__add_query_parameter(self._start or 0))
-            query_text.append(", $")
-            query_text.append(self.__add_query_parameter(self._page_size or 0))
+            return self.__add_query_parameter(self._start or 0), self.__add_query_parameter(self._page_size or 0)
+        return None
+
+    @staticmethod
+    def __build_pagination(query_text: List[str], pagination: Tuple[str, str]) -> None:
+        query_text.append(" limit $")
+        query_text.append(pagination[0])
+        query_text.append(", $")
+        query_text.append(pagination[1])
 
     def __build_include(self, query_text: List[str]) -> None:
         if (
@@ -1600,6 +1644,22 @@ class AbstractDocumentQuery(Generic[_T]):
             raise ValueError(f"Expected single result, got: {len(result)} ")
         return result[0]
 
+    def stream(self, stream_query_stats: Optional[StreamQueryStatistics] = None) -> Iterator[_T]:
+        """
+        Streams the query results - the entities are yielded one by one as the response is read, without being
+        tracked by the session. Closing the iterator before its end closes the response.
+        """
+        self._the_session: "DocumentSession"
+        return self.__yield_streamed_entities(self._the_session.advanced.stream(self, stream_query_stats))
+
+    @staticmethod
+    def __yield_streamed_entities(results: Iterator[StreamResult[_T]]) -> Iterator[_T]:
+        try:
+            for result in results:
+                yield result.document
+        finally:
+            results.close()
+
     def _aggregate_by(self, facet: FacetBase) -> None:
         for token in self._select_tokens:
             if isinstance(token, FacetToken):
@@ -2328,6 +2388,118 @@ class RawDocumentQuery(Generic[_T], AbstractDocumentQuery[_T]):
         return self
 
 
+class PreparedQuery(Generic[_T]):
+    """
+    A document query built once, against the conventions only, and executed in any session with new values
+    of its placeholders - binding it skips building the tokens, escaping the field names and rendering the RQL.
+
+        by_name = PreparedQuery.prepare(
+            store.conventions, lambda query: query.where_equals("name", PreparedQuery.parameter("name")), object_type=User
+        )
+        with store.open_session() as session:
+            users = list(by_name.bind(session, name="John"))
+
+    Bound values are sent as they are, they don't go through the conversions of the where_* methods
+    (e.g. timedelta to ticks or the query value converters of the conventions).
+    """
+
+    class Parameter:
+        def __init__(self, name: str):
+            if not name:
+                raise ValueError("Parameter name cannot be None or empty")
+            self.name = name
+
+        def __repr__(self):
+            return f"PreparedQuery.parameter({self.name!r})"
+
+    class _ConventionsSession:
+        # stands in for the session while the query is being built, the building steps only need the conventions
+        def __init__(self, conventions: DocumentConventions):
+            self.conventions = conventions
+
+    def __init__(self, template: AbstractDocumentQuery[_T]):
+        self._object_type = template._object_type
+        self._fields_to_fetch_token = template._fields_to_fetch_token
+        self._is_project_into = template.is_project_into
+        self._page_size = template._page_size
+        self._start = template._start
+        self._wait_for_non_stale_results = template._the_wait_for_non_stale_results
+        self._timeout = template._timeout
+        self._disable_entities_tracking = template._disable_entities_tracking
+        self._disable_caching = template._disable_caching
+        self._projection_behavior = template._projection_behavior
+        self.query = template._to_string()
+
+        self._parameters = Parameters(template._query_parameters)
+        self._placeholders: Dict[str, List[Tuple[str, bool]]] = {}
+        for key, value in self._parameters.items():
+            if isinstance(value, PreparedQuery.Parameter):
+                self._placeholders.setdefault(value.name, []).append((key, False))
+            elif isinstance(value, list) and any(isinstance(item, PreparedQuery.Parameter) for item in value):
+                if len(value) != 1:
+                    raise ValueError("A parameter of a collection can't be mixed with other values")
+                self._placeholders.setdefault(value[0].name, []).append((key, True))
+
+    @staticmethod
+    def parameter(name: str) -> PreparedQuery.Parameter:
+        return PreparedQuery.Parameter(name)
+
+    @classmethod
+    def prepare(
+        cls,
+        conventions: DocumentConventions,
+        build: Callable[[DocumentQuery[_T]], AbstractDocumentQuery[_TResult]],
+        index_name: Optional[str] = None,
+        collection_name: Optional[str] = None,
+        object_type: Optional[Type[_T]] = None,
+        is_map_reduce: bool = False,
+    ) -> PreparedQuery[_TResult]:
+        if index_name and collection_name:
+            raise ValueError(
+                "Parameters index_name and collection_name are mutually exclusive. Please specify only one."
+            )
+        if not index_name and not collection_name:
+            collection_name = (
+                conventions.get_collection_name(object_type) or constants.Documents.Metadata.ALL_DOCUMENTS_COLLECTION
+            )
+
+        query = DocumentQuery(
+            object_type, cls._ConventionsSession(conventions), index_name, collection_name, is_map_reduce
+        )
+        return cls(build(query) or query)
+
+    @property
+    def parameter_names(self) -> Set[str]:
+        return set(self._placeholders)
+
+    def bind(self, session: InMemoryDocumentSessionOperations, **values: object) -> RawDocumentQuery[_T]:
+        missing = self._placeholders.keys() - values.keys()
+        if missing:
+            raise ValueError(f"Missing values of the parameters: {', '.join(sorted(missing))}")
+        unknown = values.keys() - self._placeholders.keys()
+        if unknown:
+            raise ValueError(f"The query has no parameters: {', '.join(sorted(unknown))}")
+
+        query = RawDocumentQuery(self._object_type, session, self.query)
+        parameters = Parameters(self._parameters)
+        for name, keys in self._placeholders.items():
+            value = values[name]
+            for key, is_collection in keys:
+                parameters[key] = Utils.unpack_collection(value) if is_collection else value
+
+        query._query_parameters = parameters
+        query._fields_to_fetch_token = self._fields_to_fetch_token
+        query.is_project_into = self._is_project_into
+        query._page_size = self._page_size
+        query._start = self._start
+        query._the_wait_for_non_stale_results = self._wait_for_non_stale_results
+        query._timeout = self._timeout
+        query._disable_entities_tracking = self._disable_entities_tracking
+        query._disable_caching = self._disable_caching
+        query._projection_behavior = self._projection_behavior
+        return query
+
+
 class DocumentQueryCustomizationDelegate(DocumentQueryCustomization):
     def __init__(self, query: AbstractDocumentQuery):
         super().__init__(query)
@@ -2441,3 +2613,19 @@ class QueryStatistics:
         self.last_query_time = qr.last_query_time
         self.result_etag = qr.result_etag
         self.node_tag = qr.node_tag
+
+
+class StreamQueryStatistics:
+    def __init__(
+        self,
+        index_name: str = None,
+        is_stale: bool = None,
+        index_timestamp: datetime.datetime = None,
+        total_results: int = None,
+        result_etag: int = None,
+    ):
+        self.index_name = index_name
+        self.is_stale = is_stale
+        self.index_timestamp = index_timestamp
+        self.total_results = total_results
+        self.result_etag = result_etag
@@ -145,6 +145,15 @@ class FieldsToFetchToken(QueryToken):
 
         return FieldsToFetchToken(fields_to_fetch, projections, custom_function, source_alias)
 
+    def shape_key(self) -> Tuple:
+        return (
+            FieldsToFetchToken,
+            tuple(self.fields_to_fetch),
+            tuple(self.projections) if self.projections is not None else None,
+            self.custom_function,
+            self.source_alias,
+        )
+
     def write_to(self, writer: List[str]):
         for i in range(len(self.fields_to_fetch)):
             field_to_fetch = self.fields_to_fetch[i]
@@ -458,6 +467,14 @@ class MoreLikeThisToken(QueryToken):
         self.document_parameter_name: Union[None, str] = None
         self.options_parameter_name: Union[None, str] = None
 
+    def shape_key(self) -> Tuple:
+        return (
+            MoreLikeThisToken,
+            tuple([token.shape_key() for token in self.where_tokens]),
+            self.document_parameter_name,
+            self.options_parameter_name,
+        )
+
     def write_to(self, writer: List[str]):
         writer.append("moreLikeThis(")
         if self.document_parameter_name is None:
@@ -670,6 +687,26 @@ class WhereToken(QueryToken):
 
         return WhereToken(f"{alias}.{self.field_name}", self.where_operator, self.parameter_name, self.options)
 
+    def shape_key(self) -> Tuple:
+        options = self.options
+        method = options.method
+        return (
+            WhereToken,
+            self.field_name,
+            self.where_operator,
+            self.parameter_name,
+            options.search_operator,
+            options.from_parameter_name,
+            options.to_parameter_name,
+            options.boost,
+            options.fuzzy,
+            options.proximity,
+            options.exact,
+            (method.method_type, tuple(method.parameters), method.property) if method is not None else None,
+            options.where_shape.shape_key() if options.where_shape is not None else None,
+            options.distance_error_pct,
+        )
+
     def __write_method(self, writer: List[str]) -> bool:
         if self.options.method is not None:
             if self.options.method.method_type == WhereToken.MethodsType.CMP_X_CHG:
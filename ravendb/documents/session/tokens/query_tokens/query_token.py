@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List
+from typing import List, Tuple
 
 
 class QueryToken:
@@ -9,6 +9,10 @@ class QueryToken:
     def write_to(self, writer: List[str]) -> None:
         raise NotImplementedError("Error : write_to is not implemented")
 
+    def shape_key(self) -> Tuple:
+        # tokens writing the same text have equal keys - attributes compared by identity can only make them differ
+        return (self.__class__, *self.__dict__.values())
+
     def write_field(self, writer: List[str], field: str):
         key_word = self.is_keyword(field)
         if key_word:
@@ -4,10 +4,11 @@ import datetime
 import uuid
 from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Union, Optional, TypeVar, List, Dict, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Callable, Union, Optional, TypeVar, List, Dict, Iterator, ContextManager, TYPE_CHECKING
 
 from ravendb.changes.database_changes import DatabaseChanges
-from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions
+from ravendb.documents.bulk_insert_operation import BulkInsertOperation, BulkInsertOptions, ParallelBulkInsert
 from ravendb.documents.indexes.index_creation import IndexCreation
 from ravendb.documents.operations.executor import MaintenanceOperationExecutor, OperationExecutor
 from ravendb.documents.operations.indexes import PutIndexesOperation
@@ -27,13 +28,18 @@ from ravendb.documents.session.event_args import (
     FailedRequestEventArgs,
 )
 from ravendb.documents.store.lazy import Lazy
+from ravendb.documents.store.misc import EvictItemsFromCacheBasedOnChanges
+from ravendb.documents.session.async_document_session import AsyncDocumentSession
 from ravendb.documents.session.document_session import DocumentSession
 from ravendb.documents.session.document_session_operations.in_memory_document_session_operations import (
     InMemoryDocumentSessionOperations,
 )
 from ravendb.documents.session.misc import SessionOptions
+from ravendb.documents.session.operations.load_batcher import AsyncLoadBatcher, LoadBatcher
 from ravendb.documents.subscriptions.document_subscriptions import DocumentSubscriptions
 from ravendb.documents.time_series import TimeSeriesOperations
+from ravendb.http.misc import AggressiveCacheMode, AggressiveCacheOptions
+from ravendb.http.async_request_executor import AsyncRequestExecutor
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.documents.identity.hilo import MultiDatabaseHiLoGenerator
 from ravendb.http.topology import Topology
@@ -167,7 +173,54 @@ class DocumentStoreBase:
     def operations(self) -> OperationExecutor:
         pass
 
-    # todo: aggressive_caching
+    @abstractmethod
+    def get_request_executor(self, database: Optional[str] = None) -> RequestExecutor:
+        pass
+
+    @abstractmethod
+    def _listen_to_changes_and_update_the_cache(self, database: str) -> None:
+        pass
+
+    def aggressively_cache(self, database: Optional[str] = None) -> ContextManager[None]:
+        return self.aggressively_cache_for(self.conventions.aggressive_cache_duration, database=database)
+
+    @contextmanager
+    def aggressively_cache_for(
+        self,
+        cache_duration: datetime.timedelta,
+        mode: Optional[AggressiveCacheMode] = None,
+        database: Optional[str] = None,
+    ) -> Iterator[None]:
+        """
+        Serve cached responses younger than cache_duration without asking the server, for the current thread.
+        In TRACK_CHANGES mode the cache is invalidated using the Changes API.
+        """
+        self.assert_initialized()
+        database = self.get_effective_database(database)
+        if mode is None:
+            mode = self.conventions.aggressive_cache_mode
+
+        if mode != AggressiveCacheMode.DO_NOT_TRACK_CHANGES:
+            self._listen_to_changes_and_update_the_cache(database)
+
+        request_executor = self.get_request_executor(database)
+        old_value = request_executor.aggressive_caching
+        request_executor.aggressive_caching = AggressiveCacheOptions(cache_duration, mode)
+        try:
+            yield
+        finally:
+            request_executor.aggressive_caching = old_value
+
+    @contextmanager
+    def disable_aggressive_caching(self, database: Optional[str] = None) -> Iterator[None]:
+        self.assert_initialized()
+        request_executor = self.get_request_executor(self.get_effective_database(database))
+        old_value = request_executor.aggressive_caching
+        request_executor.aggressive_caching = None
+        try:
+            yield
+        finally:
+            request_executor.aggressive_caching = old_value
 
     # todo: time_series
 
@@ -313,7 +366,12 @@ class DocumentStore(DocumentStoreBase):
         self.urls = [urls] if isinstance(urls, str) else urls
         self.database = database
         self.__request_executors: Dict[str, Lazy[RequestExecutor]] = CaseInsensitiveDict()
-        # todo: aggressive cache
+        self.__async_request_executors: Dict[str, AsyncRequestExecutor] = CaseInsensitiveDict()
+        self.__load_batchers: Dict[str, LoadBatcher] = CaseInsensitiveDict()
+        self.__async_load_batchers: Dict[str, AsyncLoadBatcher] = CaseInsensitiveDict()
+        self.__load_batchers_lock = threading.Lock()
+        self.__aggressive_cache_changes: Dict[str, Lazy[EvictItemsFromCacheBasedOnChanges]] = CaseInsensitiveDict()
+        self.__aggressive_cache_changes_lock = threading.Lock()
         self.__maintenance_operation_executor: Optional[MaintenanceOperationExecutor] = None
         self.__operation_executor: Optional[OperationExecutor] = None
         # todo: database smuggler
@@ -378,7 +436,11 @@ class DocumentStore(DocumentStoreBase):
         for event in self.__before_close:
             event()
 
-        # todo: evict items from cache based on changes
+        for lazy in self.__aggressive_cache_changes.values():
+            if not lazy.is_value_created:
+                continue
+
+            lazy.value.close()
 
         while len(self.__database_changes) > 0:
             self.__database_changes.popitem()[1].close()
@@ -404,6 +466,13 @@ class DocumentStore(DocumentStoreBase):
         self.__thread_pool_executor.shutdown()
         self._disposed = True
 
+    async def close_async(self) -> None:
+        # aiohttp sessions can only be closed from the event loop
+        while len(self.__async_request_executors) > 0:
+            await self.__async_request_executors.popitem()[1].close()
+
+        self.close()
+
     def open_session(
         self, database: Optional[str] = None, session_options: Optional[SessionOptions] = None
     ) -> DocumentSession:
@@ -423,6 +492,49 @@ class DocumentStore(DocumentStoreBase):
         self.after_session_created(session)
         return session
 
+    def open_async_session(
+        self, database: Optional[str] = None, session_options: Optional[SessionOptions] = None
+    ) -> AsyncDocumentSession:
+        session = self.open_session(database, session_options)
+        return AsyncDocumentSession(session, self.get_async_request_executor(session.database_name))
+
+    def get_async_request_executor(self, database: Optional[str] = None) -> AsyncRequestExecutor:
+        self.assert_initialized()
+
+        database = self.get_effective_database(database)
+
+        executor = self.__async_request_executors.get(database, None)
+        if executor is None:
+            executor = AsyncRequestExecutor(self.get_request_executor(database))
+            self.__async_request_executors[database] = executor
+
+        return executor
+
+    def get_load_batcher(self, database: Optional[str] = None) -> LoadBatcher:
+        self.assert_initialized()
+
+        database = self.get_effective_database(database)
+
+        with self.__load_batchers_lock:
+            batcher = self.__load_batchers.get(database, None)
+            if batcher is None:
+                batcher = LoadBatcher(self.get_request_executor(database))
+                self.__load_batchers[database] = batcher
+
+        return batcher
+
+    def get_async_load_batcher(self, database: Optional[str] = None) -> AsyncLoadBatcher:
+        self.assert_initialized()
+
+        database = self.get_effective_database(database)
+
+        batcher = self.__async_load_batchers.get(database, None)
+        if batcher is None:
+            batcher = AsyncLoadBatcher(self.get_async_request_executor(database))
+            self.__async_load_batchers[database] = batcher
+
+        return batcher
+
     def get_request_executor(self, database: Optional[str] = None) -> RequestExecutor:
         self.assert_initialized()
 
@@ -528,12 +640,31 @@ class DocumentStore(DocumentStoreBase):
         self._initialized = True
         return self
 
-    # todo: aggressively cache
+    def _listen_to_changes_and_update_the_cache(self, database: str) -> None:
+        lazy = self.__aggressive_cache_changes.get(database, None)
+        if lazy is None:
+            with self.__aggressive_cache_changes_lock:
+                lazy = self.__aggressive_cache_changes.get(database, None)
+                if lazy is None:
+                    lazy = Lazy(lambda: EvictItemsFromCacheBasedOnChanges(self, database))
+                    self.__aggressive_cache_changes[database] = lazy
+
+        lazy.value  # force evaluation
 
     def bulk_insert(self, database_name: str = None, options: BulkInsertOptions = None) -> BulkInsertOperation:
         self.assert_initialized()
         return BulkInsertOperation(self.get_effective_database(database_name), self, options)
 
+    def parallel_bulk_insert(
+        self,
+        database_name: str = None,
+        options: BulkInsertOptions = None,
+        streams_count: int = 3,
+        node_tags: Optional[List[str]] = None,
+    ) -> ParallelBulkInsert:
+        self.assert_initialized()
+        return ParallelBulkInsert(self.get_effective_database(database_name), self, options, streams_count, node_tags)
+
     def _assert_valid_configuration(self) -> None:
         if not self.urls:
             raise ValueError("Document URLs cannot be empty.")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 import threading
-from typing import Generic, Callable, Any, Union, TypeVar
+from typing import Generic, Callable, Any, Union, TypeVar, TYPE_CHECKING
 
+from ravendb.changes.types import DocumentChange, DocumentChangeType, IndexChange, IndexChangeTypes
 from ravendb.documents.commands.batches import CommandType
 
+if TYPE_CHECKING:
+    from ravendb.documents.store.definition import DocumentStore
+
 _T = TypeVar("_T")
 
 
@@ -29,3 +33,31 @@ class IdTypeAndName:
     @classmethod
     def create(cls, key: str, command_type: CommandType, name: Union[None, str]) -> IdTypeAndName:
         return cls(key, command_type, name)
+
+
+class EvictItemsFromCacheBasedOnChanges:
+    def __init__(self, store: DocumentStore, database_name: str):
+        self._database_name = database_name
+        self._changes = store.changes(database_name)
+        self._request_executor = store.get_request_executor(database_name)
+
+        documents_observable = self._changes.for_all_documents()
+        self._documents_subscription = documents_observable.subscribe(self._on_document_change)
+        indexes_observable = self._changes.for_all_indexes()
+        self._indexes_subscription = indexes_observable.subscribe(self._on_index_change)
+
+        # make sure we won't miss any change between now and the first aggressively cached request
+        documents_observable.ensure_subscribe_now()
+        indexes_observable.ensure_subscribe_now()
+
+    def _on_document_change(self, change: DocumentChange) -> None:
+        if change.type_of_change in [DocumentChangeType.PUT, DocumentChangeType.DELETE]:
+            self._request_executor.cache.generation += 1
+
+    def _on_index_change(self, change: IndexChange) -> None:
+        if change.type_of_change in [IndexChangeTypes.BATCH_COMPLETED, IndexChangeTypes.INDEX_REMOVED]:
+            self._request_executor.cache.generation += 1
+
+    def close(self) -> None:
+        self._documents_subscription()
+        self._indexes_subscription()
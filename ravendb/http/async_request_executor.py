@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import inspect
+import ssl
+import time
+from http import HTTPStatus
+from typing import Optional, TYPE_CHECKING, Any, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ravendb.documents.session.event_args import BeforeRequestEventArgs
+from ravendb.exceptions.exceptions import DatabaseDoesNotExistException, UnsuccessfulRequestException
+from ravendb.http.misc import ResponseDisposeHandling
+from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
+from ravendb.http.server_node import ServerNode
+from ravendb.http.single_flight import AsyncSingleFlight
+from ravendb.http.topology import CurrentIndexAndNode
+
+if TYPE_CHECKING:
+    from ravendb.documents.conventions import DocumentConventions
+    from ravendb.documents.session import SessionInfo
+    from ravendb.http.http_cache import HttpCache
+    from ravendb.http.request_executor import RequestExecutor
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise RuntimeError("Async request executor requires the 'aiohttp' package to be installed")
+    return aiohttp
+
+
+class AsyncRequestExecutor:
+    """
+    Executes RavenCommands on an asyncio event loop using aiohttp.
+
+    Topology, node selection, the HTTP cache, aggressive caching and client configuration are shared with
+    the wrapped RequestExecutor, whose background topology updates keep running on its own threads.
+    """
+
+    _INITIAL_TOPOLOGY_ETAG = -2
+    _SERVER_DOWN_STATUS_CODES = {
+        HTTPStatus.GATEWAY_TIMEOUT,
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GONE,
+        425,  # too early
+    }
+
+    def __init__(self, request_executor: RequestExecutor):
+        self._request_executor = request_executor
+        self._http_session = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._single_flight = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        http_session, self._http_session = self._http_session, None
+        await self._close_http_session(http_session, self._http_session_loop)
+
+    @property
+    def request_executor(self) -> RequestExecutor:
+        return self._request_executor
+
+    @property
+    def conventions(self) -> DocumentConventions:
+        return self._request_executor.conventions
+
+    @property
+    def cache(self) -> HttpCache:
+        return self._request_executor.cache
+
+    @property
+    def number_of_coalesced_requests(self) -> int:
+        return self._single_flight.number_of_shared_results
+
+    async def get_http_session(self):
+        # aiohttp sessions are bound to the loop they were created on
+        loop = asyncio.get_running_loop()
+        http_session, previous_loop = self._http_session, self._http_session_loop
+        if http_session is None or http_session.closed or previous_loop is not loop:
+            aiohttp = _import_aiohttp()
+            previous = http_session
+            http_session = aiohttp.ClientSession(connector=self._create_connector(aiohttp), auto_decompress=True)
+            self._http_session, self._http_session_loop = http_session, loop
+            await self._close_http_session(previous, previous_loop)
+        return http_session
+
+    @staticmethod
+    async def _close_http_session(http_session, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        if http_session is None or http_session.closed:
+            return
+        if loop is not None and loop.is_running() and loop is not asyncio.get_running_loop():
+            # the connections belong to a loop running on another thread, they have to be closed there
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(http_session.close(), loop))
+        else:
+            await http_session.close()
+
+    def _create_connector(self, aiohttp):
+        conventions = self.conventions
+        connector_options = {
+            "ssl": self._create_ssl_context(),
+            # aiohttp keeps every released connection, the pool size can only be enforced as a limit
+            "limit_per_host": conventions.http_pool_size_per_node if conventions.http_pool_block else 0,
+        }
+        if conventions.http_pool_idle_timeout is not None:
+            connector_options["keepalive_timeout"] = conventions.http_pool_idle_timeout.total_seconds()
+        return aiohttp.TCPConnector(**connector_options)
+
+    def _create_ssl_context(self) -> Optional[ssl.SSLContext]:
+        certificate_path = self._request_executor.certificate_path
+        trust_store_path = self._request_executor.trust_store_path
+        if certificate_path is None and trust_store_path is None:
+            return None
+
+        context = ssl.create_default_context(cafile=trust_store_path)
+        if certificate_path is not None:
+            context.load_cert_chain(certificate_path)
+        return context
+
+    async def execute_command(
+        self, command: RavenCommand, session_info: Optional[SessionInfo] = None, stream: bool = False
+    ) -> Optional[Any]:
+        """
+        Executes the command, setting its result the same way RequestExecutor.execute_command does.
+        With stream=True the successful response isn't read nor processed, the open aiohttp response is returned
+        and the caller is responsible for closing it.
+        """
+        await self._wait_for_topology()
+
+        current_index_and_node = self._request_executor.choose_node_for_request(command, session_info)
+        return await self.execute(
+            current_index_and_node.current_node,
+            current_index_and_node.current_index,
+            command,
+            True,
+            session_info,
+            stream,
+        )
+
+    async def _wait_for_topology(self) -> None:
+        request_executor = self._request_executor
+        if request_executor._disable_topology_updates:
+            return
+
+        topology_update = request_executor._first_topology_update_task
+        if topology_update is not None and not topology_update.done():
+            await asyncio.wrap_future(topology_update)
+        elif topology_update is None or topology_update.cancelled() or topology_update.exception() is not None:
+            # (re)starting the first topology update blocks, keep it off the loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, request_executor._wait_for_topology_update, topology_update
+            )
+
+    async def execute(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        should_retry: bool,
+        session_info: Optional[SessionInfo] = None,
+        stream: bool = False,
+    ) -> Optional[Any]:
+        request_executor = self._request_executor
+
+        if command.failover_topology_etag == self._INITIAL_TOPOLOGY_ETAG:
+            node_selector = request_executor._node_selector
+            if node_selector and node_selector.topology and node_selector.topology.etag:
+                command.failover_topology_etag = node_selector.topology.etag
+
+        request = request_executor._create_request(chosen_node, command)
+        if request is None:
+            return None
+
+        if inspect.isgenerator(request.data):
+            raise NotImplementedError("Streaming request bodies aren't supported by the async request executor")
+
+        url = request.url
+        no_caching = session_info.no_caching if session_info else False
+
+        cached_item, change_vector, cached_value = request_executor._get_from_cache(command, not no_caching, url)
+        with cached_item:
+            if change_vector is not None and request_executor._try_get_from_cache(command, cached_item, cached_value):
+                request_executor.metrics.record_cache_hit(type(command).__name__)
+                return None
+
+            request_executor._set_request_headers(session_info, change_vector, request)
+
+            command.number_of_attempts = command.number_of_attempts + 1
+            attempt_num = command.number_of_attempts
+            for func in request_executor._on_before_request:
+                func(BeforeRequestEventArgs(request_executor._database_name, url, request, attempt_num))
+
+            start = time.perf_counter()
+            command.coalesced = False
+            command.hedged_node = None
+            coalescing_key = None if stream else request_executor._coalescing_key(command, request)
+            try:
+                if coalescing_key is None:
+                    response, command.hedged_node = await self._send_with_hedging(
+                        chosen_node, node_index, command, request, stream
+                    )
+                else:
+                    (response, command.hedged_node), command.coalesced = await self._single_flight.do(
+                        coalescing_key,
+                        lambda: self._send_with_hedging(chosen_node, node_index, command, request, stream),
+                    )
+            except (IOError, asyncio.TimeoutError, _import_aiohttp().ClientError) as e:
+                if not should_retry:
+                    command.failed_nodes[chosen_node] = e
+                    raise
+                return await self._handle_server_down(
+                    chosen_node, node_index, command, request, e, session_info, stream
+                )
+
+            elapsed_seconds = time.perf_counter() - start
+            if command.hedged_node is not None:
+                # the response times of both nodes were recorded when the requests completed
+                chosen_node, node_index = command.hedged_node.current_node, command.hedged_node.current_index
+            else:
+                request_executor._record_response_time(chosen_node, node_index, response, elapsed_seconds)
+
+            # topology and client configuration are refreshed in the background, requests don't wait for it
+            request_executor._refresh_if_needed(chosen_node, response)
+
+            command.status_code = response.status_code
+            response_dispose = ResponseDisposeHandling.AUTOMATIC
+            try:
+                if response.status_code == HTTPStatus.NOT_MODIFIED:
+                    request_executor._on_succeed_request_invoke(
+                        request_executor._database_name, url, response, request, attempt_num
+                    )
+                    cached_item.not_modified()
+                    if command.response_type == RavenCommandResponseType.OBJECT:
+                        command.set_response(cached_value, True)
+                    return None
+
+                if response.status_code >= 400:
+                    return await self._handle_unsuccessful_response(
+                        chosen_node, node_index, command, request, response, session_info, should_retry, stream
+                    )
+
+                request_executor._on_succeed_request_invoke(
+                    request_executor._database_name, url, response, request, attempt_num
+                )
+                if stream:
+                    response_dispose = ResponseDisposeHandling.MANUALLY
+                    return response.raw
+
+                response_dispose = command.process_response(
+                    None if command.coalesced else request_executor.cache, response, url
+                )
+                request_executor._last_returned_response = datetime.datetime.utcnow()
+                return None
+            finally:
+                request_executor._record_request_metrics(chosen_node, command, request, response, elapsed_seconds)
+                if response_dispose == ResponseDisposeHandling.AUTOMATIC and response.raw is not None:
+                    response.raw.close()
+
+    async def _send_with_hedging(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        request: requests.Request,
+        stream: bool,
+    ) -> Tuple[requests.Response, Optional[CurrentIndexAndNode]]:
+        request_executor = self._request_executor
+        delay = None if stream else request_executor._hedging_delay(node_index, command)
+        if delay is None:
+            return await self._send(chosen_node, command, request, stream), None
+
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._send(chosen_node, command, request, stream))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        hedge_node = None if done else request_executor._node_selector.get_hedge_node(node_index)
+        if hedge_node is None:
+            return await primary, None
+
+        hedge_request = request_executor._create_request(hedge_node.current_node, command)
+        for name, value in request.headers.items():
+            hedge_request.headers.setdefault(name, value)
+        hedge = asyncio.ensure_future(self._send(hedge_node.current_node, command, hedge_request, stream))
+        nodes = {primary: CurrentIndexAndNode(node_index, chosen_node), hedge: hedge_node}
+
+        winner = None
+        pending = {primary, hedge}
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                        winner = task
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner is None:
+            # neither node answered, handle the failure of the chosen node as if there was no hedging
+            winner = primary
+        else:
+            # the cancelled request took at least as long as it ran, which is what the node selector needs to know
+            now = time.perf_counter()
+            for task in (primary, hedge):
+                if task is winner or task in pending:
+                    node = nodes[task]
+                    elapsed_seconds = now - (start if task is primary else start + delay)
+                    request_executor._node_selector.record_response_time(
+                        node.current_index, node.current_node, elapsed_seconds
+                    )
+
+        request_executor.metrics.record_hedge(
+            type(command).__name__, request_executor._node_metrics_name(hedge_node.current_node), winner is hedge
+        )
+        return winner.result(), nodes[winner]
+
+    async def _send(
+        self, chosen_node: ServerNode, command: RavenCommand, request: requests.Request, stream: bool
+    ) -> requests.Response:
+        aiohttp = _import_aiohttp()
+        request_executor = self._request_executor
+        request_executor.number_of_server_requests += 1
+
+        # let requests encode the body (json, multipart attachments) exactly like the synchronous executor does
+        prepared = request.prepare()
+        timeout = command.timeout or request_executor.default_timeout
+        client_timeout = (
+            aiohttp.ClientTimeout(total=timeout.total_seconds()) if timeout and timeout.total_seconds() > 0 else None
+        )
+
+        aiohttp_response = await (await self.get_http_session()).request(
+            prepared.method,
+            prepared.url,
+            data=prepared.body,
+            headers=dict(prepared.headers),
+            timeout=client_timeout,
+        )
+
+        content = None
+        if not stream or aiohttp_response.status >= 300:
+            try:
+                content = await aiohttp_response.read()
+            finally:
+                aiohttp_response.release()
+
+        response = requests.Response()
+        response.status_code = aiohttp_response.status
+        response.reason = aiohttp_response.reason
+        response.headers = CaseInsensitiveDict(aiohttp_response.headers)
+        response.url = str(aiohttp_response.url)
+        response.encoding = "utf-8"
+        response._content = content
+        response._content_consumed = True
+        response.raw = aiohttp_response if content is None else None
+
+        if chosen_node.should_update_server_version():
+            server_version = request_executor._try_get_server_version(response)
+            if server_version is not None:
+                chosen_node.update_server_version(server_version)
+
+        request_executor._last_server_version = chosen_node.last_server_version
+        return response
+
+    async def _handle_unsuccessful_response(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        request: requests.Request,
+        response: requests.Response,
+        session_info: Optional[SessionInfo],
+        should_retry: bool,
+        stream: bool,
+    ) -> Optional[Any]:
+        request_executor = self._request_executor
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            request_executor.cache.set_not_found(request.url, request_executor.aggressive_caching is not None)
+            if command.response_type == RavenCommandResponseType.OBJECT:
+                command.set_response(None, False)
+            elif command.response_type == RavenCommandResponseType.RAW:
+                command.set_response_raw(response, None)
+            return None
+
+        if response.status_code in self._SERVER_DOWN_STATUS_CODES:
+            error = UnsuccessfulRequestException(
+                f"Request to {request.url} ({request.method}) failed with status code {response.status_code}"
+            )
+            if should_retry:
+                return await self._handle_server_down(
+                    chosen_node, node_index, command, request, error, session_info, stream, True
+                )
+            command.failed_nodes[chosen_node] = error
+            request_executor._throw_failed_to_contact_all_nodes(command, request)
+
+        # the remaining status codes are turned into exceptions without contacting the server again
+        if not request_executor._handle_unsuccessful_response(
+            chosen_node, node_index, command, request, response, request.url, session_info, False
+        ):
+            db_missing_header = response.headers.get("Database-Missing", None)
+            if db_missing_header is not None:
+                raise DatabaseDoesNotExistException(db_missing_header)
+            request_executor._throw_failed_to_contact_all_nodes(command, request)
+        return None
+
+    async def _handle_server_down(
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        request: requests.Request,
+        error: Exception,
+        session_info: Optional[SessionInfo],
+        stream: bool,
+        responded: bool = False,
+    ) -> Optional[Any]:
+        request_executor = self._request_executor
+        command.failed_nodes[chosen_node] = error
+        node_name = request_executor._node_metrics_name(chosen_node)
+        request_executor.metrics.record_failure(type(command).__name__, node_name, responded)
+
+        node_selector = request_executor._node_selector
+        if node_index is None or node_selector is None:
+            request_executor._throw_failed_to_contact_all_nodes(command, request)
+
+        # As the server is down, we discard the server version to ensure we update when it goes up.
+        chosen_node.discard_server_version()
+        node_selector.on_failed_request(node_index)
+
+        index_node_and_etag = node_selector.get_preferred_node_with_topology()
+        if command.failover_topology_etag != request_executor.topology_etag:
+            command.failed_nodes.clear()
+            command.failed_nodes[chosen_node] = error
+            command.failover_topology_etag = request_executor.topology_etag
+
+        if index_node_and_etag.current_node in command.failed_nodes:
+            request_executor._throw_failed_to_contact_all_nodes(command, request)
+
+        request_executor.metrics.record_failover(type(command).__name__, node_name)
+        return await self.execute(
+            index_node_and_etag.current_node, index_node_and_etag.current_index, command, True, session_info, stream
+        )
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime
+import functools
+import threading
+import time
+from typing import Optional, Dict, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class HttpPoolStatistics:
+    """
+    Connection usage counters of a RequestExecutor's HTTP connection pools, summed over all nodes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_acquired = 0
+        self.connections_reused = 0
+        self.connections_discarded = 0
+        self.connections_expired = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        # part of the requests sent over an already open connection, without connecting (and TLS handshake)
+        return self.connections_reused / self.connections_acquired if self.connections_acquired else 0.0
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_json(self) -> Dict[str, Union[int, float]]:
+        return {
+            "ConnectionsCreated": self.connections_created,
+            "ConnectionsAcquired": self.connections_acquired,
+            "ConnectionsReused": self.connections_reused,
+            "ConnectionsDiscarded": self.connections_discarded,
+            "ConnectionsExpired": self.connections_expired,
+            "ReuseRate": self.reuse_rate,
+        }
+
+
+class _TrackingConnectionPoolMixin:
+    def __init__(
+        self,
+        *args,
+        statistics: HttpPoolStatistics = None,
+        idle_timeout: Optional[datetime.timedelta] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._statistics = statistics
+        self._idle_timeout_seconds = idle_timeout.total_seconds() if idle_timeout else None
+
+    def _new_conn(self):
+        self._statistics._increment("connections_created")
+        return super()._new_conn()
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        conn = super()._get_conn(timeout)
+
+        if (
+            self._idle_timeout_seconds is not None
+            and conn.sock is not None
+            and time.monotonic() - getattr(conn, "_released_at", 0.0) > self._idle_timeout_seconds
+        ):
+            # the server may be closing it at this very moment, reconnect rather than risk a failed request
+            conn.close()
+            self._statistics._increment("connections_expired")
+
+        self._statistics._increment("connections_acquired")
+        if conn.sock is not None:
+            self._statistics._increment("connections_reused")
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None:
+            conn._released_at = time.monotonic()
+            if self.pool is not None and self.pool.full():
+                self._statistics._increment("connections_discarded")
+        super()._put_conn(conn)
+
+    def pre_warm(self, count: int) -> None:
+        # take the connections out first, so each one of them is a new connection, they aren't counted as acquired
+        connections = []
+        try:
+            for _ in range(min(count, self.pool.maxsize)):
+                connections.append(super()._get_conn())
+
+            for conn in connections:
+                if conn.sock is None:
+                    conn.connect()
+        finally:
+            for conn in connections:
+                self._put_conn(conn)
+
+
+class _TrackingHTTPConnectionPool(_TrackingConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackingHTTPSConnectionPool(_TrackingConnectionPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class RavenHttpAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools count connection usage into HttpPoolStatistics
+    and close connections that were idle for longer than idle_timeout.
+    """
+
+    def __init__(
+        self,
+        statistics: HttpPoolStatistics,
+        pool_maxsize: int,
+        pool_block: bool = False,
+        idle_timeout: Optional[datetime.timedelta] = None,
+    ):
+        self._statistics = statistics
+        self._idle_timeout = idle_timeout
+        super().__init__(pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(
+                _TrackingHTTPConnectionPool, statistics=self._statistics, idle_timeout=self._idle_timeout
+            ),
+            "https": functools.partial(
+                _TrackingHTTPSConnectionPool, statistics=self._statistics, idle_timeout=self._idle_timeout
+            ),
+        }
+
+    def pre_warm(self, session: requests.Session, url: str, count: int) -> None:
+        request = requests.Request("GET", url).prepare()
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(request, session.verify, cert=session.cert)
+        else:
+            pool = self.get_connection(url)
+            self.cert_verify(pool, url, session.verify, session.cert)
+
+        if isinstance(pool, _TrackingConnectionPoolMixin):
+            pool.pre_warm(count)
@@ -1,6 +1,9 @@
 import datetime
+import sys
+from collections import OrderedDict
 from enum import Enum
-from typing import Union, Optional, Dict, Set
+from threading import Lock
+from typing import Union, Optional, Set, Dict
 
 
 class ItemFlags(Enum):
@@ -19,6 +22,7 @@ class HttpCacheItem:
         self.last_server_update: datetime.datetime = datetime.datetime.now()
         self.flags: Set[ItemFlags] = {ItemFlags.NONE}
         self.generation: Union[None, int] = None
+        self.size: int = 0
 
         self.cache: Union[None, HttpCache] = None
 
@@ -55,11 +59,20 @@ class ReleaseCacheItem:
 
 class HttpCache:
     NOT_FOUND_RESPONSE = "404 Response"
-
-    def __init__(self):
-        self.__items: Dict[str, HttpCacheItem] = {}
+    ReleaseCacheItem = ReleaseCacheItem
+
+    def __init__(self, max_size: int = 128 * 1024 * 1024):
+        # least recently used items are kept at the beginning, every hit moves the item to the end
+        self.__items: Dict[str, HttpCacheItem] = OrderedDict()
+        self.__lock = Lock()
+        self.__max_size = max_size
+        self.__total_size = 0
         self.generation = 0
 
+        self.number_of_hits = 0
+        self.number_of_misses = 0
+        self.number_of_evictions = 0
+
     def __enter__(self):
         return self
 
@@ -67,20 +80,33 @@ class HttpCache:
         self.close()
 
     def __len__(self):
-        return len(self.__items)
+        return len(self.__items) if self.__items else 0
+
+    def __setitem__(self, key: str, value: HttpCacheItem):
+        self.__put(key, value)
 
-    def __setitem__(self, key, value):
-        self.__items.__setitem__(key, value)
+    def __getitem__(self, item: str) -> HttpCacheItem:
+        return self.__items.__getitem__(item)
 
-    def __getitem__(self, item):
-        self.__items.__getitem__(item)
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def total_size(self) -> int:
+        return self.__total_size
 
     def close(self):
-        self.__items.clear()
-        self.__items = None
+        with self.__lock:
+            if self.__items is not None:
+                self.__items.clear()
+            self.__items = None
+            self.__total_size = 0
 
     def clear(self) -> None:
-        self.__items.clear()
+        with self.__lock:
+            self.__items.clear()
+            self.__total_size = 0
 
     def set(self, url: str, change_vector: str, result: str) -> None:
         http_cache_item = HttpCacheItem()
@@ -88,10 +114,17 @@ class HttpCache:
         http_cache_item.payload = result
         http_cache_item.cache = self
         http_cache_item.generation = self.generation
-        self.__items[url] = http_cache_item
+        self.__put(url, http_cache_item)
 
     def get(self, url: str) -> (ReleaseCacheItem, str, str):
-        item = self.__items.get(url, None) if self.__items else None
+        with self.__lock:
+            item = self.__items.get(url, None) if self.__items else None
+            if item is not None:
+                self.__items.move_to_end(url)
+                self.number_of_hits += 1
+            else:
+                self.number_of_misses += 1
+
         if item is not None:
             change_vector = item.change_vector
             response = item.payload
@@ -107,30 +140,28 @@ class HttpCache:
         http_cache_item.flags = (
             {ItemFlags.AGGRESSIVELY_CACHED, ItemFlags.NOT_FOUND} if aggressively_cached else {ItemFlags.NOT_FOUND}
         )
-        self.__items[url] = http_cache_item
+        self.__put(url, http_cache_item)
 
-    class ReleaseCacheItem:
-        def __init__(self, item: HttpCacheItem = None):
-            self.item: Union[None, HttpCacheItem] = item
-            self.__cache_generation = item.cache.generation if item else 0
+    def __put(self, url: str, item: HttpCacheItem) -> None:
+        # sys.getsizeof is O(1) for str and reflects the real memory used by the payload
+        item.size = sys.getsizeof(url) + (sys.getsizeof(item.payload) if item.payload is not None else 0)
 
-        def __enter__(self):
-            return self
+        with self.__lock:
+            if self.__items is None:
+                return
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            pass
+            previous = self.__items.pop(url, None)
+            if previous is not None:
+                self.__total_size -= previous.size
 
-        def not_modified(self) -> None:
-            if self.item is not None:
-                self.item.last_server_update = datetime.datetime.now()
-                self.item.generation = self.__cache_generation
+            if item.size > self.__max_size:
+                # wouldn't fit even into an empty cache
+                return
 
-        @property
-        def age(self) -> datetime.timedelta:
-            if self.item is None:
-                return datetime.timedelta.max
-            return datetime.datetime.now() - self.item.last_server_update
+            self.__items[url] = item
+            self.__total_size += item.size
 
-        @property
-        def might_have_been_modified(self) -> bool:
-            return self.item.generation != self.__cache_generation
+            while self.__total_size > self.__max_size:
+                _, evicted = self.__items.popitem(last=False)
+                self.__total_size -= evicted.size
+                self.number_of_evictions += 1
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union, Any
+
+
+class LatencyHistogram:
+    # upper bounds of the buckets in seconds, slower requests fall into the last, unbounded, bucket
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percentile: float) -> float:
+        # estimated by linear interpolation inside the bucket holding the requested rank
+        if self.count == 0:
+            return 0.0
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count == 0 or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+
+            lower = self.buckets[i - 1] if i > 0 else 0.0
+            upper = self.buckets[i] if i < len(self.buckets) else self.max
+            return min(lower + (upper - lower) * (rank - cumulative) / bucket_count, self.max)
+        return self.max
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "Count": self.count,
+            "Sum": self.sum,
+            "Max": self.max,
+            "P50": self.percentile(50),
+            "P95": self.percentile(95),
+            "P99": self.percentile(99),
+            "Buckets": {str(bound): count for bound, count in zip(self.buckets + ("+Inf",), self.counts)},
+        }
+
+
+class CommandMetrics:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.cache_hits = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "Requests": self.latency.count,
+            "Latency": self.latency.to_json(),
+            "BytesSent": self.bytes_sent,
+            "BytesReceived": self.bytes_received,
+            "Errors": self.errors,
+            "NotModified": self.not_modified,
+            "CacheHits": self.cache_hits,
+            "HedgedRequests": self.hedged_requests,
+            "HedgeWins": self.hedge_wins,
+        }
+
+
+class NodeMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.failovers = 0
+        self.topology_updates = 0
+
+    def to_json(self) -> Dict[str, int]:
+        return {
+            "Requests": self.requests,
+            "Failures": self.failures,
+            "Failovers": self.failovers,
+            "TopologyUpdates": self.topology_updates,
+        }
+
+
+class RequestMetrics:
+    """
+    Metrics of the requests sent by a RequestExecutor, per command type and per node.
+
+    Commands are identified by their class name, nodes by their cluster tag (or url if the node has no tag).
+    Listeners get every recorded event as well, see OpenTelemetryRequestMetrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._commands: Dict[str, CommandMetrics] = {}
+        self._nodes: Dict[str, NodeMetrics] = {}
+        self._listeners: List[Any] = []
+
+    def add_listener(self, listener: Any) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Any) -> None:
+        self._listeners.remove(listener)
+
+    def __command(self, command: str) -> CommandMetrics:
+        metrics = self._commands.get(command, None)
+        if metrics is None:
+            metrics = self._commands[command] = CommandMetrics()
+        return metrics
+
+    def __node(self, node: str) -> NodeMetrics:
+        metrics = self._nodes.get(node, None)
+        if metrics is None:
+            metrics = self._nodes[node] = NodeMetrics()
+        return metrics
+
+    def record_request(
+        self, command: str, node: str, elapsed_seconds: float, status_code: int, bytes_sent: int, bytes_received: int
+    ) -> None:
+        with self._lock:
+            command_metrics = self.__command(command)
+            command_metrics.latency.record(elapsed_seconds)
+            command_metrics.bytes_sent += bytes_sent
+            command_metrics.bytes_received += bytes_received
+            if status_code == 304:
+                command_metrics.not_modified += 1
+            elif status_code >= 500:
+                command_metrics.errors += 1
+            self.__node(node).requests += 1
+
+        for listener in self._listeners:
+            listener.record_request(command, node, elapsed_seconds, status_code, bytes_sent, bytes_received)
+
+    def record_cache_hit(self, command: str) -> None:
+        with self._lock:
+            self.__command(command).cache_hits += 1
+
+        for listener in self._listeners:
+            listener.record_cache_hit(command)
+
+    def record_failure(self, command: str, node: str, responded: bool = False) -> None:
+        # a failure with a response (e.g. 503) is counted as an error of the command by record_request already
+        with self._lock:
+            if not responded:
+                self.__command(command).errors += 1
+            self.__node(node).failures += 1
+
+        for listener in self._listeners:
+            listener.record_failure(command, node)
+
+    def record_hedge(self, command: str, node: str, won: bool) -> None:
+        # node is the one the hedged request was sent to, won tells whether its response was used
+        with self._lock:
+            command_metrics = self.__command(command)
+            command_metrics.hedged_requests += 1
+            if won:
+                command_metrics.hedge_wins += 1
+
+        for listener in self._listeners:
+            listener.record_hedge(command, node, won)
+
+    def record_failover(self, command: str, node: str) -> None:
+        with self._lock:
+            self.__node(node).failovers += 1
+
+        for listener in self._listeners:
+            listener.record_failover(command, node)
+
+    def record_topology_update(self, node: str) -> None:
+        with self._lock:
+            self.__node(node).topology_updates += 1
+
+        for listener in self._listeners:
+            listener.record_topology_update(node)
+
+    def latency_percentile(self, command: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        with self._lock:
+            metrics = self._commands.get(command, None)
+            if metrics is None or metrics.latency.count < min_samples:
+                return None
+            return metrics.latency.percentile(percentile)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._commands.clear()
+            self._nodes.clear()
+
+    def to_json(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                "Commands": {command: metrics.to_json() for command, metrics in self._commands.items()},
+                "Nodes": {node: metrics.to_json() for node, metrics in self._nodes.items()},
+            }
+
+    def to_prometheus(self, prefix: str = "ravendb_client") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            commands = list(self._commands.items())
+            nodes = list(self._nodes.items())
+
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Duration of requests sent to the server",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for command, metrics in commands:
+            histogram = metrics.latency
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{command="{command}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{prefix}_request_duration_seconds_sum{{command="{command}"}} {histogram.sum}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{command="{command}"}} {histogram.count}')
+
+        command_counters: List[Tuple[str, str, str]] = [
+            ("bytes_sent", "bytes_sent", "Bytes of request bodies"),
+            ("bytes_received", "bytes_received", "Bytes of response bodies"),
+            ("request_errors", "errors", "Failed requests"),
+            ("not_modified", "not_modified", "Responses served from the HTTP cache after a 304"),
+            ("cache_hits", "cache_hits", "Requests served from the aggressive cache without contacting the server"),
+            ("hedged_requests", "hedged_requests", "Read requests sent to a second node after the first was slow"),
+            ("hedge_wins", "hedge_wins", "Hedged requests answered before the original request"),
+        ]
+        for name, attribute, description in command_counters:
+            lines.append(f"# HELP {prefix}_{name}_total {description}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for command, metrics in commands:
+                lines.append(f'{prefix}_{name}_total{{command="{command}"}} {getattr(metrics, attribute)}')
+
+        node_counters: List[Tuple[str, str, str]] = [
+            ("node_requests", "requests", "Requests sent to the node"),
+            ("node_failures", "failures", "Requests which couldn't reach the node"),
+            ("node_failovers", "failovers", "Requests retried on another node after failing on this one"),
+            ("node_topology_updates", "topology_updates", "Topology updates fetched from the node"),
+        ]
+        for name, attribute, description in node_counters:
+            lines.append(f"# HELP {prefix}_{name}_total {description}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for node, metrics in nodes:
+                lines.append(f'{prefix}_{name}_total{{node="{node}"}} {getattr(metrics, attribute)}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _import_opentelemetry_metrics():
+    try:
+        from opentelemetry import metrics
+    except ImportError:
+        raise RuntimeError("OpenTelemetry metrics require the 'opentelemetry-api' package to be installed")
+    return metrics
+
+
+class OpenTelemetryRequestMetrics:
+    """
+    RequestMetrics listener recording the events into OpenTelemetry instruments:
+
+        request_executor.metrics.add_listener(OpenTelemetryRequestMetrics())
+    """
+
+    def __init__(self, meter: Optional[Any] = None, prefix: str = "ravendb.client"):
+        if meter is None:
+            meter = _import_opentelemetry_metrics().get_meter("ravendb")
+
+        self._duration = meter.create_histogram(
+            f"{prefix}.request.duration", unit="s", description="Duration of requests sent to the server"
+        )
+        self._bytes_sent = meter.create_counter(f"{prefix}.request.body.size", unit="By")
+        self._bytes_received = meter.create_counter(f"{prefix}.response.body.size", unit="By")
+        self._cache_hits = meter.create_counter(f"{prefix}.cache.hits")
+        self._failures = meter.create_counter(f"{prefix}.node.failures")
+        self._failovers = meter.create_counter(f"{prefix}.node.failovers")
+        self._hedges = meter.create_counter(f"{prefix}.request.hedges")
+        self._topology_updates = meter.create_counter(f"{prefix}.node.topology_updates")
+
+    def record_request(
+        self, command: str, node: str, elapsed_seconds: float, status_code: int, bytes_sent: int, bytes_received: int
+    ) -> None:
+        attributes: Dict[str, Union[str, int]] = {"command": command, "node": node, "status_code": status_code}
+        self._duration.record(elapsed_seconds, attributes)
+        self._bytes_sent.add(bytes_sent, attributes)
+        self._bytes_received.add(bytes_received, attributes)
+
+    def record_cache_hit(self, command: str) -> None:
+        self._cache_hits.add(1, {"command": command})
+
+    def record_failure(self, command: str, node: str) -> None:
+        self._failures.add(1, {"command": command, "node": node})
+
+    def record_hedge(self, command: str, node: str, won: bool) -> None:
+        self._hedges.add(1, {"command": command, "node": node, "won": won})
+
+    def record_failover(self, command: str, node: str) -> None:
+        self._failovers.add(1, {"command": command, "node": node})
+
+    def record_topology_update(self, node: str) -> None:
+        self._topology_updates.add(1, {"node": node})
@@ -34,6 +34,8 @@ class ReadBalanceBehavior(Enum):
     NONE = "None"
     ROUND_ROBIN = "RoundRobin"
     FASTEST_NODE = "FastestNode"
+    # client side only - reads go to the node with the lowest moving average of response times
+    LEAST_LATENCY = "LeastLatency"
 
     def __str__(self):
         return self.value
@@ -60,6 +62,14 @@ class AggressiveCacheMode(Enum):
     DO_NOT_TRACK_CHANGES = "DoNotTrackChanges"
 
 
+class HttpCompressionAlgorithm(Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    def __str__(self):
+        return self.value
+
+
 class AggressiveCacheOptions:
     def __init__(self, duration: datetime.timedelta, mode: AggressiveCacheMode):
         self.duration = duration
@@ -4,7 +4,7 @@ import datetime
 import http
 from http import HTTPStatus
 from abc import abstractmethod
-from typing import Union, Optional, Callable, Generic, TypeVar, Dict, Type
+from typing import Union, Optional, Callable, Generic, TypeVar, Dict, Type, TYPE_CHECKING
 from enum import Enum
 
 import requests
@@ -13,6 +13,9 @@ from ravendb.http.http_cache import HttpCache
 from ravendb.http.misc import ResponseDisposeHandling
 from ravendb.http.server_node import ServerNode
 
+if TYPE_CHECKING:
+    from ravendb.http.topology import CurrentIndexAndNode
+
 
 class RavenCommandResponseType(Enum):
     EMPTY = "Empty"
@@ -51,6 +54,10 @@ class RavenCommand(Generic[_T_Result]):
         self._selected_node_tag: Optional[str] = None
         self._number_of_attempts: Optional[int] = None
         self.failed_nodes: Dict[ServerNode, Exception] = {}
+        # the response was sent for an identical concurrent request, see DocumentConventions.coalesce_read_requests
+        self.coalesced = False
+        # the node whose response was used when the request was hedged, see DocumentConventions.hedged_reads_percentile
+        self.hedged_node: Optional[CurrentIndexAndNode] = None
         self.on_response_failure: Callable[[requests.Response], None] = lambda resp: None
 
     @abstractmethod
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import inspect
 import json
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait, ALL_COMPLETED
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import uuid
-from threading import Timer, Semaphore, Lock
+from threading import Timer, Semaphore, Lock, local
 
 import requests
 from copy import copy
@@ -21,16 +25,27 @@ from ravendb.exceptions.exceptions import (
     AuthorizationException,
     RequestedNodeUnavailableException,
 )
+from ravendb.documents.operations.configuration.definitions import ClientConfiguration
 from ravendb.documents.operations.configuration.operations import GetClientConfigurationOperation
 from ravendb.exceptions.exception_dispatcher import ExceptionDispatcher
 from ravendb.exceptions.raven_exceptions import ClientVersionMismatchException
 
 
-from ravendb.http.http_cache import HttpCache
-from ravendb.http.misc import ReadBalanceBehavior, ResponseDisposeHandling, LoadBalanceBehavior, Broadcast
+from ravendb.http.connection_pool import HttpPoolStatistics, RavenHttpAdapter
+from ravendb.http.http_cache import HttpCache, ItemFlags
+from ravendb.http.metrics import RequestMetrics
+from ravendb.http.misc import (
+    ReadBalanceBehavior,
+    ResponseDisposeHandling,
+    LoadBalanceBehavior,
+    Broadcast,
+    AggressiveCacheOptions,
+)
 from ravendb.http.raven_command import RavenCommand, RavenCommandResponseType
 from ravendb.http.server_node import ServerNode
+from ravendb.http.single_flight import SingleFlight
 from ravendb.http.topology import Topology, NodeStatus, NodeSelector, CurrentIndexAndNode, UpdateTopologyParameters
+from ravendb.http.topology_local_cache import DatabaseTopologyLocalCache
 from ravendb.serverwide.commands import GetDatabaseTopologyCommand, GetClusterTopologyCommand
 
 from http import HTTPStatus
@@ -48,6 +63,10 @@ class RequestExecutor:
     __INITIAL_TOPOLOGY_ETAG = -2
     __GLOBAL_APPLICATION_IDENTIFIER = uuid.uuid4()
     CLIENT_VERSION = "5.2.6"
+    # latency percentiles of commands with fewer samples aren't reliable enough to hedge on
+    _HEDGING_MIN_SAMPLES = 20
+    # spreads the background topology refreshes of many clients started together, as a fraction of the interval
+    _TOPOLOGY_REFRESH_JITTER = 0.2
     logger = logging.getLogger("request_executor")
 
     # todo: initializer should take also cryptography certificates
@@ -64,7 +83,8 @@ class RequestExecutor:
         self.conventions = copy(conventions)
         self._node_selector: NodeSelector = None
         self.__default_timeout: datetime.timedelta = conventions.request_timeout
-        self._cache: HttpCache = HttpCache()
+        self._cache: HttpCache = HttpCache(conventions.max_http_cache_size)
+        self.__aggressive_caching = local()
 
         self.__certificate_path = certificate_path
         self.__trust_store_path = trust_store_path
@@ -87,11 +107,17 @@ class RequestExecutor:
 
         self._topology_etag: Union[None, int] = None
         self._client_configuration_etag: Union[None, int] = None
+        self._client_configuration: Optional[ClientConfiguration] = None
+        self.__topology_cache_path: Optional[str] = None
         self._disable_topology_updates: Union[None, bool] = None
         self._disable_client_configuration_updates: Union[None, bool] = None
         self._last_server_version: Union[None, str] = None
 
         self.__http_session: Union[None, requests.Session] = None
+        self.__http_pool_statistics = HttpPoolStatistics()
+        self._metrics = RequestMetrics()
+        self._single_flight = SingleFlight()
+        self.__hedged_reads_executor: Optional[ThreadPoolExecutor] = None
 
         self.first_broadcast_attempt_timeout: Union[None, datetime.timedelta] = (
             conventions.first_broadcast_attempt_timeout
@@ -129,6 +155,8 @@ class RequestExecutor:
             self.__update_topology_timer.cancel()
 
         self._dispose_all_failed_nodes_timers()
+        if self.__hedged_reads_executor is not None:
+            self.__hedged_reads_executor.shutdown(wait=False)
         if self.__http_session is not None:
             self.__http_session.close()
 
@@ -173,12 +201,60 @@ class RequestExecutor:
         session = requests.session()
         session.cert = self.__certificate_path
         session.verify = self.__trust_store_path if self.__trust_store_path else True
+
+        adapter = RavenHttpAdapter(
+            self.__http_pool_statistics,
+            self.conventions.http_pool_size_per_node,
+            self.conventions.http_pool_block,
+            self.conventions.http_pool_idle_timeout,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         return session
 
+    @property
+    def http_pool_statistics(self) -> HttpPoolStatistics:
+        return self.__http_pool_statistics
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        return self._metrics
+
+    @property
+    def number_of_coalesced_requests(self) -> int:
+        # requests counted by number_of_server_requests, which got the response of an identical in-flight request
+        return self._single_flight.number_of_shared_results
+
+    def _pre_warm_http_connections(self) -> None:
+        count = self.conventions.http_pool_pre_warm_connections
+        if not count or self._node_selector is None:
+            return
+
+        session = self.http_session
+
+        def __pre_warm(node: ServerNode) -> None:
+            try:
+                session.get_adapter(node.url).pre_warm(session, node.url, count)
+            except Exception as e:
+                # the node will be connected by the first request sent to it
+                self.logger.info(f"Couldn't pre-warm HTTP connections to {node.url}", exc_info=e)
+
+        for node in self._node_selector.topology.nodes:
+            self._thread_pool_executor.submit(__pre_warm, node)
+
     @property
     def cache(self) -> HttpCache:
         return self._cache
 
+    @property
+    def aggressive_caching(self) -> Optional[AggressiveCacheOptions]:
+        # set per thread, so aggressive caching scope opened in one thread doesn't leak into the others
+        return getattr(self.__aggressive_caching, "value", None)
+
+    @aggressive_caching.setter
+    def aggressive_caching(self, value: Optional[AggressiveCacheOptions]):
+        self.__aggressive_caching.value = value
+
     @property
     def topology_nodes(self) -> List[ServerNode]:
         return self.topology.nodes if self.topology else None
@@ -218,6 +294,11 @@ class RequestExecutor:
 
         return self._node_selector.get_fastest_node()
 
+    def get_least_latency_node(self) -> CurrentIndexAndNode:
+        self._ensure_node_selector()
+
+        return self._node_selector.get_least_latency_node()
+
     def get_node_by_session_id(self, session_id: int = None) -> CurrentIndexAndNode:
         self._ensure_node_selector()
 
@@ -345,6 +426,8 @@ class RequestExecutor:
 
                 self.conventions.update_from(result.configuration)
                 self.client_configuration_etag = result.etag
+                self._client_configuration = result.configuration
+                self._persist_topology()
             finally:
                 self._disable_client_configuration_updates = old_disable_client_configuration_updates
                 self.__update_client_configuration_semaphore.release()
@@ -368,7 +451,7 @@ class RequestExecutor:
         def __supply_async():
             # prevent double topology updates if execution takes too much time
             # --> in cases with transient issues
-            lock_taken = self.__update_database_topology_semaphore.acquire(timeout=parameters.timeout_in_ms)
+            lock_taken = self.__update_database_topology_semaphore.acquire(timeout=parameters.timeout_in_ms / 1000)
             if not lock_taken:
                 return False
 
@@ -388,13 +471,16 @@ class RequestExecutor:
 
                     if self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
                         self._node_selector.schedule_speed_test()
+                    self._persist_topology()
 
                 elif self._node_selector.on_update_topology(topology, parameters.force_update):
                     self._dispose_all_failed_nodes_timers()
                     if self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
                         self._node_selector.schedule_speed_test()
+                    self._persist_topology()
 
                 self._topology_etag = self._node_selector.topology.etag
+                self._metrics.record_topology_update(self._node_metrics_name(parameters.node))
 
                 self._on_topology_updated_invoke(topology)
             except Exception as e:
@@ -412,6 +498,30 @@ class RequestExecutor:
         errors: List[Tuple[str, Exception]] = []
 
         def __run(errors: list):
+            if self.__try_load_cached_topology(initial_urls):
+                # requests go out to the cached nodes right away, the topology is validated in the background
+                self.__initialize_update_topology_timer()
+                self._log_refresh_failure(self._thread_pool_executor.submit(__validate_cached_topology, errors))
+                self._pre_warm_http_connections()
+                return
+
+            __update_from_initial_urls(errors)
+
+        def __validate_cached_topology(errors: list):
+            try:
+                update_parameters = UpdateTopologyParameters(self._node_selector.get_preferred_node().current_node)
+                update_parameters.timeout_in_ms = 0x7FFFFFFF
+                update_parameters.force_update = True
+                update_parameters.debug_tag = "cached-topology-validation"
+                update_parameters.application_identifier = application_identifier
+                self.update_topology_async(update_parameters).result()
+                self.__topology_taken_from_node = update_parameters.node
+            except Exception as e:
+                # the cached nodes may be gone, fall back to the urls we were given
+                self.logger.info("Couldn't validate the cached topology", exc_info=e)
+                __update_from_initial_urls(errors)
+
+        def __update_from_initial_urls(errors: list):
             for url in initial_urls:
                 try:
                     server_node = ServerNode(url, self._database_name)
@@ -424,6 +534,7 @@ class RequestExecutor:
                     self.__initialize_update_topology_timer()
 
                     self.__topology_taken_from_node = server_node
+                    self._pre_warm_http_connections()
                     return
                 except Exception as e:
                     if isinstance(e.__cause__, AuthorizationException):
@@ -456,6 +567,42 @@ class RequestExecutor:
 
         return self._thread_pool_executor.submit(__run, errors)
 
+    def __try_load_cached_topology(self, initial_urls: List[str]) -> bool:
+        if self.conventions.topology_cache_location is None or self._database_name is None:
+            return False
+
+        self.__topology_cache_path = DatabaseTopologyLocalCache.get_path(
+            self.conventions.topology_cache_location, self._database_name, initial_urls
+        )
+        if self._node_selector is not None:
+            return False
+
+        cached = DatabaseTopologyLocalCache.try_load(self.__topology_cache_path)
+        if cached is None:
+            return False
+
+        if cached.client_configuration is not None and cached.client_configuration.configuration is not None:
+            self.conventions.update_from(cached.client_configuration.configuration)
+            self._client_configuration_etag = cached.client_configuration.etag
+            self._client_configuration = cached.client_configuration.configuration
+
+        self._node_selector = NodeSelector(cached.topology, self._thread_pool_executor)
+        self._topology_etag = cached.topology.etag
+        if self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
+            self._node_selector.schedule_speed_test()
+        return True
+
+    def _persist_topology(self) -> None:
+        if self.__topology_cache_path is None or self._node_selector is None:
+            return
+
+        DatabaseTopologyLocalCache.try_save(
+            self.__topology_cache_path,
+            self._node_selector.topology,
+            self._client_configuration_etag,
+            self._client_configuration,
+        )
+
     @staticmethod
     def validate_urls(initial_urls: List[str]) -> List[str]:
         # todo: implement validation
@@ -469,7 +616,19 @@ class RequestExecutor:
             if self.__update_topology_timer is not None:
                 return
 
-            self.__update_topology_timer = Timer(60, self.__update_topology_callback)
+            self.__schedule_topology_refresh()
+
+    def __schedule_topology_refresh(self) -> None:
+        if self._disposed or self.conventions.topology_refresh_interval is None:
+            return
+
+        interval = self.conventions.topology_refresh_interval.total_seconds()
+        jitter = interval * self._TOPOLOGY_REFRESH_JITTER
+        self.__update_topology_timer = Timer(
+            interval + random.uniform(-jitter, jitter), self.__update_topology_callback
+        )
+        self.__update_topology_timer.daemon = True
+        self.__update_topology_timer.start()
 
     def _dispose_all_failed_nodes_timers(self) -> None:
         for node, status in self.__failed_nodes_timers.items():
@@ -506,30 +665,28 @@ class RequestExecutor:
                 if topology.etag:
                     command.failover_topology_etag = topology.etag
 
-        request = self.__create_request(chosen_node, command)
-        url = request.url
+        request = self._create_request(chosen_node, command)
 
         if not request:
             return
 
-        if ret_request:
-            request_ref = request
-
-        if not request:
-            return
+        url = request.url
 
         no_caching = session_info.no_caching if session_info else False
 
         cached_item, change_vector, cached_value = self._get_from_cache(command, not no_caching, url)
-        # todo: if change_vector exists try get from cache - aggressive caching
         with cached_item:
-            # todo: try get from cache
+            if change_vector is not None and self._try_get_from_cache(command, cached_item, cached_value):
+                self._metrics.record_cache_hit(type(command).__name__)
+                return
+
             self._set_request_headers(session_info, change_vector, request)
 
             command.number_of_attempts = command.number_of_attempts + 1
             attempt_num = command.number_of_attempts
             for func in self._on_before_request:
                 func(BeforeRequestEventArgs(self._database_name, url, request, attempt_num))
+            start = time.perf_counter()
             response = self._send_request_to_server(
                 chosen_node, node_index, command, should_retry, session_info, request, url
             )
@@ -537,7 +694,14 @@ class RequestExecutor:
             if response is None:
                 return
 
-            refresh_tasks = self._refresh_if_needed(chosen_node, response)
+            elapsed_seconds = time.perf_counter() - start
+            if command.hedged_node is not None:
+                # the response times of both nodes were recorded when the requests completed
+                chosen_node, node_index = command.hedged_node.current_node, command.hedged_node.current_index
+            else:
+                self._record_response_time(chosen_node, node_index, response, elapsed_seconds)
+
+            self._refresh_if_needed(chosen_node, response)
 
             command.status_code = response.status_code
             response_dispose = ResponseDisposeHandling.AUTOMATIC
@@ -567,18 +731,55 @@ class RequestExecutor:
                         self._throw_failed_to_contact_all_nodes(command, request)
                     return  # we either handled this already in the unsuccessful response or we are throwing
                 self._on_succeed_request_invoke(self._database_name, url, response, request, attempt_num)
-                response_dispose = command.process_response(self._cache, response, url)
+                # the response shared by coalesced requests is cached once, by the request which sent it
+                response_dispose = command.process_response(None if command.coalesced else self._cache, response, url)
                 self._last_returned_response = datetime.datetime.utcnow()
             finally:
+                self._record_request_metrics(chosen_node, command, request, response, elapsed_seconds)
                 if response_dispose == ResponseDisposeHandling.AUTOMATIC:
                     response.close()
-                if len(refresh_tasks) > 0:
-                    try:
-                        wait(refresh_tasks, return_when=ALL_COMPLETED)
-                    except:
-                        raise
+
+    def _record_response_time(
+        self, chosen_node: ServerNode, node_index: Optional[int], response: requests.Response, elapsed_seconds: float
+    ) -> None:
+        # failures are recorded by NodeSelector.on_failed_request
+        if (
+            node_index is not None
+            and self._node_selector is not None
+            and response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+        ):
+            self._node_selector.record_response_time(node_index, chosen_node, elapsed_seconds)
+
+    def _record_request_metrics(
+        self,
+        chosen_node: ServerNode,
+        command: RavenCommand,
+        request: requests.Request,
+        response: requests.Response,
+        elapsed_seconds: float,
+    ) -> None:
+        content_length = response.headers.get("Content-Length", None)
+        if content_length is not None:
+            bytes_received = int(content_length)
+        else:
+            # chunked response, known only once read
+            bytes_received = len(response._content) if isinstance(response._content, bytes) else 0
+
+        self._metrics.record_request(
+            type(command).__name__,
+            self._node_metrics_name(chosen_node),
+            elapsed_seconds,
+            response.status_code,
+            len(request.data) if isinstance(request.data, (str, bytes)) else 0,
+            bytes_received,
+        )
+
+    @staticmethod
+    def _node_metrics_name(node: ServerNode) -> str:
+        return node.cluster_tag or node.url
 
     def _refresh_if_needed(self, chosen_node: ServerNode, response: requests.Response) -> List[Future]:
+        # the refreshes run in the background, requests never wait for them
         refresh_topology = response.headers.get(constants.Headers.REFRESH_TOPOLOGY, False)
         refresh_client_configuration = response.headers.get(constants.Headers.REFRESH_CLIENT_CONFIGURATION, False)
 
@@ -593,9 +794,11 @@ class RequestExecutor:
             update_parameters.timeout_in_ms = 0
             update_parameters.debug_tag = "refresh-topology-header"
             refresh_task = self.update_topology_async(update_parameters)
+            self._log_refresh_failure(refresh_task)
 
         if refresh_client_configuration:
             refresh_client_configuration_task = self._update_client_configuration_async(chosen_node)
+            self._log_refresh_failure(refresh_client_configuration_task)
 
         return [refresh_task, refresh_client_configuration_task]
 
@@ -614,11 +817,11 @@ class RequestExecutor:
             timeout = command.timeout if command.timeout else self.__default_timeout
 
             if not timeout:
-                return self.__send(chosen_node, command, session_info, request)
+                return self.__send(chosen_node, node_index, command, session_info, request)
 
             else:
                 try:
-                    return self.__send(chosen_node, command, session_info, request)
+                    return self.__send(chosen_node, node_index, command, session_info, request)
                 except requests.Timeout as t:
                     if not should_retry:
                         if command.failed_nodes is None:
@@ -644,14 +847,27 @@ class RequestExecutor:
             return None
 
     def __send(
-        self, chosen_node: ServerNode, command: RavenCommand, session_info: SessionInfo, request: requests.Request
+        self,
+        chosen_node: ServerNode,
+        node_index: Optional[int],
+        command: RavenCommand,
+        session_info: SessionInfo,
+        request: requests.Request,
     ) -> requests.Response:
         response: Optional[requests.Response] = None
+        command.coalesced = False
+        command.hedged_node = None
 
         if self.should_execute_on_all(chosen_node, command):
             response = self.__execute_on_all_to_figure_out_the_fastest(chosen_node, command)
         else:
-            response = command.send(self.http_session, request)
+            coalescing_key = self._coalescing_key(command, request)
+            if coalescing_key is None:
+                response, command.hedged_node = self._send_with_hedging(chosen_node, node_index, command, request)
+            else:
+                (response, command.hedged_node), command.coalesced = self._single_flight.do(
+                    coalescing_key, lambda: self._send_with_hedging(chosen_node, node_index, command, request)
+                )
 
         # PERF: The reason to avoid rechecking every time is that servers wont change so rapidly
         #       and therefore we dismish its cost by orders of magnitude just doing it
@@ -659,7 +875,7 @@ class RequestExecutor:
         #       here mainly because the idea is to have a lax mechanism to recheck that is at least
         #       orders of magnitude faster than currently.
         if chosen_node.should_update_server_version():
-            server_version = self.__try_get_server_version(response)
+            server_version = self._try_get_server_version(response)
             if server_version is not None:
                 chosen_node.update_server_version(server_version)
 
@@ -679,6 +895,117 @@ class RequestExecutor:
 
         return response
 
+    def _hedging_delay(self, node_index: Optional[int], command: RavenCommand) -> Optional[float]:
+        percentile = self.conventions.hedged_reads_percentile
+        if (
+            percentile is None
+            or node_index is None
+            or self._node_selector is None
+            or command.selected_node_tag
+            or not command.is_read_request()
+            or command.response_type != RavenCommandResponseType.OBJECT
+            or type(command).send is not RavenCommand.send
+        ):
+            return None
+
+        latency = self._metrics.latency_percentile(type(command).__name__, percentile, self._HEDGING_MIN_SAMPLES)
+        if latency is None:
+            return None
+        return max(latency, self.conventions.hedged_reads_min_delay.total_seconds())
+
+    @property
+    def _hedged_reads_executor(self) -> ThreadPoolExecutor:
+        # dedicated threads - a busy shared pool would delay the requests being hedged
+        with self.__synchronized_lock:
+            if self.__hedged_reads_executor is None:
+                self.__hedged_reads_executor = ThreadPoolExecutor(
+                    max_workers=2 * self.conventions.http_pool_size_per_node, thread_name_prefix="hedged-read"
+                )
+            return self.__hedged_reads_executor
+
+    def _send_with_hedging(
+        self, chosen_node: ServerNode, node_index: Optional[int], command: RavenCommand, request: requests.Request
+    ) -> Tuple[requests.Response, Optional[CurrentIndexAndNode]]:
+        # returns the response and, if the request was hedged, the node which sent it
+        delay = self._hedging_delay(node_index, command)
+        if delay is None:
+            return command.send(self.http_session, request), None
+
+        executor = self._hedged_reads_executor
+        start = time.perf_counter()
+        primary = executor.submit(command.send, self.http_session, request)
+        try:
+            return primary.result(timeout=delay), None
+        except FutureTimeoutError:
+            pass
+
+        hedge_node = self._node_selector.get_hedge_node(node_index)
+        if hedge_node is None:
+            return primary.result(), None
+
+        hedge_request = self._create_request(hedge_node.current_node, command)
+        for name, value in request.headers.items():
+            hedge_request.headers.setdefault(name, value)
+        hedge = executor.submit(command.send, self.http_session, hedge_request)
+
+        nodes = {primary: CurrentIndexAndNode(node_index, chosen_node), hedge: hedge_node}
+
+        def __on_completed(future: Future) -> None:
+            # response times of both nodes feed the node selector, even of the one whose response wasn't used
+            node = nodes[future]
+            if future.exception() is None and future.result().status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                elapsed_seconds = time.perf_counter() - (start if future is primary else start + delay)
+                self._node_selector.record_response_time(node.current_index, node.current_node, elapsed_seconds)
+
+        primary.add_done_callback(__on_completed)
+        hedge.add_done_callback(__on_completed)
+
+        winner = None
+        pending = {primary, hedge}
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                    winner = future
+                    break
+
+        if winner is None:
+            # neither node answered, handle the failure of the chosen node as if there was no hedging
+            winner = primary
+
+        for future in (primary, hedge):
+            if future is not winner:
+                # requests can't be aborted in flight, the losing response is just closed
+                future.add_done_callback(lambda f: f.result().close() if f.exception() is None else None)
+
+        self._metrics.record_hedge(
+            type(command).__name__, self._node_metrics_name(hedge_node.current_node), winner is hedge
+        )
+        response = winner.result()
+        return response, nodes[winner]
+
+    def _coalescing_key(self, command: RavenCommand, request: requests.Request) -> Optional[Tuple]:
+        # only fully read responses can be shared, streamed and custom sent requests are never coalesced
+        if (
+            not self.conventions.coalesce_read_requests
+            or not command.is_read_request()
+            or command.response_type != RavenCommandResponseType.OBJECT
+            or type(command).send is not RavenCommand.send
+            or request.files
+        ):
+            return None
+
+        if not request.data:
+            body_hash = None
+        elif isinstance(request.data, (str, bytes)):
+            data = request.data.encode("utf-8") if isinstance(request.data, str) else request.data
+            body_hash = hashlib.sha1(data).hexdigest()
+        else:
+            return None
+
+        headers = tuple(sorted(request.headers.items())) if request.headers else ()
+        return request.method, request.url, body_hash, headers
+
     def choose_node_for_request(self, cmd: RavenCommand, session_info: SessionInfo) -> CurrentIndexAndNode:
         # When we disable topology updates we cannot rely on the node tag,
         # Because the initial topology will not have them
@@ -690,7 +1017,7 @@ class RequestExecutor:
             if session_info is not None and session_info.can_use_load_balance_behavior:
                 return self._node_selector.get_node_by_session_id(session_info.session_id)
 
-        if not cmd.is_read_request:
+        if not cmd.is_read_request():
             return self._node_selector.get_preferred_node()
 
         if self.conventions.read_balance_behavior == ReadBalanceBehavior.NONE:
@@ -699,19 +1026,21 @@ class RequestExecutor:
             return self._node_selector.get_node_by_session_id(session_info.session_id if session_info else 0)
         elif self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
             return self._node_selector.get_fastest_node()
+        elif self.conventions.read_balance_behavior == ReadBalanceBehavior.LEAST_LATENCY:
+            return self._node_selector.get_least_latency_node()
         raise RuntimeError()
 
     def __unlikely_execute(
         self, command: RavenCommand, topology_update: Union[None, Future[None]], session_info: SessionInfo
     ) -> None:
-        self.__wait_for_topology_update(topology_update)
+        self._wait_for_topology_update(topology_update)
 
         current_index_and_node = self.choose_node_for_request(command, session_info)
         self.execute(
             current_index_and_node.current_node, current_index_and_node.current_index, command, True, session_info
         )
 
-    def __wait_for_topology_update(self, topology_update: Future[None]) -> None:
+    def _wait_for_topology_update(self, topology_update: Future[None]) -> None:
         try:
             if topology_update is None or topology_update.exception():
                 with self.__synchronized_lock:
@@ -733,10 +1062,6 @@ class RequestExecutor:
             raise e
 
     def __update_topology_callback(self) -> None:
-        time = datetime.datetime.now()
-        if (time - self._last_returned_response.time) <= datetime.timedelta(minutes=5):
-            return
-
         try:
             selector = self._node_selector
             if selector is None:
@@ -746,16 +1071,36 @@ class RequestExecutor:
         except Exception as e:
             self.logger.info("Couldn't get preferred node Topology from _updateTopologyTimer", exc_info=e)
             return
+        finally:
+            self.__schedule_topology_refresh()
 
         update_parameters = UpdateTopologyParameters(server_node)
         update_parameters.timeout_in_ms = 0
         update_parameters.debug_tag = "timer-callback"
 
         try:
-            self.update_topology_async(update_parameters)
+            self._log_refresh_failure(self.update_topology_async(update_parameters))
         except Exception as e:
             self.logger.info("Couldn't update topology from __update_topology_timer", exc_info=e)
 
+    def _log_refresh_failure(self, refresh_task: Future) -> None:
+        # nobody waits for background refreshes, their failures would go unnoticed otherwise
+        def __done(task: Future) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                self.logger.info(
+                    "Background topology or client configuration refresh failed", exc_info=task.exception()
+                )
+
+        refresh_task.add_done_callback(__done)
+
+    def on_topology_change_notification(self, url: str, database: str) -> None:
+        # pushed by the server through the Changes API, the node sending it already knows the new topology
+        update_parameters = UpdateTopologyParameters(ServerNode(url, database))
+        update_parameters.timeout_in_ms = 0
+        update_parameters.force_update = True
+        update_parameters.debug_tag = "topology-change-notification"
+        self._log_refresh_failure(self.update_topology_async(update_parameters))
+
     def _set_request_headers(
         self, session_info: SessionInfo, cached_change_vector: Union[None, str], request: requests.Request
     ) -> None:
@@ -776,13 +1121,34 @@ class RequestExecutor:
         if not request.headers.get(constants.Headers.CLIENT_VERSION):
             request.headers[constants.Headers.CLIENT_VERSION] = RequestExecutor.CLIENT_VERSION
 
+    def _try_get_from_cache(
+        self, command: RavenCommand, cached_item: HttpCache.ReleaseCacheItem, cached_value: Optional[str]
+    ) -> bool:
+        aggressive_cache_options = self.aggressive_caching
+        if (
+            aggressive_cache_options is None
+            or cached_item.age >= aggressive_cache_options.duration
+            or cached_item.might_have_been_modified
+            or not command.can_cache_aggressively
+        ):
+            return False
+
+        if ItemFlags.NOT_FOUND in cached_item.item.flags:
+            # if this is a cached delete response, we only respond from cache if the item was aggressively cached
+            if ItemFlags.AGGRESSIVELY_CACHED not in cached_item.item.flags:
+                return False
+            command.set_response(None, True)
+        else:
+            command.set_response(cached_value, True)
+        return True
+
     def _get_from_cache(
         self, command: RavenCommand, use_cache: bool, url: str
     ) -> Tuple[HttpCache.ReleaseCacheItem, Optional[str], Optional[str]]:
         if (
             use_cache
             and command.can_cache
-            and command.is_read_request
+            and command.is_read_request()
             and command.response_type == RavenCommandResponseType.OBJECT
         ):
             return self._cache.get(url)
@@ -790,7 +1156,7 @@ class RequestExecutor:
         return HttpCache.ReleaseCacheItem(), None, None
 
     @staticmethod
-    def __try_get_server_version(response: requests.Response) -> Union[None, str]:
+    def _try_get_server_version(response: requests.Response) -> Union[None, str]:
         server_version_header = response.headers.get(constants.Headers.SERVER_VERSION)
 
         if server_version_header is not None:
@@ -804,7 +1170,7 @@ class RequestExecutor:
             )
 
         if len(command.failed_nodes) == 1:
-            raise command.failed_nodes.popitem()
+            raise command.failed_nodes.popitem()[1]
 
         message = (
             f"Tried to send {command._result_class.__name__} request via {request.method}"
@@ -867,7 +1233,7 @@ class RequestExecutor:
                 single_element_list_number_failed_tasks: List[int],
             ) -> (RequestExecutor.IndexAndResponse, int):
                 try:
-                    request, str_ref = self.__create_request(nodes[task_number], command)
+                    request = self._create_request(nodes[task_number], command)
                     self._set_request_headers(None, None, request)
                     return self.IndexAndResponse(task_number, command.send(self.http_session, request))
                 except Exception as e:
@@ -880,7 +1246,7 @@ class RequestExecutor:
             if nodes[i].cluster_tag == chosen_node.cluster_tag:
                 preferred_task = task
             else:
-                task.add_done_callback(lambda result: result.response.close())
+                task.add_done_callback(lambda t: t.exception() is None and t.result().response.close())
 
             tasks[i] = task
 
@@ -902,8 +1268,11 @@ class RequestExecutor:
 
         return preferred_task.result().response
 
-    def __create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
+    def _create_request(self, node: ServerNode, command: RavenCommand) -> Optional[requests.Request]:
         request = command.create_request(node)
+        if request is None:
+            return None
+
         # todo: optimize that if - look for the way to make less ifs each time
         if request.data and not isinstance(request.data, str) and not inspect.isgenerator(request.data):
             request.data = json.dumps(request.data, default=self.conventions.json_default_method)
@@ -1003,7 +1372,7 @@ class RequestExecutor:
         should_retry: bool,
     ) -> bool:
         if response.status_code == HTTPStatus.NOT_FOUND:
-            self._cache.set_not_found(url, False)  # todo : check if aggressively cached, don't just pass False
+            self._cache.set_not_found(url, self.aggressive_caching is not None)
             if command.response_type == RavenCommandResponseType.EMPTY:
                 return True
             elif command.response_type == RavenCommandResponseType.OBJECT:
@@ -1125,16 +1494,16 @@ class RequestExecutor:
 
             state.command.timeout = self.second_broadcast_attempt_timeout
 
-            # todo: aggressive caching options
+            aggressive_cache_options = self.aggressive_caching
 
             def __run_async() -> None:
-                # todo: aggressive caching options
+                old_value = self.aggressive_caching
+                self.aggressive_caching = aggressive_cache_options
                 try:
                     request = self.execute(state.node, None, state.command, False, session_info, True)
                     state.request = request
                 finally:
-                    # todo: aggressive_caching
-                    pass
+                    self.aggressive_caching = old_value
 
             task = self._thread_pool_executor.submit(__run_async)
             tasks[task] = state
@@ -1154,9 +1523,10 @@ class RequestExecutor:
         if command.failed_nodes is None:
             command.failed_nodes = {}
 
-        return (
-            False  # todo: command.failed_nodes[chosen_node] = self.__read_exception_from_server(request, response, e)
-        )
+        failure = self.__read_exception_from_server(request, response, e)
+        command.failed_nodes[chosen_node] = failure
+        node_name = self._node_metrics_name(chosen_node)
+        self._metrics.record_failure(type(command).__name__, node_name, response is not None)
 
         if node_index is None:
             # We executed request over a node not in the topology. This means no failover...
@@ -1179,13 +1549,16 @@ class RequestExecutor:
 
         index_node_and_etag = self._node_selector.get_preferred_node_with_topology()
         if command.failover_topology_etag != self.topology_etag:
+            # failures on the nodes of another topology are forgotten, the one which just happened isn't
             command.failed_nodes.clear()
+            command.failed_nodes[chosen_node] = failure
             command.failover_topology_etag = self.topology_etag
 
         if index_node_and_etag.current_node in command.failed_nodes:
             return False
 
-        self.__on_failed_request_invoke(url, e, request, response)
+        self.__on_failed_request_invoke_details(url, e, request, response)
+        self._metrics.record_failover(type(command).__name__, node_name)
 
         self.execute(
             index_node_and_etag.current_node, index_node_and_etag.current_index, command, should_retry, session_info
@@ -1222,10 +1595,15 @@ class RequestExecutor:
 
                 return ExceptionDispatcher.get(exception_schema, response.status_code, e)
 
+        if e is None:
+            return UnsuccessfulRequestException(
+                f"Request to {request.url} ({request.method}) failed with status code {response.status_code}"
+            )
+
         exception_schema = ExceptionDispatcher.ExceptionSchema(
             request.url,
             e.__class__.__qualname__,
-            e.args[0],
+            str(e),
             f"An exception occurred while contacting {request.url}.{os.linesep}{str(e)}",
         )
         return ExceptionDispatcher.get(exception_schema, HTTPStatus.SERVICE_UNAVAILABLE, e)
@@ -1241,7 +1619,7 @@ class RequestExecutor:
 
     def _ensure_node_selector(self) -> None:
         if not self._disable_topology_updates:
-            self.__wait_for_topology_update(self._first_topology_update_task)
+            self._wait_for_topology_update(self._first_topology_update_task)
 
         if self._node_selector is None:
             topology = Topology(self.topology_etag, self.topology_nodes)
@@ -1332,7 +1710,7 @@ class ClusterRequestExecutor(RequestExecutor):
             return returned
 
         def __supply_async():
-            lock_taken = self.__cluster_topology_semaphore.acquire(timeout=parameters.timeout_in_ms * 1000)
+            lock_taken = self.__cluster_topology_semaphore.acquire(timeout=parameters.timeout_in_ms / 1000)
             if not lock_taken:
                 return False
             try:
@@ -1362,6 +1740,7 @@ class ClusterRequestExecutor(RequestExecutor):
                     if self.conventions.read_balance_behavior == ReadBalanceBehavior.FASTEST_NODE:
                         self._node_selector.schedule_speed_test()
 
+                self._metrics.record_topology_update(self._node_metrics_name(parameters.node))
                 self._on_topology_updated_invoke(new_topology)
             except BaseException as e:
                 if not self._disposed:
@@ -30,7 +30,7 @@ class ServerNode:
         self.__last_server_version: str = None
 
     def __eq__(self, other) -> bool:
-        if self == other:
+        if self is other:
             return True
         if other is None or type(self) != type(other):
             return False
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """
+    Runs an action once for all the threads asking for the same key at the same time.
+
+    The first caller (the leader) runs the action, callers arriving while it is in flight wait for it
+    and get the same result, or the same exception. Keys are forgotten as soon as the action completes,
+    so nothing is cached - a caller arriving later runs the action again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.number_of_shared_results = 0
+
+    def do(self, key: Hashable, action: Callable[[], _T]) -> Tuple[_T, bool]:
+        """
+        Returns the result of the action and whether it was shared with (run by) another caller.
+        """
+        with self._lock:
+            future = self._in_flight.get(key, None)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.number_of_shared_results += 1
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = action()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+
+        self._forget(key)
+        future.set_result(result)
+        return result, False
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._in_flight[key]
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines running on a single event loop.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.number_of_shared_results = 0
+
+    async def do(self, key: Hashable, action: Callable[[], Awaitable[_T]]) -> Tuple[_T, bool]:
+        future = self._in_flight.get(key, None)
+        if future is not None:
+            self.number_of_shared_results += 1
+            # shield - a cancelled waiter mustn't cancel the request of the others
+            return await asyncio.shield(future), True
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await action()
+        except BaseException as e:
+            del self._in_flight[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # retrieved by the waiters if there are any, don't warn about it otherwise
+                future.exception()
+            raise
+
+        del self._in_flight[key]
+        future.set_result(result)
+        return result, False
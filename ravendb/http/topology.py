@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import datetime
+import math
+import random
 import threading
 import time
 import uuid
@@ -75,8 +77,12 @@ class NodeSelector:
             self.nodes = topology.nodes
             self.failures = [0] * len(topology.nodes)
             self.fastest_records = [0] * len(topology.nodes)
-            self.fastest: Union[None, int] = None
+            self.fastest: int = 0
             self.speed_test_mode = 0
+            # per node moving averages of response time (in seconds) and error rate, see record_response_time
+            self.response_times: List[Optional[float]] = [None] * len(topology.nodes)
+            self.error_rates = [0.0] * len(topology.nodes)
+            self.last_samples = [0.0] * len(topology.nodes)
             self.unlikely_everyone_faulted_choice_index: Optional[int] = 0
 
         @property
@@ -93,11 +99,18 @@ class NodeSelector:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.__update_fastest_node_timer is not None:
-            self.__update_fastest_node_timer.__exit__()
+            self.__update_fastest_node_timer.cancel()
+
+    # weight of the newest sample in the moving averages
+    _EWMA_ALPHA = 0.2
+    # averages of nodes that weren't used for a while decay towards zero, so such nodes get probed again
+    _EWMA_DECAY_SECONDS = 10.0
+    # response time multiplier of a node failing every request
+    _ERROR_PENALTY = 10.0
 
     def __init__(self, topology: Topology, thread_pool: ThreadPoolExecutor):
         self._state = self.__NodeSelectorState(topology)
-        self.__update_fastest_node_timer: Union[None, time] = None
+        self.__update_fastest_node_timer: Optional[threading.Timer] = None
         self.__thread_pool_executor = thread_pool
 
     @property
@@ -112,6 +125,7 @@ class NodeSelector:
         if node_index < 0 or node_index >= len(state.failures):
             return
         state.failures[node_index] += 1
+        self.__record_sample(state, node_index, time.monotonic(), None)
 
     def on_update_topology(self, topology: Topology, force_update: bool = False) -> bool:
         if topology is None:
@@ -124,10 +138,26 @@ class NodeSelector:
             return False
 
         state = NodeSelector.__NodeSelectorState(topology)
+        self.__carry_over_response_times(self._state, state)
+        # the new state is complete before it is published, requests see either the old one or the new one
         self._state = state
 
         return True
 
+    @staticmethod
+    def __carry_over_response_times(
+        previous: NodeSelector.__NodeSelectorState, state: NodeSelector.__NodeSelectorState
+    ) -> None:
+        # nodes which stay in the topology keep their moving averages, a refresh doesn't make them look unknown
+        previous_indexes = {node: i for i, node in enumerate(previous.nodes)}
+        for i, node in enumerate(state.nodes):
+            previous_index = previous_indexes.get(node, None)
+            if previous_index is None or previous_index >= len(previous.response_times):
+                continue
+            state.response_times[i] = previous.response_times[previous_index]
+            state.error_rates[i] = previous.error_rates[previous_index]
+            state.last_samples[i] = previous.last_samples[previous_index]
+
     def get_requested_node(self, node_tag: str) -> CurrentIndexAndNode:
         state = self._state
         server_nodes = state.nodes
@@ -149,7 +179,7 @@ class NodeSelector:
         server_nodes = state.nodes
         length = min(len(server_nodes), len(state_failures))
         for i in range(length):
-            if state_failures[0] == 0:
+            if state_failures[i] == 0:
                 return CurrentIndexAndNode(i, server_nodes[i])
         return cls.unlikely_everyone_faulted_choice(state)
 
@@ -194,6 +224,83 @@ class NodeSelector:
         self._switch_to_speed_test_phase()
         return self.get_preferred_node()
 
+    def get_least_latency_node(self) -> CurrentIndexAndNode:
+        state = self._state
+        candidates = [
+            i
+            for i in range(len(state.nodes))
+            if state.failures[i] == 0 and state.nodes[i].server_role == ServerNode.Role.MEMBER
+        ]
+        if not candidates:
+            return self.get_preferred_node()
+
+        if len(candidates) == 1:
+            index = candidates[0]
+        else:
+            # power of two choices - comparing two random nodes avoids herding every client onto the single best one
+            now = time.monotonic()
+            first, second = random.sample(candidates, 2)
+            index = first if self.__score(state, first, now) <= self.__score(state, second, now) else second
+
+        return CurrentIndexAndNode(index, state.nodes[index])
+
+    def get_hedge_node(self, excluded_index: int) -> Optional[CurrentIndexAndNode]:
+        # the healthy member with the best score other than the node already asked, None if there's no such node
+        state = self._state
+        now = time.monotonic()
+        candidates = [
+            i
+            for i in range(len(state.nodes))
+            if i != excluded_index and state.failures[i] == 0 and state.nodes[i].server_role == ServerNode.Role.MEMBER
+        ]
+        if not candidates:
+            return None
+
+        index = min(candidates, key=lambda i: self.__score(state, i, now))
+        return CurrentIndexAndNode(index, state.nodes[index])
+
+    def record_response_time(self, index: int, node: ServerNode, elapsed_seconds: float) -> None:
+        state = self._state
+        if index < 0 or index >= len(state.response_times) or node != state.nodes[index]:
+            return  # topology changed in the meantime
+
+        self.__record_sample(state, index, time.monotonic(), elapsed_seconds)
+
+    @classmethod
+    def __record_sample(
+        cls, state: NodeSelector.__NodeSelectorState, index: int, now: float, elapsed_seconds: Optional[float]
+    ) -> None:
+        # races between concurrent requests may lose a sample, which doesn't matter for an average
+        decay = cls.__decay(state, index, now)
+        error_rate = state.error_rates[index] * decay
+        if elapsed_seconds is None:
+            state.error_rates[index] = error_rate + cls._EWMA_ALPHA * (1.0 - error_rate)
+        else:
+            state.error_rates[index] = error_rate * (1.0 - cls._EWMA_ALPHA)
+
+            response_time = state.response_times[index]
+            if response_time is None or elapsed_seconds >= response_time * decay:
+                # peak sensitive - a node getting slower is noticed immediately, recovery is smoothed
+                state.response_times[index] = elapsed_seconds
+            else:
+                response_time *= decay
+                state.response_times[index] = response_time + cls._EWMA_ALPHA * (elapsed_seconds - response_time)
+
+        state.last_samples[index] = now
+
+    @classmethod
+    def __score(cls, state: NodeSelector.__NodeSelectorState, index: int, now: float) -> float:
+        response_time = state.response_times[index]
+        if response_time is None:
+            return 0.0  # not measured yet, try it
+
+        decay = cls.__decay(state, index, now)
+        return response_time * decay * (1.0 + cls._ERROR_PENALTY * state.error_rates[index] * decay)
+
+    @classmethod
+    def __decay(cls, state: NodeSelector.__NodeSelectorState, index: int, now: float) -> float:
+        return math.exp(-max(0.0, now - state.last_samples[index]) / cls._EWMA_DECAY_SECONDS)
+
     def restore_node_index(self, node_index: int) -> None:
         state = self._state
         if len(state.failures) <= node_index:
@@ -208,10 +315,10 @@ class NodeSelector:
     def _switch_to_speed_test_phase(self) -> None:
         state = self._state
 
-        if not state.speed_test_mode == 0:
-            state.speed_test_mode = 1
+        if state.speed_test_mode != 0:
             return
 
+        state.speed_test_mode = 1
         state.fastest_records = len(state.fastest_records) * [0]
 
         state.speed_test_mode += 1
@@ -266,14 +373,15 @@ class NodeSelector:
         state.fastest = index
         state.speed_test_mode = 0
 
+        # threading.Timer can't be rescheduled, replace it with a new one
         if self.__update_fastest_node_timer is not None:
-            # todo: figure out how to reshedule timer, or put it in sleep for 60s
-            threading.self.__update_fastest_node_timer
+            self.__update_fastest_node_timer.cancel()
 
-        else:
-            self.__update_fastest_node_timer = threading.Timer(
-                datetime.timedelta(minutes=1), self._switch_to_speed_test_phase
-            )
+        self.__update_fastest_node_timer = threading.Timer(
+            datetime.timedelta(minutes=1).total_seconds(), self._switch_to_speed_test_phase
+        )
+        self.__update_fastest_node_timer.daemon = True
+        self.__update_fastest_node_timer.start()
 
     def schedule_speed_test(self) -> None:
         self._switch_to_speed_test_phase()
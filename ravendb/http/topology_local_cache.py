@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import List, Optional
+
+from ravendb.documents.operations.configuration.definitions import ClientConfiguration
+from ravendb.documents.operations.configuration.operations import GetClientConfigurationOperation
+from ravendb.http.server_node import ServerNode
+from ravendb.http.topology import Topology
+
+
+class DatabaseTopologyLocalCache:
+    """
+    Last known topology and client configuration of a database, stored in a local file so that a starting
+    RequestExecutor can send requests right away and validate them in the background.
+
+    There is one file per database and set of seed urls, written atomically - processes sharing
+    the directory (e.g. workers of a prefork server) never see a partially written file.
+    """
+
+    logger = logging.getLogger("request_executor")
+
+    class Entry:
+        def __init__(self, topology: Topology, client_configuration: Optional[GetClientConfigurationOperation.Result]):
+            self.topology = topology
+            self.client_configuration = client_configuration
+
+    @staticmethod
+    def get_path(location: str, database_name: str, urls: List[str]) -> str:
+        urls_hash = hashlib.sha256("\n".join(sorted(urls)).encode("utf-8")).hexdigest()
+        return os.path.join(location, f"{database_name}.{urls_hash}.raven-database-topology")
+
+    @classmethod
+    def try_load(cls, path: str) -> Optional[DatabaseTopologyLocalCache.Entry]:
+        try:
+            if not os.path.exists(path):
+                return None
+
+            with open(path, "r", encoding="utf-8") as file:
+                json_dict = json.load(file)
+
+            topology_json = json_dict["Topology"]
+            nodes = [
+                ServerNode(
+                    node["Url"],
+                    node["Database"],
+                    node["ClusterTag"],
+                    ServerNode.Role(node["ServerRole"]) if node["ServerRole"] else None,
+                )
+                for node in topology_json["Nodes"]
+            ]
+            if not nodes:
+                return None
+
+            client_configuration = json_dict.get("ClientConfiguration", None)
+            return cls.Entry(
+                Topology(topology_json["Etag"], nodes),
+                (
+                    GetClientConfigurationOperation.Result.from_json(client_configuration)
+                    if client_configuration
+                    else None
+                ),
+            )
+        except Exception as e:
+            cls.logger.info(f"Could not understand the persisted topology from {path}", exc_info=e)
+            return None
+
+    @classmethod
+    def try_save(
+        cls,
+        path: str,
+        topology: Topology,
+        client_configuration_etag: Optional[int],
+        client_configuration: Optional[ClientConfiguration],
+    ) -> None:
+        json_dict = {
+            "Topology": {
+                "Etag": topology.etag,
+                "Nodes": [
+                    {
+                        "Url": node.url,
+                        "Database": node.database,
+                        "ClusterTag": node.cluster_tag,
+                        "ServerRole": node.server_role.value if node.server_role else None,
+                    }
+                    for node in topology.nodes
+                ],
+            },
+            "ClientConfiguration": (
+                {"Etag": client_configuration_etag, "Configuration": client_configuration.to_json()}
+                if client_configuration is not None
+                else None
+            ),
+        }
+
+        temp_path = None
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(json_dict, file)
+            os.replace(temp_path, path)
+        except Exception as e:
+            cls.logger.info(f"Could not persist the topology to {path}", exc_info=e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -38,7 +38,10 @@ class GetDatabaseTopologyCommand(RavenCommand):
         self.result: Topology = Utils.initialize_object(json.loads(response), self._result_class, True)
         node_list = []
         for node in self.result.nodes:
-            node_list.append(Utils.initialize_object(node, ServerNode, True))
+            server_node = Utils.initialize_object(node, ServerNode, True)
+            if isinstance(server_node.server_role, str):
+                server_node.server_role = ServerNode.Role(server_node.server_role)
+            node_list.append(server_node)
         self.result.nodes = node_list
 
 
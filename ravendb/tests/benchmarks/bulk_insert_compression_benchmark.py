@@ -0,0 +1,126 @@
+"""
+Duration and wire size of a bulk insert, uncompressed and compressed, against a FakeCluster node reading
+the stream at a given bandwidth (0 for loopback speed):
+
+    python -m ravendb.tests.benchmarks.bulk_insert_compression_benchmark --documents 50000 --bandwidth 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from typing import List, Optional
+
+from ravendb import DocumentStore
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
+from ravendb.http.misc import HttpCompressionAlgorithm
+from ravendb.tests.driver.fake_server import FakeCluster
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore".split()
+
+
+class BenchmarkOrder:
+    def __init__(
+        self,
+        company: str = None,
+        employee: str = None,
+        ordered_at: str = None,
+        reference: str = None,
+        lines: list = None,
+        notes: str = None,
+    ):
+        self.company = company
+        self.employee = employee
+        self.ordered_at = ordered_at
+        self.reference = reference
+        self.lines = lines
+        self.notes = notes
+
+    @classmethod
+    def generate(cls, seed: int) -> BenchmarkOrder:
+        r = random.Random(seed)
+        return cls(
+            f"companies/{r.randint(1, 500)}-A",
+            f"employees/{r.randint(1, 50)}-A",
+            f"2020-0{r.randint(1, 9)}-1{r.randint(0, 9)}T00:00:00.0000000",
+            str(uuid.UUID(int=r.getrandbits(128))),
+            [
+                {
+                    "product": f"products/{r.randint(1, 77)}-A",
+                    "quantity": r.randint(1, 50),
+                    "price": round(r.uniform(1, 100), 2),
+                    "name": " ".join(r.choices(WORDS, k=4)),
+                }
+                for _ in range(r.randint(1, 5))
+            ],
+            " ".join(r.choices(WORDS, k=r.randint(5, 30))),
+        )
+
+
+class BenchmarkResult:
+    def __init__(self, compression: Optional[HttpCompressionAlgorithm], elapsed: float, wire_size: int):
+        self.compression = compression
+        self.elapsed = elapsed
+        self.wire_size = wire_size
+
+    def __str__(self):
+        name = str(self.compression) if self.compression is not None else "none"
+        return f"{name:<6} {self.elapsed:>7.2f} s  wire {self.wire_size / 1024 / 1024:>7.2f} MiB"
+
+
+def run(
+    orders: List[BenchmarkOrder],
+    compression: Optional[HttpCompressionAlgorithm],
+    bandwidth: Optional[float] = None,
+) -> BenchmarkResult:
+    with FakeCluster(nodes=1) as cluster:
+        node = cluster.nodes[0]
+        node.bandwidth = bandwidth
+
+        store = DocumentStore(cluster.urls, cluster.database)
+        store.conventions.disable_topology_updates = True
+        if compression is not None:
+            store.conventions.http_compression_algorithm = compression
+        store.initialize()
+
+        try:
+            start = time.perf_counter()
+            with store.bulk_insert(options=BulkInsertOptions(use_compression=compression is not None)) as bulk_insert:
+                for i, order in enumerate(orders):
+                    bulk_insert.store_as(order, f"orders/{i}")
+            elapsed = time.perf_counter() - start
+        finally:
+            store.close()
+
+        if len(cluster.documents) != len(orders):
+            raise RuntimeError(f"{len(cluster.documents)} of {len(orders)} documents were inserted")
+        return BenchmarkResult(compression, elapsed, node.received_bytes)
+
+
+def _available_compressions() -> List[Optional[HttpCompressionAlgorithm]]:
+    compressions = [None, HttpCompressionAlgorithm.GZIP]
+    try:
+        import zstandard  # noqa: F401
+
+        compressions.append(HttpCompressionAlgorithm.ZSTD)
+    except ImportError:
+        pass
+    return compressions
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=50000)
+    parser.add_argument("--bandwidth", type=float, default=0, help="MiB per second, 0 for no limit")
+    options = parser.parse_args(args)
+
+    orders = [BenchmarkOrder.generate(i) for i in range(options.documents)]
+    bandwidth = options.bandwidth * 1024 * 1024 if options.bandwidth > 0 else None
+    for compression in _available_compressions():
+        print(run(orders, compression, bandwidth), flush=True)
+
+
+if __name__ == "__main__":
+    main()
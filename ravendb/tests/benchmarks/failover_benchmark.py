@@ -0,0 +1,160 @@
+"""
+Throughput and tail latency of the RequestExecutor against a FakeCluster, with and without node failures:
+
+    python -m ravendb.tests.benchmarks.failover_benchmark --operations 2000 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from ravendb import DocumentStore
+from ravendb.tests.driver.fake_server import FakeCluster
+
+
+class BenchmarkUser:
+    def __init__(self, name: str = None, age: int = None):
+        self.name = name
+        self.age = age
+
+
+class BenchmarkResult:
+    def __init__(self, scenario: str, latencies: List[float], failures: int, elapsed: float, nodes: Dict[str, int]):
+        self.scenario = scenario
+        self.operations = len(latencies) + failures
+        self.failures = failures
+        self.elapsed = elapsed
+        self.nodes = nodes
+        self._latencies = sorted(latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        if not self._latencies:
+            return 0.0
+        return self._latencies[min(len(self._latencies) - 1, int(len(self._latencies) * percentile / 100))]
+
+    def __str__(self):
+        return (
+            f"{self.scenario:<22} {self.throughput:>9.0f} ops/s  p50 {self.percentile(50) * 1000:>7.2f} ms"
+            f"  p99 {self.percentile(99) * 1000:>7.2f} ms  max {self.percentile(100) * 1000:>7.2f} ms"
+            f"  failures {self.failures:<4} requests per node {self.nodes}"
+        )
+
+
+class Scenario:
+    """
+    Faults injected into the cluster before the run (setup) and once a share of the operations is done (during).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Optional[Callable[[FakeCluster], None]] = None,
+        during: Optional[Callable[[FakeCluster], None]] = None,
+        configure: Optional[Callable[[DocumentStore], None]] = None,
+    ):
+        self.name = name
+        self.setup = setup
+        self.during = during
+        self.configure = configure
+
+
+def _slow_tail(seconds: float, ratio: float) -> Callable[[], float]:
+    return lambda: seconds if random.random() < ratio else 0.001
+
+
+def _enable_hedging(store: DocumentStore) -> None:
+    store.conventions.hedged_reads_percentile = 90
+    store.conventions.hedged_reads_min_delay = timedelta(milliseconds=5)
+
+
+SCENARIOS = [
+    Scenario("healthy"),
+    Scenario("seed_node_down", setup=lambda cluster: setattr(cluster.nodes[0], "down", True)),
+    Scenario("node_down_mid_run", during=lambda cluster: setattr(cluster.nodes[0], "down", True)),
+    Scenario("flaky_node", setup=lambda cluster: setattr(cluster.nodes[0], "error_rate", 0.3)),
+    Scenario("slow_tail", setup=lambda cluster: setattr(cluster.nodes[0], "latency", _slow_tail(0.1, 0.05))),
+    Scenario(
+        "slow_tail_hedged",
+        setup=lambda cluster: setattr(cluster.nodes[0], "latency", _slow_tail(0.1, 0.05)),
+        configure=_enable_hedging,
+    ),
+]
+
+
+def _operation(store: DocumentStore, i: int, documents: int) -> None:
+    # mostly loads, with a write and a query now and then
+    with store.open_session() as session:
+        if i % 20 == 0:
+            session.store(BenchmarkUser(f"user {i}", i % 90), f"users/{i % documents}")
+            session.save_changes()
+        elif i % 20 == 1:
+            list(session.query(object_type=BenchmarkUser).where_equals("age", i % 90))
+        else:
+            session.load(f"users/{random.randrange(documents)}", BenchmarkUser)
+
+
+def run_scenario(
+    scenario: Scenario, operations: int = 1000, concurrency: int = 8, documents: int = 100
+) -> BenchmarkResult:
+    with FakeCluster() as cluster:
+        for i in range(documents):
+            cluster.put(f"users/{i}", {"name": f"user {i}", "age": i % 90}, "BenchmarkUsers")
+        if scenario.setup is not None:
+            scenario.setup(cluster)
+
+        store = DocumentStore(cluster.urls, cluster.database)
+        if scenario.configure is not None:
+            scenario.configure(store)
+        store.initialize()
+
+        latencies: List[float] = []
+        failures: List[Exception] = []
+
+        def __run(i: int) -> None:
+            if i == operations // 3 and scenario.during is not None:
+                scenario.during(cluster)
+
+            start = time.perf_counter()
+            try:
+                _operation(store, i, documents)
+            except Exception as e:
+                failures.append(e)
+                return
+            latencies.append(time.perf_counter() - start)
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(__run, range(operations)))
+            elapsed = time.perf_counter() - start
+        finally:
+            store.close()
+
+        return BenchmarkResult(
+            scenario.name, latencies, len(failures), elapsed, {node.tag: node.requests for node in cluster.nodes}
+        )
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenario", action="append", choices=[scenario.name for scenario in SCENARIOS])
+    options = parser.parse_args(args)
+
+    for scenario in SCENARIOS:
+        if options.scenario is None or scenario.name in options.scenario:
+            print(run_scenario(scenario, options.operations, options.concurrency), flush=True)
+
+
+if __name__ == "__main__":
+    main()
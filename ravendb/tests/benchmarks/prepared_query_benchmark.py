@@ -0,0 +1,82 @@
+"""
+Client side cost of a query - from building it up to the IndexQuery sent to the server and its hash -
+with the builder of a session and with a PreparedQuery bound to the session:
+
+    python -m ravendb.tests.benchmarks.prepared_query_benchmark --queries 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from ravendb import DocumentStore
+from ravendb.documents.queries.index_query import IndexQuery
+from ravendb.documents.session.document_session import DocumentSession
+from ravendb.documents.session.query import DocumentQuery, PreparedQuery
+from ravendb.tests.benchmarks.failover_benchmark import BenchmarkUser
+
+
+def build_query(query: DocumentQuery, name: object, age: object) -> DocumentQuery:
+    return (
+        query.where_equals("name", name)
+        .and_also()
+        .where_greater_than("age", age)
+        .order_by_descending("age")
+        .select_fields(BenchmarkUser, "name", "age")
+        .take(25)
+    )
+
+
+def builder_path(session: DocumentSession, i: int) -> IndexQuery:
+    return build_query(session.query(object_type=BenchmarkUser), f"user {i}", i % 90).index_query
+
+
+def prepared_path(prepared: PreparedQuery) -> Callable[[DocumentSession, int], IndexQuery]:
+    return lambda session, i: prepared.bind(session, name=f"user {i}", age=i % 90).index_query
+
+
+def measure(store: DocumentStore, path: Callable[[DocumentSession, int], IndexQuery], queries: int) -> float:
+    # microseconds per query, the best of a few rounds
+    best = None
+    with store.open_session() as session:
+        for _ in range(5):
+            start = time.perf_counter()
+            for i in range(queries):
+                path(session, i).get_query_hash()
+            elapsed = (time.perf_counter() - start) / queries * 1_000_000
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def create_store() -> DocumentStore:
+    # the queries are never sent, the store doesn't need a server
+    store = DocumentStore(["http://127.0.0.1:1"], "db")
+    store.conventions.disable_topology_updates = True
+    return store.initialize()
+
+
+def prepare(store: DocumentStore) -> PreparedQuery:
+    return PreparedQuery.prepare(
+        store.conventions,
+        lambda query: build_query(query, PreparedQuery.parameter("name"), PreparedQuery.parameter("age")),
+        object_type=BenchmarkUser,
+    )
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=20000)
+    options = parser.parse_args(args)
+
+    with create_store() as store:
+        prepared = prepare(store)
+        builder = measure(store, builder_path, options.queries)
+        print(f"{'builder':<10} {builder:>7.2f} us per query", flush=True)
+        bound = measure(store, prepared_path(prepared), options.queries)
+        print(f"{'prepared':<10} {bound:>7.2f} us per query ({builder / bound:.1f}x faster)", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import unittest
+
+from ravendb.http.misc import HttpCompressionAlgorithm
+from ravendb.tests.benchmarks.bulk_insert_compression_benchmark import BenchmarkOrder, _available_compressions, run
+
+
+# runs against an in-process fake node, no server needed
+class TestBulkInsertCompressionBenchmark(unittest.TestCase):
+    DOCUMENTS = 2000
+
+    def setUp(self):
+        self.orders = [BenchmarkOrder.generate(i) for i in range(self.DOCUMENTS)]
+
+    def test_compressed_streams_are_smaller(self):
+        uncompressed, *compressed = [run(self.orders, compression) for compression in _available_compressions()]
+        for result in compressed:
+            self.assertLess(result.wire_size, uncompressed.wire_size / 2, str(result))
+
+    def test_compression_wins_on_a_slow_link(self):
+        bandwidth = 2 * 1024 * 1024
+        uncompressed = run(self.orders, None, bandwidth)
+        gzip = run(self.orders, HttpCompressionAlgorithm.GZIP, bandwidth)
+        self.assertLess(gzip.elapsed, uncompressed.elapsed, f"{gzip} vs {uncompressed}")
@@ -0,0 +1,65 @@
+import unittest
+
+from ravendb import DocumentStore
+from ravendb.exceptions.exceptions import AllTopologyNodesDownException, UnsuccessfulRequestException
+from ravendb.tests.benchmarks.failover_benchmark import SCENARIOS, BenchmarkUser, run_scenario
+from ravendb.tests.driver.fake_server import FakeCluster
+
+
+# runs against in-process fake nodes, no server needed
+class TestFailoverBenchmark(unittest.TestCase):
+    OPERATIONS = 200
+    CONCURRENCY = 4
+
+    def _run(self, name: str):
+        scenario = next(scenario for scenario in SCENARIOS if scenario.name == name)
+        result = run_scenario(scenario, self.OPERATIONS, self.CONCURRENCY)
+        self.assertEqual(0, result.failures, str(result))
+        self.assertLess(result.percentile(99), 1.0, str(result))
+        return result
+
+    def test_healthy_cluster(self):
+        self._run("healthy")
+
+    def test_failover_from_a_node_which_is_down(self):
+        for name in ("seed_node_down", "node_down_mid_run"):
+            result = self._run(name)
+            # the node is skipped once the requests in flight failed over
+            self.assertLess(result.nodes["A"], self.OPERATIONS, str(result))
+
+    def test_failover_from_a_flaky_node(self):
+        result = self._run("flaky_node")
+        self.assertLess(result.nodes["A"], self.OPERATIONS // 2, str(result))
+
+    def test_hedging_cuts_the_slow_tail(self):
+        result = self._run("slow_tail_hedged")
+        self.assertGreater(result.nodes["B"] + result.nodes["C"], 0, str(result))
+
+    def test_all_nodes_down(self):
+        with FakeCluster() as cluster:
+            with DocumentStore(cluster.urls, cluster.database) as store:
+                store.initialize()
+                with store.open_session() as session:
+                    session.store(BenchmarkUser("name"), "users/1")
+                    session.save_changes()
+
+                for node in cluster.nodes:
+                    node.down = True
+
+                with self.assertRaises(AllTopologyNodesDownException):
+                    with store.open_session() as session:
+                        session.load("users/1", BenchmarkUser)
+
+    def test_failing_single_node_without_topology_updates(self):
+        with FakeCluster(nodes=1) as cluster:
+            cluster.put("users/1", {"name": "name"}, "BenchmarkUsers")
+            cluster.nodes[0].error_rate = 1.0
+            with DocumentStore(cluster.urls, cluster.database) as store:
+                store.conventions.disable_topology_updates = True
+                store.initialize()
+                with self.assertRaises(UnsuccessfulRequestException):
+                    with store.open_session() as session:
+                        session.load("users/1", BenchmarkUser)
+
+            # the failed node isn't retried over and over
+            self.assertEqual(1, cluster.nodes[0].requests)
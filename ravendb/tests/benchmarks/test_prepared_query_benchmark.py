@@ -0,0 +1,32 @@
+import unittest
+
+from ravendb.tests.benchmarks.prepared_query_benchmark import (
+    builder_path,
+    create_store,
+    measure,
+    prepare,
+    prepared_path,
+)
+
+
+# the queries are only built, no server needed
+class TestPreparedQueryBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.store = create_store()
+        self.prepared = prepare(self.store)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_both_paths_send_the_same_query(self):
+        with self.store.open_session() as session:
+            for i in range(3):
+                built = builder_path(session, i)
+                bound = prepared_path(self.prepared)(session, i)
+                self.assertEqual(built.query, bound.query)
+                self.assertEqual(built.query_parameters, bound.query_parameters)
+                self.assertEqual(built.page_size, bound.page_size)
+                self.assertEqual(built.get_query_hash(), bound.get_query_hash())
+
+    def test_measure(self):
+        self.assertGreater(measure(self.store, prepared_path(self.prepared), 10), 0)
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+
+class _FakeNodeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog of 5 drops connections opened by concurrent clients, they get retried a second later
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # clients may close the connection without reading the whole response, e.g. a stream stopped early
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeNode:
+    """
+    A node of FakeCluster - an in-process HTTP server answering on behalf of the cluster.
+
+    Faults are injected through the attributes, they can be changed while requests are running:
+        latency     - seconds (or a callable returning them) every request is delayed by
+        error_rate  - fraction of requests answered with error_status instead of being served
+        down        - the node drops every connection without answering, as a crashed server would
+        bandwidth   - bytes per second request bodies are read at, None for no limit
+    """
+
+    def __init__(self, cluster: FakeCluster, tag: str):
+        self.cluster = cluster
+        self.tag = tag
+        self.latency: Union[float, Callable[[], float]] = 0.0
+        self.error_rate = 0.0
+        self.error_status = 503
+        self.down = False
+        self.bandwidth: Optional[float] = None
+        self.requests = 0
+        self.failed_requests = 0
+        self.received_bytes = 0
+        self._counters_lock = threading.Lock()
+
+        self._server = _FakeNodeServer(("127.0.0.1", 0), _create_handler(self))
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def reset_faults(self) -> None:
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.down = False
+        self.bandwidth = None
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, failed: bool) -> None:
+        with self._counters_lock:
+            self.requests += 1
+            if failed:
+                self.failed_requests += 1
+
+    def _receive(self, size: int, received: int, started: float) -> None:
+        # counts the bytes read, with a bandwidth the reading of a body is held back to its pace
+        with self._counters_lock:
+            self.received_bytes += size
+        if self.bandwidth:
+            delay = started + received / self.bandwidth - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def _delay(self) -> None:
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+
+class FakeCluster:
+    """
+    Stand-in for a RavenDB cluster hosting a single database, for exercising the RequestExecutor
+    (failover, hedging, caching) without a live server. The nodes share their documents.
+
+    Speaks just enough of the protocol for sessions: /topology, /docs, /queries and /streams/queries
+    (collection queries with an optional "where field = $param"), /bulk_docs (PUT and DELETE), /multi_get
+    and /bulk_insert (documents only, gzip or zstd compressed too).
+    """
+
+    def __init__(self, database: str = "db", nodes: int = 3):
+        self.database = database
+        self.topology_etag = 1
+        self.documents: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._etag = 0
+        self._operation_id = 0
+        self.nodes = [FakeNode(self, chr(ord("A") + i)) for i in range(nodes)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def urls(self) -> List[str]:
+        return [node.url for node in self.nodes]
+
+    def node(self, tag: str) -> FakeNode:
+        return next(node for node in self.nodes if node.tag == tag)
+
+    def close(self) -> None:
+        for node in self.nodes:
+            node.close()
+
+    def put(self, key: str, document: dict, collection: Optional[str] = None) -> dict:
+        with self._lock:
+            self._etag += 1
+            metadata = dict(document.get("@metadata", {}))
+            metadata.update(
+                {
+                    "@id": key,
+                    "@change-vector": f"A:{self._etag}-fake",
+                    "@last-modified": datetime.utcnow().isoformat() + "0Z",
+                }
+            )
+            if collection is not None:
+                metadata["@collection"] = collection
+            stored = dict(document)
+            stored["@metadata"] = metadata
+            self.documents[key.lower()] = stored
+            return stored
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self.documents.pop(key.lower(), None) is not None
+
+    def next_operation_id(self) -> int:
+        with self._lock:
+            self._operation_id += 1
+            return self._operation_id
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self.documents.get(key.lower(), None)
+
+    def query(self, rql: str, parameters: Dict[str, Any]) -> List[dict]:
+        match = _QUERY_PATTERN.fullmatch(rql.strip())
+        if match is None:
+            raise ValueError(f"The fake server can't run '{rql}'")
+
+        collection = match.group(1) or match.group(2)
+        field, parameter = match.group(3), match.group(4)
+        with self._lock:
+            documents = list(self.documents.values())
+
+        return [
+            document
+            for document in documents
+            if (collection == "@all_docs" or document["@metadata"].get("@collection", None) == collection)
+            and (field is None or document.get(field, None) == parameters.get(parameter, None))
+        ]
+
+    def topology(self) -> dict:
+        return {
+            "Etag": self.topology_etag,
+            "Nodes": [
+                {"Url": node.url, "ClusterTag": node.tag, "ServerRole": "Member", "Database": self.database}
+                for node in self.nodes
+            ],
+        }
+
+
+_QUERY_PATTERN = re.compile(r"from\s+(?:'([^']+)'|(@?\w+))(?:\s+where\s+(\w+)\s*=\s*\$(\w+))?", re.IGNORECASE)
+
+_Response = Tuple[int, Optional[Any]]
+
+
+class _Routes:
+    def __init__(self, node: FakeNode):
+        self.node = node
+        self.cluster = node.cluster
+
+    def dispatch(self, method: str, path: str, query: Dict[str, List[str]], body: Optional[Any]) -> _Response:
+        if path == "/topology":
+            return 200, self.cluster.topology()
+
+        prefix = f"/databases/{self.cluster.database}"
+        if not path.startswith(prefix):
+            return 404, None
+        path = path[len(prefix) :]
+
+        if path == "/docs":
+            if method in ("GET", "POST"):
+                ids = body["Ids"] if method == "POST" and body else query.get("id", [])
+                return self.get_documents(ids)
+            if method == "PUT":
+                document = self.cluster.put(query["id"][0], body)
+                metadata = document["@metadata"]
+                return 201, {"Id": metadata["@id"], "ChangeVector": metadata["@change-vector"]}
+            if method == "DELETE":
+                self.cluster.delete(query["id"][0])
+                return 204, None
+        elif path == "/queries" and method == "POST":
+            return self.query(body)
+        elif path == "/streams/queries" and method == "POST":
+            return self.stream_query(body)
+        elif path == "/bulk_docs" and method == "POST":
+            return self.bulk_docs(body)
+        elif path == "/multi_get" and method == "POST":
+            return self.multi_get(body)
+        elif path == "/bulk_insert" and method == "POST":
+            return self.bulk_insert(body)
+        elif path == "/operations/next-operation-id" and method == "GET":
+            return 200, {"Id": self.cluster.next_operation_id(), "NodeTag": self.node.tag}
+
+        return 404, None
+
+    def get_documents(self, ids: List[str]) -> _Response:
+        results = [self.cluster.get(key) for key in ids]
+        if len(ids) == 1 and results[0] is None:
+            return 404, None
+        return 200, {"Results": results, "Includes": {}}
+
+    def query(self, body: dict) -> _Response:
+        try:
+            results = self.cluster.query(body["Query"], body.get("QueryParameters", None) or {})
+        except ValueError as e:
+            return 400, {"Type": "InvalidQueryException", "Message": str(e), "Error": str(e)}
+
+        return 200, {
+            "Results": results,
+            "Includes": {},
+            "TotalResults": len(results),
+            "LongTotalResults": len(results),
+            "SkippedResults": 0,
+            "IsStale": False,
+            "IndexName": "Auto/Fake",
+            "IndexTimestamp": datetime.utcnow().isoformat() + "0Z",
+            "LastQueryTime": datetime.utcnow().isoformat() + "0Z",
+            "ResultEtag": hash(json.dumps(results, sort_keys=True)),
+            "NodeTag": self.node.tag,
+            "DurationInMs": 0,
+        }
+
+    def stream_query(self, body: dict) -> _Response:
+        status, result = self.query(body)
+        if status != 200:
+            return status, result
+        return 200, {
+            "ResultEtag": result["ResultEtag"],
+            "IsStale": False,
+            "IndexName": result["IndexName"],
+            "TotalResults": result["TotalResults"],
+            "IndexTimestamp": result["IndexTimestamp"],
+            "Results": result["Results"],
+        }
+
+    def bulk_docs(self, body: dict) -> _Response:
+        results = []
+        for command in body["Commands"]:
+            if command["Type"] == "PUT":
+                document = command["Document"]
+                collection = document.get("@metadata", {}).get("@collection", None)
+                metadata = self.cluster.put(command["Id"], document, collection)["@metadata"]
+                results.append(dict(metadata, Type="PUT"))
+            elif command["Type"] == "DELETE":
+                results.append({"Type": "DELETE", "Id": command["Id"], "Deleted": self.cluster.delete(command["Id"])})
+            else:
+                return 400, {"Type": "NotSupportedException", "Message": f"{command['Type']} is not supported"}
+        return 201, {"Results": results}
+
+    def bulk_insert(self, body: Optional[list]) -> _Response:
+        if body is None:
+            return 400, {"Type": "InvalidOperationException", "Message": "Bulk insert stream is not valid JSON"}
+        for command in body:
+            if command["Type"] != "PUT":
+                return 400, {"Type": "NotSupportedException", "Message": f"{command['Type']} is not supported"}
+            document = command["Document"]
+            self.cluster.put(command["Id"], document, document.get("@metadata", {}).get("@collection", None))
+        return 200, None
+
+    def multi_get(self, body: dict) -> _Response:
+        results = []
+        for request in body["Requests"]:
+            query = parse_qs((request.get("Query", None) or "").lstrip("?"))
+            content = request.get("Content", None)
+            status, result = self.dispatch(
+                request.get("Method", None) or "GET",
+                request["Url"],
+                query,
+                json.loads(content) if isinstance(content, str) else content,
+            )
+            results.append({"Result": result, "StatusCode": status, "Headers": {}})
+        return 200, {"Results": results}
+
+
+def _create_handler(node: FakeNode):
+    routes = _Routes(node)
+
+    class FakeNodeHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # responses are small, without it they wait for the delayed ack of the client
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+        def do_DELETE(self):
+            self._handle("DELETE")
+
+        def _handle(self, method: str) -> None:
+            body = self._read_body()
+            if node.down:
+                node._count(True)
+                self.close_connection = True
+                return
+
+            node._delay()
+            if node.error_rate > 0 and random.random() < node.error_rate:
+                node._count(True)
+                self._send(node.error_status, {"Type": "ServiceUnavailable", "Message": "Injected failure"})
+                return
+
+            node._count(False)
+            url = urlsplit(self.path)
+            try:
+                status, result = routes.dispatch(method, url.path, parse_qs(url.query), body)
+            except Exception as e:
+                status, result = 500, {"Type": type(e).__name__, "Message": str(e), "Error": repr(e)}
+            self._send(status, result)
+
+        def _read_body(self) -> Optional[Any]:
+            started = time.perf_counter()
+            if self.headers.get("Transfer-Encoding", None) == "chunked":
+                data = self._read_chunks(started)
+            else:
+                data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                node._receive(len(data), len(data), started)
+            if not data:
+                return None
+
+            encoding = self.headers.get("Content-Encoding", None)
+            if encoding == "gzip":
+                data = gzip.decompress(data)
+            elif encoding == "zstd":
+                import zstandard
+
+                data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+            try:
+                return json.loads(data)
+            except ValueError:
+                return None
+
+        def _read_chunks(self, started: float) -> bytes:
+            data = bytearray()
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return bytes(data)
+                data += self.rfile.read(size)
+                self.rfile.readline()
+                node._receive(size, len(data), started)
+
+        def _send(self, status: int, result: Optional[Any]) -> None:
+            body = json.dumps(result).encode("utf-8") if result is not None else b""
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if status == 200 and self.headers.get("If-None-Match", None) == etag:
+                status, body = 304, b""
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if status in (200, 304):
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return FakeNodeHandler
@@ -0,0 +1,62 @@
+import datetime
+import time
+
+from ravendb.http.misc import AggressiveCacheMode
+from ravendb.infrastructure.entities import User
+from ravendb.tests.test_base import TestBase
+
+
+class TestAggressiveCaching(TestBase):
+    def setUp(self):
+        super().setUp()
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+    def _load_user(self) -> User:
+        with self.store.open_session() as session:
+            return session.load("users/1", User)
+
+    def test_can_aggressively_cache_loads(self):
+        request_executor = self.store.get_request_executor()
+
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5)):
+            self._load_user()
+            number_of_server_requests = request_executor.number_of_server_requests
+
+            for _ in range(5):
+                self.assertEqual("John", self._load_user().name)
+
+            self.assertEqual(number_of_server_requests, request_executor.number_of_server_requests)
+
+        self.assertIsNone(request_executor.aggressive_caching)
+
+    def test_changes_invalidate_aggressively_cached_items(self):
+        request_executor = self.store.get_request_executor()
+
+        with self.store.aggressively_cache():
+            self._load_user()
+            generation = request_executor.cache.generation
+
+            with self.store.open_session() as session:
+                session.load("users/1", User).name = "Jane"
+                session.save_changes()
+
+            end = time.time() + 10
+            while request_executor.cache.generation == generation and time.time() < end:
+                time.sleep(0.1)
+
+            self.assertEqual("Jane", self._load_user().name)
+
+    def test_do_not_track_changes_serves_stale_items_until_expired(self):
+        with self.store.aggressively_cache_for(datetime.timedelta(minutes=5), AggressiveCacheMode.DO_NOT_TRACK_CHANGES):
+            self._load_user()
+
+            with self.store.open_session() as session:
+                session.load("users/1", User).name = "Jane"
+                session.save_changes()
+
+            self.assertEqual("John", self._load_user().name)
+
+            with self.store.disable_aggressive_caching():
+                self.assertEqual("Jane", self._load_user().name)
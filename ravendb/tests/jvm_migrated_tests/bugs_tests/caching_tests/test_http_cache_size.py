@@ -0,0 +1,47 @@
+from ravendb.http.http_cache import HttpCache
+from ravendb.infrastructure.entities import User
+from ravendb.tests.test_base import TestBase
+
+
+class TestHttpCacheSize(TestBase):
+    def setUp(self):
+        super().setUp()
+
+    def test_evicts_least_recently_used_items_when_full(self):
+        payload = "x" * 1000
+        with HttpCache(3500) as cache:
+            cache.set("/docs?id=1", "A:1", payload)
+            cache.set("/docs?id=2", "A:2", payload)
+            cache.set("/docs?id=3", "A:3", payload)
+
+            # touch the first one, so the second becomes the least recently used
+            cache.get("/docs?id=1")
+            cache.set("/docs?id=4", "A:4", payload)
+
+            self.assertLessEqual(cache.total_size, cache.max_size)
+            self.assertEqual(3, len(cache))
+            self.assertEqual(1, cache.number_of_evictions)
+            self.assertIsNone(cache.get("/docs?id=2")[1])
+            self.assertEqual("A:1", cache.get("/docs?id=1")[1])
+            self.assertEqual(2, cache.number_of_hits)
+            self.assertEqual(1, cache.number_of_misses)
+
+    def test_does_not_store_items_bigger_than_the_cache(self):
+        with HttpCache(100) as cache:
+            cache.set("/docs?id=1", "A:1", "x" * 1000)
+            self.assertEqual(0, len(cache))
+            self.assertEqual(0, cache.total_size)
+
+    def test_request_executor_cache_honors_max_http_cache_size(self):
+        with self.store.open_session() as session:
+            session.store(User(name="John"), "users/1")
+            session.save_changes()
+
+        request_executor = self.store.get_request_executor()
+        self.assertEqual(self.store.conventions.max_http_cache_size, request_executor.cache.max_size)
+
+        for _ in range(2):
+            with self.store.open_session() as session:
+                session.load("users/1", User)
+
+        self.assertGreaterEqual(request_executor.cache.number_of_hits, 1)
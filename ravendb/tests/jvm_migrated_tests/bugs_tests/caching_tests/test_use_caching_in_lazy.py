@@ -1,5 +1,4 @@
 import http
-import unittest
 
 from ravendb import MultiGetOperation
 from ravendb.documents.commands.multi_get import GetRequest
@@ -17,7 +16,6 @@ class TestUseCachingInLazy(TestBase):
     def setUp(self):
         super(TestUseCachingInLazy, self).setUp()
 
-    @unittest.skip("Aggressive caching in MultiGetCommand")
     def test_lazily_load__when_query_not_found_not_modified__should_use_cache(self):
         not_exists_doc_id = "NotExistDocId"
 
@@ -1,3 +1,5 @@
+import time
+
 from ravendb import IndexQuery, DeleteByQueryOperation
 from ravendb.infrastructure.entities import User
 from ravendb.tests.test_base import TestBase
@@ -21,3 +23,34 @@ class TestDeleteByQuery(TestBase):
 
         with self.store.open_session() as session:
             self.assertEqual(1, session.query(object_type=User).count())
+
+    def test_can_wait_for_completion_without_blocking(self):
+        with self.store.open_session() as session:
+            for age in range(10):
+                session.store(User(age=age))
+            session.save_changes()
+
+        operation = DeleteByQueryOperation(IndexQuery("from users where age < 5"))
+        future = self.store.operations.send_async(operation).wait_for_completion_async()
+
+        future.result(timeout=30)
+        self.assertIsNone(future.exception())
+
+        with self.store.open_session() as session:
+            self.assertEqual(5, session.query(object_type=User).count())
+
+    def test_waiting_for_completion_leaves_no_subscription_behind(self):
+        with self.store.open_session() as session:
+            session.store(User(age=5))
+            session.save_changes()
+
+        operation = self.store.operations.send_async(DeleteByQueryOperation(IndexQuery("from users where age == 5")))
+        operation.wait_for_completion()
+
+        # the observable is dropped once the waiting subscriber left, reconnecting doesn't watch the operation again
+        observables = self.store.changes()._observables_by_group.get("OperationStatusChange", {})
+        for _ in range(50):
+            if f"operations/{operation.key}" not in observables:
+                break
+            time.sleep(0.1)
+        self.assertNotIn(f"operations/{operation.key}", observables)
@@ -0,0 +1,73 @@
+from collections import Counter
+
+from ravendb.http.server_node import ServerNode
+from ravendb.http.topology import NodeSelector, Topology
+from ravendb.tests.test_base import TestBase
+
+
+class TestNodeSelector(TestBase):
+    def setUp(self):
+        super(TestNodeSelector, self).setUp()
+        self.nodes = [ServerNode(f"http://{tag}:8080", "db", tag, ServerNode.Role.MEMBER) for tag in "ABC"]
+        self.node_selector = NodeSelector(Topology(1, self.nodes), None)
+
+    def _send_reads(self, latencies: dict, count: int) -> Counter:
+        chosen = Counter()
+        for _ in range(count):
+            current = self.node_selector.get_least_latency_node()
+            chosen[current.current_node.cluster_tag] += 1
+            self.node_selector.record_response_time(
+                current.current_index, current.current_node, latencies[current.current_node.cluster_tag]
+            )
+        return chosen
+
+    def test_least_latency_avoids_slow_nodes(self):
+        chosen = self._send_reads({"A": 0.005, "B": 0.1, "C": 0.01}, 300)
+        self.assertGreater(chosen["A"], chosen["C"])
+        self.assertLessEqual(chosen["B"], 1)
+
+        # a node getting slower is avoided right away
+        chosen = self._send_reads({"A": 0.5, "B": 0.1, "C": 0.01}, 300)
+        self.assertLessEqual(chosen["A"], 1)
+
+    def test_least_latency_skips_failed_nodes(self):
+        self.node_selector.on_failed_request(0)
+        self.node_selector.on_failed_request(2)
+        self.assertEqual({"B": 100}, self._send_reads({"A": 0.001, "B": 0.1, "C": 0.001}, 100))
+
+        self.node_selector.restore_node_index(0)
+        self.assertIn("A", self._send_reads({"A": 0.001, "B": 0.1, "C": 0.001}, 100))
+
+    def test_preferred_node_skips_failed_nodes(self):
+        self.node_selector.on_failed_request(0)
+        self.assertEqual("B", self.node_selector.get_preferred_node().current_node.cluster_tag)
+
+    def test_hedge_node_is_the_fastest_other_healthy_node(self):
+        for index, elapsed in enumerate([0.1, 0.05, 0.01]):
+            self.node_selector.record_response_time(index, self.nodes[index], elapsed)
+
+        self.assertEqual("C", self.node_selector.get_hedge_node(0).current_node.cluster_tag)
+        self.assertEqual("B", self.node_selector.get_hedge_node(2).current_node.cluster_tag)
+
+        self.node_selector.on_failed_request(2)
+        self.assertEqual("B", self.node_selector.get_hedge_node(0).current_node.cluster_tag)
+
+        self.node_selector.on_failed_request(1)
+        self.assertIsNone(self.node_selector.get_hedge_node(0))
+
+    def test_topology_update_keeps_response_times_of_remaining_nodes(self):
+        self._send_reads({"A": 0.5, "B": 0.1, "C": 0.01}, 100)
+
+        # C left the topology, B moved, D joined
+        nodes = [ServerNode(f"http://{tag}:8080", "db", tag, ServerNode.Role.MEMBER) for tag in "BAD"]
+        self.assertTrue(self.node_selector.on_update_topology(Topology(2, nodes)))
+
+        # get_least_latency_node compares a random pair, the scores are asserted through the deterministic hedge node
+        # D was never measured and gets probed first
+        self.assertEqual("D", self.node_selector.get_hedge_node(1).current_node.cluster_tag)
+        self.node_selector.record_response_time(2, nodes[2], 0.2)
+        self.assertEqual("B", self.node_selector.get_hedge_node(1).current_node.cluster_tag)
+
+        # A keeps its measured latency and keeps being avoided
+        self.assertEqual("D", self.node_selector.get_hedge_node(0).current_node.cluster_tag)
+        self.assertEqual("B", self.node_selector.get_hedge_node(2).current_node.cluster_tag)
@@ -1,11 +1,23 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb.documents.commands.crud import GetDocumentsCommand
 from ravendb.documents.conventions import DocumentConventions
 from ravendb.exceptions.exceptions import DatabaseDoesNotExistException
 from ravendb.http.request_executor import RequestExecutor
 from ravendb.http.server_node import ServerNode
 from ravendb.http.topology import UpdateTopologyParameters
+from ravendb.serverwide.commands import GetDatabaseTopologyCommand
+from ravendb.tests.driver.fake_server import FakeCluster
 from ravendb.tests.test_base import TestBase
 
 
+class Item:
+    def __init__(self, name: str = None):
+        self.name = name
+
+
 class TestRequestExecutor(TestBase):
     def setUp(self):
         super(TestRequestExecutor, self).setUp()
@@ -22,3 +34,95 @@ class TestRequestExecutor(TestBase):
 
             with self.assertRaises(DatabaseDoesNotExistException):
                 executor.update_topology_async(update_topology_parameters).result()
+
+    def test_http_pool_statistics_count_reused_connections(self):
+        conventions = DocumentConventions()
+        conventions.http_pool_size_per_node = 4
+        conventions.http_pool_pre_warm_connections = 2
+
+        with RequestExecutor.create(
+            self.store.urls, self.store.database, conventions, None, None, self.store.thread_pool_executor
+        ) as executor:
+            for _ in range(5):
+                executor.execute_command(GetDatabaseTopologyCommand())
+
+            statistics = executor.http_pool_statistics
+            self.assertGreaterEqual(statistics.connections_acquired, 5)
+            self.assertGreater(statistics.connections_reused, 0)
+            self.assertEqual(0, statistics.connections_discarded)
+            self.assertGreater(statistics.reuse_rate, 0)
+
+    def test_metrics_record_requests_per_command_and_node(self):
+        with self.store.open_session() as session:
+            session.store(Item("item"), "items/1")
+            session.save_changes()
+
+        metrics = self.store.get_request_executor().metrics
+        metrics.reset()
+        for _ in range(3):
+            with self.store.open_session() as session:
+                session.load("items/1", Item)
+
+        snapshot = metrics.to_json()
+        documents = snapshot["Commands"]["GetDocumentsCommand"]
+        self.assertEqual(3, documents["Requests"])
+        self.assertEqual(2, documents["NotModified"])
+        self.assertGreater(documents["BytesReceived"], 0)
+        self.assertEqual(3, sum(node["Requests"] for node in snapshot["Nodes"].values()))
+        self.assertIn(
+            'ravendb_client_request_duration_seconds_count{command="GetDocumentsCommand"} 3', metrics.to_prometheus()
+        )
+
+    def test_coalesced_read_requests_get_their_own_results(self):
+        conventions = DocumentConventions()
+        conventions.coalesce_read_requests = True
+
+        with FakeCluster(nodes=1) as cluster, ThreadPoolExecutor() as executor_pool, ThreadPoolExecutor(20) as pool:
+            cluster.put("items/1", {"name": "item"}, "Items")
+            node = cluster.node("A")
+
+            with RequestExecutor.create(
+                cluster.urls, cluster.database, conventions, None, None, executor_pool
+            ) as executor:
+
+                def load(_) -> GetDocumentsCommand:
+                    command = GetDocumentsCommand.from_single_id("items/1")
+                    executor.execute_command(command)
+                    return command
+
+                load(None)  # fetches the topology
+
+                # with the latency every load is in flight together with the first one
+                node.latency = 0.2
+                node.requests = 0
+                commands = list(pool.map(load, range(20)))
+
+                for command in commands:
+                    self.assertEqual("item", command.result.results[0]["name"])
+                # every command parsed the response on its own
+                self.assertEqual(20, len({id(command.result) for command in commands}))
+                self.assertGreater(executor.number_of_coalesced_requests, 0)
+                self.assertLess(node.requests, 20)
+
+    def test_starts_from_the_cached_topology(self):
+        with tempfile.TemporaryDirectory() as cache_location:
+            conventions = DocumentConventions()
+            conventions.topology_cache_location = cache_location
+
+            with RequestExecutor.create(
+                self.store.urls, self.store.database, conventions, None, None, self.store.thread_pool_executor
+            ) as executor:
+                executor.execute_command(GetDatabaseTopologyCommand())
+                topology_etag = executor.topology_etag
+            self.assertEqual(1, len(os.listdir(cache_location)))
+
+            with RequestExecutor.create(
+                self.store.urls, self.store.database, conventions, None, None, self.store.thread_pool_executor
+            ) as executor:
+                executor._first_topology_update_task.result()
+                self.assertEqual(topology_etag, executor.topology_etag)
+                self.assertEqual(self.store.urls[0], executor.topology_nodes[0].url)
+
+                command = GetDatabaseTopologyCommand()
+                executor.execute_command(command)
+                self.assertEqual(topology_etag, command.result.etag)
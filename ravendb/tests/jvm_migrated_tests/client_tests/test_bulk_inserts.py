@@ -2,6 +2,7 @@ import datetime
 import time
 
 from ravendb import MetadataAsDictionary
+from ravendb.documents.bulk_insert_operation import BulkInsertOptions
 from ravendb.primitives import constants
 from ravendb.exceptions.documents.bulkinsert import BulkInsertAbortedException
 from ravendb.tests.test_base import TestBase
@@ -75,3 +76,41 @@ class TestBulkInserts(TestBase):
                 time.sleep(0.1)  # todo: wait for operation to be created first, then try to kill it
                 bulk_insert.abort()
                 bulk_insert.store(FooBar())
+
+    def test_can_bulk_insert_documents_spanning_many_buffers(self):
+        name = 'John "The Doe" \\ ' * 100
+
+        with self.store.bulk_insert() as bulk_insert:
+            for i in range(2000):
+                bulk_insert.store_as(FooBar(f"{name}{i}"), f'foobars/"{i}"')
+
+        with self.store.open_session() as session:
+            self.assertEqual(f"{name}0", session.load('foobars/"0"', FooBar).name)
+            self.assertEqual(f"{name}1999", session.load('foobars/"1999"', FooBar).name)
+
+    def test_can_bulk_insert_with_compression(self):
+        with self.store.bulk_insert(options=BulkInsertOptions(use_compression=True)) as bulk_insert:
+            for i in range(2000):
+                bulk_insert.store_as(FooBar(f"John Doe {i}"), f"foobars/{i}")
+
+        with self.store.open_session() as session:
+            self.assertEqual("John Doe 0", session.load("foobars/0", FooBar).name)
+            self.assertEqual("John Doe 1999", session.load("foobars/1999", FooBar).name)
+
+    def test_parallel_bulk_insert_stores_all_documents(self):
+        with self.store.parallel_bulk_insert(streams_count=3) as bulk_insert:
+            for i in range(3000):
+                bulk_insert.store_as(FooBar(f"John Doe {i}"), f"foobars/{i}")
+
+        with self.store.open_session() as session:
+            foobars = session.load([f"foobars/{i}" for i in range(3000)], FooBar)
+            self.assertEqual(3000, len([foobar for foobar in foobars.values() if foobar is not None]))
+            self.assertEqual("John Doe 2999", foobars["foobars/2999"].name)
+
+    def test_parallel_bulk_insert_can_be_aborted(self):
+        with self.assertRaises(BulkInsertAbortedException):
+            with self.store.parallel_bulk_insert(streams_count=2) as bulk_insert:
+                bulk_insert.store(FooBar())
+                time.sleep(0.1)
+                bulk_insert.abort()
+                bulk_insert.store(FooBar())
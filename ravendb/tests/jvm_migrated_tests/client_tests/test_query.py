@@ -1,6 +1,8 @@
 from typing import Optional
 
+from ravendb import DocumentStore
 from ravendb.documents.indexes.abstract_index_creation_tasks import AbstractIndexCreationTask
+from ravendb.documents.session.query import PreparedQuery
 from ravendb.documents.session.query_group_by import GroupByField
 from ravendb.infrastructure.entities import User
 from ravendb.tests.test_base import TestBase
@@ -156,3 +158,51 @@ class TestQuery(TestBase):
             for projection in projections:
                 self.assertIsNotNone(projection.Id)
                 self.assertIsNone(projection.name)
+
+    def test_query_shape_cache_reuses_the_query_text(self):
+        self.__add_users()
+
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.query_shape_cache_size = 16
+        store.initialize()
+        try:
+            cache = store.conventions.query_shape_cache
+            index_queries = []
+            for name, age in [("John", 3), ("Tarzan", 1), ("John", 4)]:
+                with store.open_session() as session:
+                    query = session.query(object_type=User).where_equals("name", name).where_greater_than("age", age)
+                    results = list(query.order_by("age").take(5))
+                    index_queries.append(query.query_operation.index_query)
+                    self.assertEqual(1, len(results))
+                    self.assertEqual(name, results[0].name)
+
+            self.assertEqual(1, len(cache))
+            self.assertEqual(2, cache.hits)
+            self.assertIs(index_queries[0].query, index_queries[2].query)
+            self.assertEqual({"p0": "John", "p1": 4, "p2": 0, "p3": 5}, index_queries[2].query_parameters)
+        finally:
+            store.close()
+
+    def test_prepared_query_binds_to_any_session(self):
+        self.__add_users()
+
+        older_than = PreparedQuery.prepare(
+            self.store.conventions,
+            lambda query: query.where_equals("name", PreparedQuery.parameter("name"))
+            .where_greater_than("age", PreparedQuery.parameter("age"))
+            .order_by("age"),
+            object_type=User,
+        )
+        self.assertEqual({"name", "age"}, older_than.parameter_names)
+
+        with self.store.open_session() as session:
+            results = list(older_than.bind(session, name="John", age=0))
+            self.assertEqual([3, 5], [user.age for user in results])
+
+        with self.store.open_session() as session:
+            results = list(older_than.bind(session, name="John", age=4))
+            self.assertEqual(["users/2"], [user.Id for user in results])
+            self.assertIs(results[0], session.load("users/2", User))
+
+            with self.assertRaises(ValueError):
+                older_than.bind(session, name="John")
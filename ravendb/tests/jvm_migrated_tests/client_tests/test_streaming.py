@@ -0,0 +1,90 @@
+import io
+import json
+
+from ravendb.documents.session.query import StreamQueryStatistics
+from ravendb.infrastructure.entities import User
+from ravendb.tests.test_base import TestBase
+
+
+class TestStreaming(TestBase):
+    def setUp(self):
+        super().setUp()
+
+    def _insert_users(self, count: int) -> None:
+        with self.store.open_session() as session:
+            for i in range(count):
+                session.store(User(name=f"user_{i}", age=i), f"users/{i}")
+            session.save_changes()
+
+    def test_can_stream_documents_starting_with(self):
+        self._insert_users(200)
+
+        with self.store.open_session() as session:
+            count = 0
+            for result in session.advanced.stream_starting_with(User, "users/"):
+                self.assertIsNotNone(result.key)
+                self.assertIsNotNone(result.change_vector)
+                self.assertIsNotNone(result.metadata)
+                self.assertIsInstance(result.document, User)
+                count += 1
+
+            self.assertEqual(200, count)
+            self.assertEqual(1, session.number_of_requests)
+            self.assertFalse(session.advanced.is_loaded("users/1"))
+
+    def test_can_stream_query_results_with_statistics(self):
+        self._insert_users(100)
+
+        with self.store.open_session() as session:
+            # create the auto index and wait for it, stream() never waits for non stale results
+            list(session.query(object_type=User).where_greater_than_or_equal("age", 50).wait_for_non_stale_results())
+
+        with self.store.open_session() as session:
+            query = session.query(object_type=User).where_greater_than_or_equal("age", 50)
+            stats = StreamQueryStatistics()
+            results = session.advanced.stream(query, stats)
+
+            ages = [result.document.age for result in results]
+            self.assertEqual(50, len(ages))
+            self.assertTrue(all(age >= 50 for age in ages))
+            self.assertEqual(50, stats.total_results)
+            self.assertIsNotNone(stats.index_name)
+
+    def test_can_stream_query_entities(self):
+        self._insert_users(100)
+
+        with self.store.open_session() as session:
+            list(session.query(object_type=User).where_less_than("age", 10).wait_for_non_stale_results())
+
+        with self.store.open_session() as session:
+            stats = StreamQueryStatistics()
+            users = list(session.query(object_type=User).where_less_than("age", 10).stream(stats))
+
+            self.assertEqual(list(range(10)), sorted(user.age for user in users))
+            self.assertTrue(all(isinstance(user, User) for user in users))
+            self.assertEqual(10, stats.total_results)
+            self.assertFalse(session.advanced.is_loaded("users/1"))
+
+            users = session.advanced.raw_query("from Users", User).stream()
+            self.assertIsInstance(next(users), User)
+            users.close()
+
+    def test_can_stop_streaming_early(self):
+        self._insert_users(100)
+
+        with self.store.open_session() as session:
+            results = session.advanced.stream_starting_with(User, "users/")
+            first = next(results)
+            results.close()
+
+            self.assertIsInstance(first.document, User)
+
+    def test_can_stream_query_into_output(self):
+        self._insert_users(10)
+
+        with self.store.open_session() as session:
+            output = io.BytesIO()
+            session.advanced.stream_into(session.query(object_type=User), output)
+
+            results = json.loads(output.getvalue().decode("utf-8"))["Results"]
+            self.assertEqual(10, len(results))
@@ -1,3 +1,5 @@
+import datetime
+
 from ravendb import DocumentStore
 from ravendb.documents.session.event_args import SucceedRequestEventArgs
 from ravendb.tests.test_base import TestBase
@@ -29,22 +31,24 @@ class TestRavenDB16035(TestBase):
             session.save_changes()
 
         with self.store.open_session() as session:
-            l1 = session.query(object_type=User).where_equals("name", "Arava").lazily()
-            l2 = session.query(object_type=User).where_equals("name", "Phoebe").lazily()
-            l3 = session.query(object_type=User).where_exists("name").count_lazily()
+            with session.advanced.document_store.aggressively_cache_for(datetime.timedelta(minutes=5)):
+                l1 = session.query(object_type=User).where_equals("name", "Arava").lazily()
+                l2 = session.query(object_type=User).where_equals("name", "Phoebe").lazily()
+                l3 = session.query(object_type=User).where_exists("name").count_lazily()
 
-            self.assertNotEqual(0, len(l1.value))
-            self.assertEqual(0, len(l2.value))
-            self.assertEqual(1, l3.value)
+                self.assertNotEqual(0, len(l1.value))
+                self.assertEqual(0, len(l2.value))
+                self.assertEqual(1, l3.value)
 
         with self.store.open_session() as session:
             TestRavenDB16035.clear_cache = True
 
         with self.store.open_session() as session:
-            l1 = session.query(object_type=User).where_equals("name", "Arava").lazily()
-            l2 = session.query(object_type=User).where_equals("name", "Phoebe").lazily()
-            l3 = session.query(object_type=User).where_exists("name").count_lazily()
-
-            self.assertNotEqual(0, len(l1.value))
-            self.assertEqual(0, len(l2.value))
-            self.assertEqual(1, l3.value)
+            with session.advanced.document_store.aggressively_cache_for(datetime.timedelta(minutes=5)):
+                l1 = session.query(object_type=User).where_equals("name", "Arava").lazily()
+                l2 = session.query(object_type=User).where_equals("name", "Phoebe").lazily()
+                l3 = session.query(object_type=User).where_exists("name").count_lazily()
+
+                self.assertNotEqual(0, len(l1.value))
+                self.assertEqual(0, len(l2.value))
+                self.assertEqual(1, l3.value)
@@ -30,7 +30,6 @@ class TestAdvanced(TestBase):
             id_ = s.advanced.get_document_id(user)
             self.assertFalse(id_.endswith("/"))
 
-    @unittest.skip("Query streaming")
     def test_stream_query(self):
         maps = "from user in docs.Users " "select new {" "name = user.name," "age = user.age}"
         index_definition = IndexDefinition()
@@ -44,6 +43,8 @@ class TestAdvanced(TestBase):
                 session.store(User("Idan", i))
             session.save_changes()
 
+        self.wait_for_indexing(self.store)
+
         with self.store.open_session() as session:
             query = session.query(object_type=User, index_name="UserByName")
             results = session.advanced.stream(query)
@@ -0,0 +1,78 @@
+import asyncio
+import importlib.util
+import unittest
+
+from ravendb.tests.test_base import TestBase
+
+
+class User:
+    def __init__(self, name: str = None, age: int = None):
+        self.name = name
+        self.age = age
+
+
+@unittest.skipUnless(importlib.util.find_spec("aiohttp"), "requires the 'async' extra")
+class TestAsyncDocumentSession(TestBase):
+    def setUp(self):
+        super().setUp()
+        with self.store.open_session() as session:
+            for i in range(10):
+                session.store(User(f"user_{i}", i), f"users/{i}")
+            session.save_changes()
+
+    def _run(self, coroutine):
+        async def __run():
+            try:
+                return await coroutine
+            finally:
+                await self.store.get_async_request_executor().close()
+
+        return asyncio.run(__run())
+
+    def test_can_load_and_save_changes(self):
+        async def __test():
+            async with self.store.open_async_session() as session:
+                user = await session.load("users/1", User)
+                self.assertEqual("user_1", user.name)
+                self.assertIsNone(await session.load("users/999", User))
+
+                users = await session.load(["users/2", "users/3"], User)
+                self.assertEqual(["users/2", "users/3"], sorted(users.keys()))
+
+                user.name = "changed"
+                session.store(User("new", 99), "users/100")
+                await session.save_changes()
+                self.assertFalse(session.advanced.has_changes())
+
+            with self.store.open_session() as session:
+                self.assertEqual("changed", session.load("users/1", User).name)
+                self.assertEqual("new", session.load("users/100", User).name)
+
+        self._run(__test())
+
+    def test_can_query_and_stream(self):
+        async def __test():
+            async with self.store.open_async_session() as session:
+                users = await session.query(object_type=User).where_greater_than("age", 6).order_by("age").to_list()
+                self.assertEqual(["user_7", "user_8", "user_9"], [user.name for user in users])
+                self.assertEqual(10, await session.query(object_type=User).count())
+
+                streamed = [result.key async for result in session.stream_starting_with(User, "users/")]
+                self.assertEqual(10, len(streamed))
+
+                ages = [
+                    user.age async for user in session.query(object_type=User).where_greater_than("age", 6).stream()
+                ]
+                self.assertEqual([7, 8, 9], sorted(ages))
+
+        self._run(__test())
+
+    def test_concurrent_sessions_share_the_request_executor(self):
+        async def __load(key: str):
+            async with self.store.open_async_session() as session:
+                return (await session.load(key, User)).name
+
+        async def __test():
+            return await asyncio.gather(*[__load(f"users/{i}") for i in range(10)])
+
+        self.assertEqual([f"user_{i}" for i in range(10)], self._run(__test()))
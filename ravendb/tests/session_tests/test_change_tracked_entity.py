@@ -0,0 +1,46 @@
+from ravendb import ChangeTrackedEntity
+from ravendb.tests.test_base import TestBase
+
+
+class Item(ChangeTrackedEntity):
+    def __init__(self, name: str = None, tags: list = None):
+        self.name = name
+        self.tags = tags
+
+
+class TestChangeTrackedEntity(TestBase):
+    def setUp(self):
+        super().setUp()
+        with self.store.open_session() as session:
+            for i in range(3):
+                session.store(Item(f"item_{i}", ["a"]), f"items/{i}")
+            session.save_changes()
+
+    def test_unmodified_entities_are_not_saved(self):
+        with self.store.open_session() as session:
+            items = session.load([f"items/{i}" for i in range(3)], Item)
+            self.assertFalse(session.advanced.has_changes())
+            self.assertEqual({}, session.advanced.what_changed())
+
+            items["items/1"].name = "changed"
+            self.assertTrue(session.advanced.has_changes())
+            self.assertEqual(["items/1"], list(session.advanced.what_changed().keys()))
+
+            session.save_changes()
+            self.assertFalse(session.advanced.has_changes())
+
+        with self.store.open_session() as session:
+            self.assertEqual("changed", session.load("items/1", Item).name)
+
+    def test_nested_changes_are_saved_after_mark_as_modified(self):
+        with self.store.open_session() as session:
+            item = session.load("items/2", Item)
+            item.tags.append("b")
+            self.assertFalse(session.advanced.has_changes())
+
+            item.mark_as_modified()
+            self.assertTrue(session.advanced.has_changes())
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["a", "b"], session.load("items/2", Item).tags)
@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ravendb import DocumentStore
+from ravendb.tests.test_base import TestBase
+from ravendb.tools.utils import Utils
+
+
+class Product:
+    def __init__(self, name: str = None, tags: list = None, Id: str = None):
+        self.name = name
+        self.tags = tags
+        self.Id = Id
+
+
+class Legacy:
+    def __init__(self, FirstName: str, LastName: str):
+        self.FirstName = FirstName
+        self.LastName = LastName
+
+
+class TestEntityMaterialization(TestBase):
+    def setUp(self):
+        super().setUp()
+
+    def test_materialized_entities_dont_share_state_with_tracked_documents(self):
+        with self.store.open_session() as session:
+            session.store(Product("Chai", ["tea"]), "products/1")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            product = session.load("products/1", Product)
+            self.assertFalse(session.advanced.has_changes())
+
+            product.tags.append("drink")
+            self.assertTrue(session.advanced.has_changes())
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["tea", "drink"], session.load("products/1", Product).tags)
+
+    def test_initialize_object_follows_redefined_init(self):
+        product = Utils.initialize_object({"Name": "Chai", "Tags": ["tea"]}, Product, True)
+        self.assertEqual("Chai", product.name)
+        self.assertEqual(["tea"], product.tags)
+
+        original_init = Product.__init__
+
+        def __init__(self, name: str = None):
+            self.name = name
+
+        try:
+            Product.__init__ = __init__
+            product = Utils.initialize_object({"name": "Chai", "tags": ["tea"]}, Product)
+            self.assertEqual({"name": "Chai"}, product.__dict__)
+        finally:
+            Product.__init__ = original_init
+
+    def test_initialize_object_sets_attributes_when_no_argument_matches(self):
+        legacy = Utils.initialize_object({"first": "John", "last": "Doe"}, Legacy)
+        self.assertEqual("John", legacy.first)
+        self.assertIsNone(legacy.FirstName)
+
+
+class TestParallelEntityMaterialization(TestBase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(2)
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        self.executor.shutdown()
+
+    def _customize_store(self, store: DocumentStore) -> None:
+        store.conventions.materialization_executor = self.executor
+        store.conventions.materialization_chunk_size = 2
+
+    def test_entities_converted_by_the_executor_are_tracked(self):
+        with self.store.open_session() as session:
+            for i in range(5):
+                session.store(Product(f"product {i}", [str(i)]), f"products/{i}")
+            session.save_changes()
+
+        converted = []
+        self.store.add_after_conversion_to_entity(lambda event_args: converted.append(event_args.key))
+
+        with self.store.open_session() as session:
+            products = list(session.query(object_type=Product).wait_for_non_stale_results().order_by("name"))
+            self.assertEqual([f"product {i}" for i in range(5)], [product.name for product in products])
+            self.assertEqual([f"products/{i}" for i in range(5)], converted)
+            self.assertFalse(session.advanced.has_changes())
+
+            loaded = session.load([f"products/{i}" for i in range(5)], Product)
+            self.assertTrue(all(loaded[f"products/{i}"] is products[i] for i in range(5)))
+
+            products[1].tags.append("changed")
+            self.assertTrue(session.advanced.has_changes())
+
+        with self.store.open_session() as session:
+            loaded = session.load([f"products/{i}" for i in range(5)], Product)
+            self.assertEqual(["3"], loaded["products/3"].tags)
+            self.assertFalse(session.advanced.has_changes())
@@ -0,0 +1,66 @@
+import datetime
+import enum
+import json
+
+from ravendb.documents.conventions import DocumentConventions
+from ravendb.tests.test_base import TestBase
+from ravendb.tools.utils import Utils
+
+
+class Color(enum.Enum):
+    RED = "Red"
+
+
+class Priority(enum.IntEnum):
+    HIGH = 1
+
+
+class Duration:
+    def __init__(self, seconds: int = 0):
+        self.seconds = seconds
+
+    def to_json(self):
+        return {"Seconds": self.seconds}
+
+
+class Address:
+    def __init__(self, city: str = None):
+        self.city = city
+
+
+class Order:
+    def __init__(self):
+        self.Id = "orders/1"
+        self.created = datetime.datetime(2020, 1, 2, 3, 4, 5, 6)
+        self.color = Color.RED
+        self.priority = Priority.HIGH
+        self.tags = {"new"}
+        self.point = (1, 2.5)
+        self.lines = [Address("Hadera"), None, {"nested": [Address("Tel Aviv")]}]
+        self.counts = {1: "one", None: "none", True: "yes", 2.5: "float"}
+        self.duration = Duration(30)
+        self.empty = {}
+
+
+class TestEntityToDict(TestBase):
+    def setUp(self):
+        super().setUp()
+
+    def test_entity_to_dict_matches_json_round_trip(self):
+        for default_method in [DocumentConventions.json_default, lambda o: DocumentConventions.json_default(o)]:
+            expected = json.loads(json.dumps(Order(), default=default_method))
+            actual = Utils.entity_to_dict(Order(), default_method)
+            self.assertEqual(expected, actual)
+            self.assertEqual(json.dumps(expected), json.dumps(actual))
+
+    def test_entity_to_dict_copies_containers(self):
+        order = Order()
+        result = Utils.entity_to_dict(order, DocumentConventions.json_default)
+        result["lines"][2]["nested"].clear()
+        self.assertEqual(1, len(order.lines[2]["nested"]))
+
+    def test_entity_to_dict_raises_on_circular_reference(self):
+        address = Address()
+        address.city = address
+        with self.assertRaises(ValueError):
+            Utils.entity_to_dict(address, DocumentConventions.json_default)
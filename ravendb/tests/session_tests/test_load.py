@@ -1,6 +1,12 @@
+from ravendb import DocumentStore
 from ravendb.exceptions.exceptions import InvalidOperationException
+from ravendb.tests.driver.fake_server import FakeCluster
 from ravendb.tests.test_base import TestBase
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import asyncio
+import datetime
+import importlib.util
 import unittest
 
 
@@ -97,6 +103,94 @@ class TestLoad(TestBase):
             for product in products:
                 self.assertIsNotNone(product)
 
+    def test_load_batching_merges_concurrent_loads(self):
+        store = DocumentStore(self.store.urls, self.store.database)
+        store.conventions.load_batching_window = datetime.timedelta(milliseconds=100)
+        store.initialize()
+        try:
+            request_executor = store.get_request_executor()
+            with store.open_session() as session:
+                session.load("products/10", Product)
+            number_of_requests = request_executor.number_of_server_requests
+
+            def load(key: str) -> Product:
+                with store.open_session() as session:
+                    return session.load(key, Product)
+
+            keys = ["products/101", "products/10", "products/0"] * 4
+            with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+                products = list(pool.map(load, keys))
+
+            for key, product in zip(keys, products):
+                if key == "products/0":
+                    self.assertIsNone(product)
+                else:
+                    self.assertEqual(key, product.Id)
+                    self.assertEqual("test", product.name)
+            self.assertLessEqual(request_executor.number_of_server_requests - number_of_requests, 3)
+        finally:
+            store.close()
+
+    @unittest.skipUnless(importlib.util.find_spec("aiohttp"), "requires the 'async' extra")
+    def test_async_load_batching_merges_concurrent_loads(self):
+        keys = ["products/101", "products/10", "products/0"] * 4
+
+        async def load(store: DocumentStore, key: str) -> Product:
+            async with store.open_async_session() as session:
+                return await session.load(key, Product)
+
+        async def load_concurrently(store: DocumentStore, node) -> int:
+            try:
+                await load(store, "products/10")  # fetches the topology
+                node.requests = 0
+
+                products = await asyncio.gather(*(load(store, key) for key in keys))
+                for key, product in zip(keys, products):
+                    if key == "products/0":
+                        self.assertIsNone(product)
+                    else:
+                        self.assertEqual(key, product.Id)
+                        self.assertEqual("test", product.name)
+                requests = node.requests
+
+                # cancelling the load which started a batch doesn't cancel the loads which joined it
+                node.requests = 0
+                cancelled = asyncio.ensure_future(load(store, "products/101"))
+                joined = asyncio.ensure_future(load(store, "products/10"))
+                await asyncio.sleep(0)
+                cancelled.cancel()
+                self.assertEqual("products/10", (await joined).Id)
+                self.assertEqual(1, node.requests)
+
+                if store.conventions.load_batching_window:
+                    # left unsent when the loop ends, the loads on the next loop don't join this batch
+                    asyncio.ensure_future(load(store, "products/101"))
+                    await asyncio.sleep(0)
+                return requests
+            finally:
+                await store.get_async_request_executor().close()
+
+        with FakeCluster(nodes=1) as cluster:
+            for key in ("products/101", "products/10"):
+                cluster.put(key, {"name": "test"}, "Products")
+            node = cluster.node("A")
+
+            # with a zero window the loads gathered together are merged as well
+            for window in (datetime.timedelta(milliseconds=100), datetime.timedelta(0)):
+                store = DocumentStore(cluster.urls, cluster.database)
+                store.conventions.load_batching_window = window
+                store.initialize()
+                try:
+                    # the batcher moves on to the next event loop
+                    for _ in range(2):
+                        requests = asyncio.run(load_concurrently(store, node))
+                        if window:
+                            self.assertEqual(1, requests)
+                        else:
+                            self.assertLess(requests, len(keys))
+                finally:
+                    store.close()
+
     def test_load_track_entity(self):
         with self.store.open_session() as session:
             product = session.load("products/101")
@@ -130,6 +224,25 @@ class TestLoad(TestBase):
         self.assertEqual(1, session.number_of_requests)
         self.assertEqual("some_product", product.name)
 
+    def test_included_document_is_tracked_without_sharing_state_with_its_entity(self):
+        with self.store.open_session() as session:
+            session.store(Order("orders/106", "boxed_order", 93, "boxes/1"))
+            session.store(Box(["first"]), "boxes/1")
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            session.load("orders/106", includes=lambda builder: builder.include_documents("product_id"))
+            box = session.load("boxes/1", Box)
+            self.assertEqual(1, session.number_of_requests)
+            self.assertFalse(session.advanced.has_changes())
+
+            box.items.append("second")
+            self.assertTrue(session.advanced.has_changes())
+            session.save_changes()
+
+        with self.store.open_session() as session:
+            self.assertEqual(["first", "second"], session.load("boxes/1", Box).items)
+
 
 if __name__ == "__main__":
     unittest.main()
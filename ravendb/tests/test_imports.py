@@ -8,6 +8,7 @@ class TestImports(TestBase):
 
     def test_imports_at_top_level(self):
         from ravendb import AggressiveCacheOptions
+        from ravendb import AsyncRequestExecutor
         from ravendb import ClusterRequestExecutor
         from ravendb import ClusterTopology
         from ravendb import CurrentIndexAndNode
@@ -18,10 +19,16 @@ class TestImports(TestBase):
         from ravendb import LoadBalanceBehavior
         from ravendb import RavenCommand
         from ravendb import ReadBalanceBehavior
+        from ravendb import HttpCompressionAlgorithm
+        from ravendb import HttpPoolStatistics
+        from ravendb import LatencyHistogram
+        from ravendb import OpenTelemetryRequestMetrics
+        from ravendb import RequestMetrics
         from ravendb import RequestExecutor
         from ravendb import ServerNode
         from ravendb import Topology
         from ravendb import UpdateTopologyParameters
+        from ravendb import DatabaseTopologyLocalCache
         from ravendb import ConnectionString
         from ravendb import DocumentsCompressionConfiguration
         from ravendb import DeletionInProgressStatus
@@ -179,8 +186,8 @@ class TestImports(TestBase):
         from ravendb import GetDatabaseRecordOperation
 
         # from ravendb import SetupDocumentBase
-        # from ravendb import StreamResultResponse
-        # from ravendb import StreamResult
+        from ravendb import StreamResultResponse
+        from ravendb import StreamResult
         from ravendb import BatchOperation
 
         # from ravendb import GetRevisionOperation
@@ -204,12 +211,14 @@ class TestImports(TestBase):
 
         # from ravendb import LazyRevisionOperation
         # from ravendb import LazyRevisionOperations
+        from ravendb import AsyncLoadBatcher
+        from ravendb import LoadBatcher
         from ravendb import LoadOperation
         from ravendb import LoadStartingWithOperation
         from ravendb import MultiGetOperation
         from ravendb import QueryOperation
 
-        # from ravendb import StreamOperation
+        from ravendb import StreamOperation
         from ravendb import DeleteAttachmentOperation
         from ravendb import PutAttachmentOperation
         from ravendb import PatchResult
@@ -371,8 +380,11 @@ class TestImports(TestBase):
         # from ravendb import SubscriptionOpeningStrategy
         # from ravendb import SubscriptionUpdateOptions
         from ravendb import AbstractDocumentQuery
+        from ravendb import AsyncDocumentQuery
+        from ravendb import AsyncDocumentSession
         from ravendb import CmpXchg
         from ravendb import DocumentInfo
+        from ravendb import ChangeTrackedEntity
         from ravendb import DocumentQuery
         from ravendb import DocumentQueryHelper
 
@@ -401,8 +413,9 @@ class TestImports(TestBase):
         # from ravendb import QueryOptions
         from ravendb import QueryStatistics
 
-        # from ravendb import StreamQueryStatistics
+        from ravendb import StreamQueryStatistics
         from ravendb import RawDocumentQuery
+        from ravendb import PreparedQuery
 
         # from ravendb import SessionEvents
         from ravendb import WhereParams
@@ -560,6 +573,7 @@ class TestImports(TestBase):
         # from ravendb import HighlightingParameters
         # from ravendb import Hightlightings
         from ravendb import QueryTimings
+        from ravendb import QueryShapeCache
         from ravendb import AggregationDocumentQuery
         from ravendb import AggregationQueryBase
         from ravendb import GenericRangeFacet
@@ -2,7 +2,20 @@ from __future__ import annotations
 
 import enum
 import time
-from typing import Optional, Dict, Generic, Tuple, TypeVar, Collection, List, Union, Type, TYPE_CHECKING
+from typing import (
+    Optional,
+    Dict,
+    Generic,
+    Tuple,
+    TypeVar,
+    Collection,
+    List,
+    Union,
+    Type,
+    Callable,
+    Any,
+    TYPE_CHECKING,
+)
 
 from ravendb.primitives import constants
 from ravendb.exceptions import exceptions
@@ -17,8 +30,9 @@ except ImportError:
 from ravendb.tools.projection import create_entity_with_mapper
 from datetime import datetime, timedelta
 from enum import Enum
-from threading import Timer
+from threading import Lock, Timer
 from copy import deepcopy
+from functools import lru_cache
 import urllib
 import inspect
 import json
@@ -330,6 +344,198 @@ class QueryFieldUtil:
         return "".join(sb)
 
 
+_JSON_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class _ConversionPlan(Enum):
+    STR = "Str"
+    INT = "Int"
+    FLOAT = "Float"
+    DICT = "Dict"
+    LIST = "List"
+    OBJECT_DICT = "ObjectDict"
+    DEFAULT = "Default"
+
+
+# how json would encode instances of given (non builtin) class, cached per class
+_conversion_plans: Dict[type, _ConversionPlan] = {}
+_conventions_json_default: Optional[Callable[[Any], Any]] = None
+
+
+def _get_conversion_plan(o_type: type) -> _ConversionPlan:
+    plan = _conversion_plans.get(o_type, None)
+    if plan is not None:
+        return plan
+
+    # subclasses of the builtins are written by json as the builtin values, without calling default
+    if issubclass(o_type, str):
+        plan = _ConversionPlan.STR
+    elif issubclass(o_type, int):
+        plan = _ConversionPlan.INT
+    elif issubclass(o_type, float):
+        plan = _ConversionPlan.FLOAT
+    elif issubclass(o_type, dict):
+        plan = _ConversionPlan.DICT
+    elif issubclass(o_type, (list, tuple)):
+        plan = _ConversionPlan.LIST
+    elif not issubclass(o_type, (datetime, timedelta, Enum, MetadataAsDictionary)) and not callable(
+        getattr(o_type, "to_json", None)
+    ):
+        # DocumentConventions.json_default would return __dict__ of such object
+        plan = _ConversionPlan.OBJECT_DICT
+    else:
+        plan = _ConversionPlan.DEFAULT
+
+    _conversion_plans[o_type] = plan
+    return plan
+
+
+def _json_key(key: Any) -> str:
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (float("inf"), float("-inf")):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _create_entity_to_dict_converter(default_method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function building the same structure as json.loads(json.dumps(o, default=default_method)),
+    walking the object graph once instead of going through an intermediate string.
+    """
+    global _conventions_json_default
+    if _conventions_json_default is None:
+        from ravendb.documents.conventions import DocumentConventions
+
+        _conventions_json_default = DocumentConventions.json_default
+
+    use_class_plans = default_method is _conventions_json_default
+    leaf_types = _JSON_LEAF_TYPES
+
+    def convert(o: Any) -> Any:
+        o_type = type(o)
+        if o_type in leaf_types:
+            return o
+        if o_type is dict:
+            return convert_dict(o)
+        if o_type is list or o_type is tuple:
+            return [item if type(item) in leaf_types else convert(item) for item in o]
+
+        plan = _get_conversion_plan(o_type)
+        if plan is _ConversionPlan.OBJECT_DICT:
+            o_dict = getattr(o, "__dict__", None)
+            if use_class_plans and o_dict:
+                return convert_dict(o_dict)
+        elif plan is _ConversionPlan.STR:
+            return str.__str__(o)
+        elif plan is _ConversionPlan.INT:
+            return int.__int__(o)
+        elif plan is _ConversionPlan.FLOAT:
+            return float.__float__(o)
+        elif plan is _ConversionPlan.DICT:
+            return convert_dict(o)
+        elif plan is _ConversionPlan.LIST:
+            return [item if type(item) in leaf_types else convert(item) for item in o]
+
+        return convert(default_method(o))
+
+    def convert_dict(o: dict) -> dict:
+        result = {}
+        for key, value in o.items():
+            if type(key) is not str:
+                key = _json_key(key)
+            result[key] = value if type(value) in leaf_types else convert(value)
+        return result
+
+    return convert
+
+
+class _ConstructorSignature:
+    """
+    Arguments of an __init__ method resolved once, so materializing an entity doesn't need inspect on every document.
+    """
+
+    # keyed by the __init__ function itself - redefining or patching __init__ yields a new entry,
+    # the oldest entries are evicted past MAX_SIZE (e.g. classes created on the fly)
+    MAX_SIZE = 4096
+    _signatures: Dict[Callable, _ConstructorSignature] = {}
+    _lock = Lock()
+
+    def __init__(self, entity_init: Callable):
+        args, _, keywords, defaults, _, _, _ = inspect.getfullargspec(entity_init)
+        remainder = len(args) - (len(defaults) if defaults else 0)
+
+        self.args = args
+        self.args_set = frozenset(args)
+        self.number_of_arguments = len(args) - 1
+        self.accepts_keywords = bool(keywords)
+        self.required_arguments = args[1:remainder]
+        self.optional_arguments = list(zip(args[remainder:], defaults or ()))
+
+    @classmethod
+    def of(cls, entity_init: Callable) -> _ConstructorSignature:
+        signature = cls._signatures.get(entity_init, None)
+        if signature is None:
+            signature = cls(entity_init)
+            with cls._lock:
+                while len(cls._signatures) >= cls.MAX_SIZE:
+                    cls._signatures.pop(next(iter(cls._signatures)))
+                cls._signatures[entity_init] = signature
+        return signature
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._signatures.clear()
+
+    def make_initialize_dict(self, document: dict) -> Tuple[dict, bool]:
+        if self.number_of_arguments > len(document):
+            entity_initialize_dict = {name: document.get(name, None) for name in self.required_arguments}
+            for name, default in self.optional_arguments:
+                entity_initialize_dict[name] = document.get(name, default)
+            return entity_initialize_dict, False
+
+        if self.accepts_keywords:
+            entity_initialize_dict = document
+        else:
+            args_set = self.args_set
+            entity_initialize_dict = {key: value for key, value in document.items() if key in args_set}
+
+        if not entity_initialize_dict and self.number_of_arguments > 0:
+            return dict.fromkeys(self.args[1:]), True
+
+        return entity_initialize_dict, False
+
+
+@lru_cache(maxsize=8192)
+def _convert_to_snake_case(name: str) -> str:
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+
+def _copy_json(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is dict:
+        return {key: item if type(item) in _JSON_LEAF_TYPES else _copy_json(item) for key, item in value.items()}
+    if value_type is list:
+        return [item if type(item) in _JSON_LEAF_TYPES else _copy_json(item) for item in value]
+    if value_type in _JSON_LEAF_TYPES:
+        return value
+    return deepcopy(value)
+
+
 class Utils(object):
     primitives = (int, float, bool, str, bytes, bytearray)
     mutable_collections = (list, set)
@@ -375,8 +581,7 @@ class Utils(object):
 
     @staticmethod
     def convert_to_snake_case(name):
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+        return _convert_to_snake_case(name)
 
     @staticmethod
     def database_name_validation(name):
@@ -550,7 +755,7 @@ class Utils(object):
         if document is None:
             return None
         metadata = document.get("@metadata")
-        original_document = deepcopy(document)
+        original_document = Utils.copy_json(document)
         type_from_metadata = conventions.try_get_type_from_metadata(metadata)
         mapper = conventions.mappers.get(object_type, None)
 
@@ -609,11 +814,9 @@ class Utils(object):
             convert_to_snake_case = {} if convert_to_snake_case is True else convert_to_snake_case
             try:
                 converted_document = {}
-                for key in document:
+                for key, value in document.items():
                     converted_key = convert_to_snake_case.get(key, key)
-                    converted_document[converted_key if key == "Id" else Utils.convert_to_snake_case(converted_key)] = (
-                        document[key]
-                    )
+                    converted_document[converted_key if key == "Id" else _convert_to_snake_case(converted_key)] = value
                 document = converted_document
             except:
                 pass
@@ -621,29 +824,7 @@ class Utils(object):
         if entity_init is None:
             return document
 
-        set_needed = False
-        entity_initialize_dict = {}
-        args, __, keywords, defaults, _, _, _ = inspect.getfullargspec(entity_init)
-        if (len(args) - 1) > len(document):
-            remainder = len(args)
-            if defaults:
-                remainder -= len(defaults)
-            for i in range(1, remainder):
-                entity_initialize_dict[args[i]] = document.get(args[i], None)
-            for i in range(remainder, len(args)):
-                entity_initialize_dict[args[i]] = document.get(args[i], defaults[i - remainder])
-        else:
-            if keywords:
-                entity_initialize_dict = document
-            else:
-                for key in document:
-                    if key in args:
-                        entity_initialize_dict[key] = document[key]
-            if not entity_initialize_dict and len(args) - 1 > 0:
-                set_needed = True
-                for key in args[1:]:
-                    entity_initialize_dict[key] = None
-        return entity_initialize_dict, set_needed
+        return _ConstructorSignature.of(entity_init).make_initialize_dict(document)
 
     @staticmethod
     def dict_to_bytes(the_dict):
@@ -940,9 +1121,20 @@ class Utils(object):
         dictionarized.update(to_update)
         return dictionarized
 
+    @staticmethod
+    def copy_json(value: Any) -> Any:
+        """
+        Deep copy of a parsed JSON structure. Only dicts and lists are walked, which is a lot cheaper than deepcopy.
+        """
+        return _copy_json(value)
+
     @staticmethod
     def entity_to_dict(entity, default_method) -> dict:
-        return json.loads(json.dumps(entity, default=default_method))
+        try:
+            return _create_entity_to_dict_converter(default_method)(entity)
+        except RecursionError:
+            # json.dumps checks for cycles explicitly, here the interpreter does it for us
+            raise ValueError("Circular reference detected")
 
     @staticmethod
     def add_hours(date: datetime, hours: int):
@@ -25,5 +25,9 @@ setup(
         "websocket-client >= 0.46.0",
         "inflect >= 5.4.0",
     ],
+    extras_require={
+        "async": ["aiohttp >= 3.8"],
+        "opentelemetry": ["opentelemetry-api >= 1.12"],
+    },
     zip_safe=False,
 )